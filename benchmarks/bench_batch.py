@@ -0,0 +1,65 @@
+"""
+four_pillars_batch 처리량 벤치마크.
+
+    python benchmarks/bench_batch.py                 # 1M, 10M, 100M 행
+    python benchmarks/bench_batch.py 1000000 --basis solar_term
+
+입력은 CHUNK 행씩 만들어 같은 출력 버퍼에 채우므로 100M 행도 메모리 사용량이 일정합니다.
+(입력 난수 생성 시간은 측정에서 뺍니다.)
+"""
+
+import argparse
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from saju_engine import manse_table  # noqa: E402
+from saju_engine.batch import PILLARS_DTYPE, four_pillars_batch  # noqa: E402
+
+CHUNK = 10_000_000
+
+
+def run(rows: int, basis: str, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    out = np.empty(min(rows, CHUNK), dtype=PILLARS_DTYPE)
+    lo = manse_table.BASE_ORDINAL + 366
+    hi = manse_table.BASE_ORDINAL + manse_table.DAY_COUNT - 366
+
+    elapsed = 0.0
+    done = 0
+    while done < rows:
+        n = min(CHUNK, rows - done)
+        ordinals = rng.integers(lo, hi, n)
+        hours = rng.integers(-1, 24, n, dtype=np.int8)
+
+        start = time.perf_counter()
+        four_pillars_batch(ordinals, hours, basis=basis, out=out[:n])
+        elapsed += time.perf_counter() - start
+        done += n
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("rows", nargs="*", type=int, default=[1_000_000, 10_000_000, 100_000_000])
+    parser.add_argument("--basis", default="manse", choices=["manse", "solar_term"])
+    args = parser.parse_args()
+
+    manse_table.load_table()  # 테이블 로드 시간은 제외
+    four_pillars_batch(np.array([manse_table.BASE_ORDINAL]), basis=args.basis)
+
+    print(f"{'rows':>12} {'seconds':>9} {'rows/s':>14} {'peak RSS':>10}")
+    for rows in args.rows:
+        elapsed = run(rows, args.basis)
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{rows:>12,} {elapsed:>9.2f} {rows / elapsed:>14,.0f} {peak_mb:>8.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
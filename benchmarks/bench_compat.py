@@ -0,0 +1,56 @@
+"""
+궁합 엔진 벤치마크 – 점수 행렬 블록 처리량과 top-k 시간.
+
+    python benchmarks/bench_compat.py                   # 5,000명 × 50,000명, 상위 10명
+    python benchmarks/bench_compat.py -n 10000 -m 100000 -k 20 --tile 2048
+
+두 풀은 1940~2010년 임의 생일·시로 만들고 batch.four_pillars_batch 로 계산합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from saju_engine.batch import four_pillars_batch  # noqa: E402
+from saju_engine.compat import TILE, ChartVectors, score_tiles, top_k  # noqa: E402
+
+
+def make_pool(count: int, rng) -> ChartVectors:
+    days = np.datetime64("1940-01-01") + rng.integers(0, 25_500, count).astype("timedelta64[D]")
+    hours = rng.integers(-1, 24, count)
+    return ChartVectors.from_batch(four_pillars_batch(days, hours))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=5_000, help="왼쪽 풀 크기")
+    parser.add_argument("-m", type=int, default=50_000, help="오른쪽 풀 크기")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--tile", type=int, default=TILE)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    a, b = make_pool(args.n, rng), make_pool(args.m, rng)
+    pairs = args.n * args.m
+
+    start = time.perf_counter()
+    for _i0, _j0, block in score_tiles(a, b, args.tile):
+        block.max()
+    tiles = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top_k(a, b, args.k, args.tile)
+    topk = time.perf_counter() - start
+
+    print(f"{args.n:,} × {args.m:,} = {pairs:,}쌍, 블록 {args.tile}")
+    print(f"  score_tiles {tiles:.2f}s ({pairs / tiles / 1e6:,.0f}M 쌍/s)")
+    print(f"  top_k(k={args.k}) {topk:.2f}s ({pairs / topk / 1e6:,.0f}M 쌍/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+리포트 PNG 렌더러(pillow / matplotlib) 지연 시간·최대 메모리 벤치마크.
+
+    python benchmarks/bench_export.py              # 두 렌더러 각각 20회
+    python benchmarks/bench_export.py -n 50 --backend pillow
+
+렌더러마다 새 프로세스에서 돌려 peak RSS 가 서로 섞이지 않게 합니다.
+첫 호출(모듈 import·폰트 탐색 포함)은 따로 보여 주고, 나머지 호출의 중앙값/p95 를 잽니다.
+리포트 텍스트는 사주 리포트 앱의 build_report_text 로 만듭니다.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from saju_engine import export  # noqa: E402
+from saju_engine.report_variant import build_report, build_report_text  # noqa: E402
+
+
+def sample_text(solar_date: date, hour: int) -> str:
+    """앱의 PNG 다운로드와 같은 build_report_text 로 만든 리포트 텍스트."""
+    return build_report_text(build_report(solar_date, hour), solar_date, hour, "여성")
+
+
+def run_one(backend: str, repeat: int):
+    text = sample_text(date(1990, 5, 17), 14)
+
+    start = time.perf_counter()
+    png = export.render_png(text, backend)
+    first = time.perf_counter() - start
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        export.render_png(text, backend)
+        times.append(time.perf_counter() - start)
+    times.sort()
+
+    median = times[len(times) // 2]
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{backend:>11} {first * 1000:>9.1f} {median * 1000:>9.1f} {p95 * 1000:>9.1f} "
+          f"{len(png) / 1024:>8.0f}KB {peak_mb:>8.0f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    parser.add_argument("--backend", choices=export.BACKENDS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_one(args.backend, args.repeat)
+        return
+
+    print(f"{'backend':>11} {'first ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'png':>10} {'peak RSS':>10}")
+    sys.stdout.flush()
+    for backend in ([args.backend] if args.backend else export.BACKENDS):
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child",
+             "--backend", backend, "--repeat", str(args.repeat)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+사주 JSON 서비스 부하 테스트 (p50/p99 지연, 초당 요청 수).
+
+    python benchmarks/bench_service.py                       # 서비스를 띄우고 측정
+    python benchmarks/bench_service.py --url http://127.0.0.1:8600 -c 64 -n 20000
+    python benchmarks/bench_service.py --bulk 100            # /v1/charts 에 100건씩
+
+동시 연결 -c 개가 keep-alive 로 요청을 나눠 보냅니다. 생일은 실제 트래픽처럼
+인기 날짜 --hot 개에 --hot-share 비율이 몰리도록 뽑습니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_DAY = date(1940, 1, 1)
+DAY_SPAN = (date(2010, 12, 31) - FIRST_DAY).days
+
+
+def make_items(count: int, hot: int, hot_share: float, seed: int = 0):
+    rng = random.Random(seed)
+    hot_days = [rng.randrange(DAY_SPAN) for _ in range(hot)]
+    items = []
+    for _ in range(count):
+        offset = rng.choice(hot_days) if rng.random() < hot_share else rng.randrange(DAY_SPAN)
+        items.append({
+            "date": (FIRST_DAY + timedelta(days=offset)).isoformat(),
+            "hour": rng.choice([None] + list(range(24))),
+            "variant": rng.choice(["report", "manse"]),
+        })
+    return items
+
+
+async def _request(reader, writer, host, path, payload):
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host, port, path, payloads, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for payload in payloads:
+            start = time.perf_counter()
+            status = await _request(reader, writer, host, path, payload)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(url: str, concurrency: int, requests: int, bulk: int, hot: int, hot_share: float):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+
+    if bulk:
+        items = make_items(requests * bulk, hot, hot_share)
+        payloads = [{"items": items[i:i + bulk]} for i in range(0, len(items), bulk)]
+        path = "/v1/charts"
+    else:
+        payloads = make_items(requests, hot, hot_share)
+        path = "/v1/chart"
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, path, payloads[i::concurrency], latencies, errors)
+        for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"{path} 요청 {len(latencies):,}건 (건당 {bulk or 1}개), 동시 {concurrency}")
+    print(f"  p50 {p50:.2f}ms  p99 {p99:.2f}ms  {len(latencies) / elapsed:,.0f} req/s"
+          + (f"  ({len(latencies) * bulk / elapsed:,.0f} charts/s)" if bulk else "")
+          + f"  오류 {len(errors)}건")
+
+
+def _wait_ready(host, port, timeout=30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            asyncio.run(asyncio.wait_for(asyncio.open_connection(host, port), 1))
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("서비스가 시작되지 않았습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="이미 떠 있는 서비스 주소 (없으면 직접 띄움)")
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    parser.add_argument("-n", "--requests", type=int, default=10_000)
+    parser.add_argument("--bulk", type=int, default=0, help="/v1/charts 요청당 항목 수")
+    parser.add_argument("--hot", type=int, default=2000, help="인기 생일 수")
+    parser.add_argument("--hot-share", type=float, default=0.8)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    proc = None
+    url = args.url
+    if url is None:
+        port = 8699
+        url = f"http://127.0.0.1:{port}"
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "saju_engine.service", "--port", str(port),
+             "--window-ms", str(args.window_ms)],
+            cwd=ROOT, stdout=subprocess.DEVNULL,
+        )
+        _wait_ready("127.0.0.1", port)
+
+    try:
+        asyncio.run(run(url, args.concurrency, args.requests, args.bulk, args.hot, args.hot_share))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+사주 계산 엔진.
+
+Streamlit 앱 스크립트들이 공통으로 쓰는 만세력·간지 계산과 해석 로직을 모아 둔 패키지입니다.
+Streamlit 에 의존하지 않으므로 배치·API·벤치마크에서도 그대로 import 할 수 있습니다.
+
+- manse_table, day_pillar, solar_terms, hours, pillars : 간지 계산
+- lunar                                                 : 음력 ↔ 양력 변환 배열 (윤달 포함, O(1) 조회)
+- fortune_year                                          : 연도별 세운 관계 엔진 (상생·상극 행렬)
+- daewoon                                               : 대운 (절기 거리 기준 대운수·기둥)
+- daily                                                 : 일진 관계 코드표와 사용자 일괄 계산 작업
+- monthly                                               : 월운 타임라인 (절기 기준 월주, 지연 렌더링)
+- compat                                                : N×M 궁합 점수 행렬·블록·top-k
+- signature_index                                       : 간지·오행 조건 → 날짜 역색인 (mmap, 교집합 조회)
+- manse_db                                              : 만세력 SQLite 내보내기와 범위 질의 (BI 도구용)
+- fortune_2026, report_variant, manse_variant          : 앱별 해석 문구 → SajuReport
+- report, cache, export, fonts                          : 결과 객체, 공용 캐시, PNG 내보내기
+- batch, service, batch_cli                             : 배열 일괄 계산, JSON 서비스, CSV/Parquet CLI
+"""
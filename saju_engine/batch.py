@@ -0,0 +1,177 @@
+"""
+대량 사주 계산용 NumPy 배치 API.
+
+생년월일 배열(datetime64 또는 ordinal)과 태어난 시 배열(0~23, 모르면 -1)을 받아
+연·월·일·시 천간/지지 인덱스와 오행 개수(count_elements 와 같은 방식, 글자당 1개)를
+구조화 배열 하나로 돌려줍니다. 행마다 파이썬 객체를 만들지 않고,
+내부적으로는 CHUNK_ROWS 단위로 잘라 임시 배열 크기를 일정하게 유지합니다.
+
+    from saju_engine.batch import four_pillars_batch
+    result = four_pillars_batch(np.array(["1990-05-17"], dtype="datetime64[D]"), np.array([14]))
+    result["d_stem"], result["fire"]
+
+천간 0~9 = 갑~계, 지지 0~11 = 자~해, 계산할 수 없는 값은 -1 입니다.
+"""
+
+import numpy as np
+
+from saju_engine import manse_table, pillars, solar_terms
+from saju_engine.day_pillar import DAY_GAPJA_OFFSET, to_ordinals
+from saju_engine.hours import HOUR_STEM_ARRAY, hour_pillar_batch
+
+# 오행 순서는 앱의 counts 딕셔너리와 같음: 목, 화, 토, 금, 수
+ELEMENTS = pillars.ELEMENTS
+ELEMENT_FIELDS = ("wood", "fire", "earth", "metal", "water")
+
+PILLAR_FIELDS = ("y_stem", "y_branch", "m_stem", "m_branch",
+                 "d_stem", "d_branch", "h_stem", "h_branch")
+
+PILLARS_DTYPE = np.dtype(
+    [(name, np.int8) for name in PILLAR_FIELDS]
+    + [(name, np.uint8) for name in ELEMENT_FIELDS]
+)
+
+STEM_ELEMENT = np.array(pillars.STEM_ELEMENT, dtype=np.int8)
+BRANCH_ELEMENT = np.array(pillars.BRANCH_ELEMENT, dtype=np.int8)
+
+# 60갑자 인덱스 그대로 (Pillars 를 만들 때 사용). 범위 밖·모르는 시는 -1
+GAPJA_DTYPE = np.dtype([("year", np.int8), ("month", np.int8), ("day", np.int8),
+                        ("hour", np.int8), ("leap", np.bool_)])
+
+CHUNK_ROWS = 1 << 20
+
+_GAP_START = manse_table.GREGORIAN_GAP[0] - manse_table.BASE_ORDINAL
+_GAP_END = manse_table.GREGORIAN_GAP[1] - manse_table.BASE_ORDINAL
+
+
+def _table_array() -> np.ndarray:
+    """만세력 테이블(mmap)을 복사 없이 (일수, RECORD_SIZE) uint8 배열로 본다."""
+    table = np.frombuffer(manse_table.load_table(), dtype=np.uint8)
+    return table.reshape(-1, manse_table.RECORD_SIZE)
+
+
+def _fill_chunk(ordinals, hour_values, out, table, basis):
+    n = len(ordinals)
+    offsets = ordinals - manse_table.BASE_ORDINAL
+    valid = (offsets >= 0) & (offsets < manse_table.DAY_COUNT)
+    valid &= (offsets < _GAP_START) | (offsets > _GAP_END)
+    safe = np.where(valid, offsets, 0)
+
+    # 연·월: 만세력 테이블(라이브러리 기준) 또는 절기 인덱스
+    if basis == "solar_term":
+        minute_keys = ordinals * solar_terms.MINUTES_PER_DAY
+        if hour_values is not None:
+            minute_keys += np.where(hour_values >= 0, hour_values, 0).astype(np.int64) * 60
+        year_idx = solar_terms.year_pillar_batch(minute_keys).astype(np.int16)
+        month_idx = solar_terms.month_pillar_batch(minute_keys).astype(np.int16)
+        valid &= (year_idx >= 0) & (month_idx >= 0)
+    else:
+        year_idx = table[safe, 0].astype(np.int16)
+        month_idx = table[safe, 1].astype(np.int16)
+
+    # 일: modulo-60 닫힌식
+    day_idx = ((ordinals + DAY_GAPJA_OFFSET) % 60).astype(np.int16)
+
+    stems = np.empty((4, n), dtype=np.int8)
+    branches = np.empty((4, n), dtype=np.int8)
+    for row, idx in enumerate((year_idx, month_idx, day_idx)):
+        stems[row] = idx % 10
+        branches[row] = idx % 12
+
+    stems[:, ~valid] = -1
+    branches[:, ~valid] = -1
+
+    # 시: 공용 시지·시간 테이블
+    if hour_values is None:
+        stems[3] = -1
+        branches[3] = -1
+    else:
+        stems[3], branches[3] = hour_pillar_batch(stems[2], hour_values)
+
+    for row, prefix in enumerate(("y", "m", "d", "h")):
+        out[prefix + "_stem"] = stems[row]
+        out[prefix + "_branch"] = branches[row]
+
+    # 오행 개수 (천간·지지 글자당 1개)
+    stem_el = STEM_ELEMENT[stems]
+    branch_el = BRANCH_ELEMENT[branches]
+    stem_el[stems < 0] = -1
+    branch_el[branches < 0] = -1
+    for element, field in enumerate(ELEMENT_FIELDS):
+        out[field] = (stem_el == element).sum(axis=0, dtype=np.uint8) + \
+                     (branch_el == element).sum(axis=0, dtype=np.uint8)
+
+
+def four_pillars_batch(dates, hours=None, basis: str = "manse", out=None) -> np.ndarray:
+    """
+    생년월일 배열 → PILLARS_DTYPE 구조화 배열.
+
+    dates: datetime64 배열 또는 date ordinal 정수 배열
+    hours: 0~23 정수 배열 (모르면 -1) 또는 None(전부 모름)
+    basis: "manse" = 만세력 테이블(앱과 같은 결과), "solar_term" = 입춘·절기 기준 연·월주
+    out:   결과를 채울 PILLARS_DTYPE 배열 (재사용해 할당을 줄일 때)
+    """
+    if basis not in ("manse", "solar_term"):
+        raise ValueError("basis 는 'manse' 또는 'solar_term' 이어야 합니다.")
+
+    ordinals = to_ordinals(dates)
+    n = len(ordinals)
+    if hours is not None:
+        hours = np.asarray(hours)
+        if len(hours) != n:
+            raise ValueError("dates 와 hours 의 길이가 다릅니다.")
+    if out is None:
+        out = np.empty(n, dtype=PILLARS_DTYPE)
+    elif out.dtype != PILLARS_DTYPE or len(out) < n:
+        raise ValueError("out 배열의 dtype 또는 길이가 맞지 않습니다.")
+
+    table = _table_array()
+    for start in range(0, n, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, n)
+        _fill_chunk(
+            ordinals[start:stop],
+            None if hours is None else hours[start:stop],
+            out[start:stop],
+            table,
+            basis,
+        )
+    return out[:n]
+
+
+def element_counts(result) -> np.ndarray:
+    """배치 결과 → (행 수, 5) uint8 오행 개수 행렬 (목·화·토·금·수 순)."""
+    return np.stack([result[field] for field in ELEMENT_FIELDS], axis=1)
+
+
+def gapja_batch(dates, hour_branches=None) -> np.ndarray:
+    """
+    생년월일 배열 + 시지 인덱스 배열(모르면 -1) → GAPJA_DTYPE 구조화 배열.
+    만세력 테이블 기준(앱과 같은 결과)이며 윤달 플래그도 함께 돌려준다.
+    """
+    ordinals = to_ordinals(dates)
+    n = len(ordinals)
+    out = np.empty(n, dtype=GAPJA_DTYPE)
+
+    offsets = ordinals - manse_table.BASE_ORDINAL
+    valid = (offsets >= 0) & (offsets < manse_table.DAY_COUNT)
+    valid &= (offsets < _GAP_START) | (offsets > _GAP_END)
+    rows = _table_array()[np.where(valid, offsets, 0)]
+
+    day_idx = (ordinals + DAY_GAPJA_OFFSET) % 60
+    out["year"] = np.where(valid, rows[:, 0], -1)
+    out["month"] = np.where(valid, rows[:, 1], -1)
+    out["day"] = np.where(valid, day_idx, -1)
+    out["leap"] = valid & (rows[:, 3] & manse_table.FLAG_INTERCALATION).astype(bool)
+
+    if hour_branches is None:
+        out["hour"] = -1
+    else:
+        branches = np.asarray(hour_branches).astype(np.int64)
+        if len(branches) != n:
+            raise ValueError("dates 와 hour_branches 의 길이가 다릅니다.")
+        known = valid & (branches >= 0) & (branches < 12)
+        safe_branch = np.where(known, branches, 0)
+        stems = HOUR_STEM_ARRAY[day_idx % 10, safe_branch].astype(np.int64)
+        # 60갑자 인덱스 = (6·천간 − 5·지지) mod 60
+        out["hour"] = np.where(known, (6 * stems - 5 * safe_branch) % 60, -1)
+    return out
@@ -0,0 +1,306 @@
+"""
+CSV/Parquet 대량 사주 계산 CLI.
+
+입력 파일을 CHUNK 행씩 읽어 배열 엔진(batch.gapja_batch)으로 계산하고, 결과를 조각마다
+바로 출력 파일에 덧붙입니다. 파일 크기와 상관없이 메모리 사용량이 일정합니다.
+
+    python -m saju_engine.batch_cli users.csv charts.csv
+    python -m saju_engine.batch_cli users.csv charts.parquet --workers 4 --rejects bad.csv
+    python -m saju_engine.batch_cli users.parquet out.csv --date-col dob --hour-col tob --variant report
+    python -m saju_engine.batch_cli users.csv charts.csv --calendar lunar --leap-col is_leap
+
+입력 열: 생년월일(--date-col, 기본 birth_date, YYYY-MM-DD 문자열 또는 Parquet date/timestamp), 태어난 시(--hour-col, 기본
+birth_hour, 0~23, 비어 있거나 '모름'이면 시 없음). 다른 열은 그대로 출력에 붙습니다.
+--calendar lunar 이면 생년월일을 음력으로 읽고(윤달은 --leap-col 열 또는 '2017-05-01 윤' 처럼
+날짜에 '윤' 표시) lunar 모듈의 변환 배열로 양력으로 바꾼 뒤 계산하며, solar_date 열을 붙입니다.
+
+추가되는 열:
+- year/month/day/hour_ganji : 간지 (시 모름이면 빈 값)
+- wood/fire/earth/metal/water : 오행 점수 (--variant manse = 천간 2점·지지 1점, report = 글자당 1개)
+- dominant/weak             : 가장 강한/약한 오행 (get_element_distribution 과 같은 규칙)
+- day_element, reading_key  : 2026년 해석 조회 키 (manse = 일간 오행, report = fortune_2026 상태 키)
+
+날짜·시를 읽을 수 없거나 만세력 범위 밖인 행은 --rejects 파일에 reason 열과 함께 기록합니다.
+Parquet 입출력에는 pyarrow 가 필요합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from saju_engine import lunar
+from saju_engine.batch import BRANCH_ELEMENT, ELEMENT_FIELDS, STEM_ELEMENT, gapja_batch
+from saju_engine.hours import HOUR_BRANCH_ARRAY
+from saju_engine.manse_table import GAPJA_NAMES
+from saju_engine.pillars import ELEMENTS
+from saju_engine.report import VARIANT_MANSE, VARIANT_REPORT, VARIANTS
+
+CHUNK = 100_000
+
+CALENDAR_SOLAR = "solar"
+CALENDAR_LUNAR = "lunar"
+CALENDARS = (CALENDAR_SOLAR, CALENDAR_LUNAR)
+
+# 앱별 (천간, 지지) 가중치
+ELEMENT_WEIGHTS = {VARIANT_REPORT: (1, 1), VARIANT_MANSE: (2, 1)}
+
+_GANJI = np.array(list(GAPJA_NAMES) + [""], dtype=object)  # -1 → ""
+_ELEMENT_NAMES = np.array(ELEMENTS, dtype=object)
+_UNKNOWN_HOURS = {"", "모름", "nan", "none", "null"}
+
+
+# ---------------------------------------------------------
+# 조각 단위 계산 (작업 프로세스에서도 실행)
+# ---------------------------------------------------------
+def _parse_hours(values: pd.Series):
+    """시 열 → (시지 인덱스 int64 배열(모름 -1), 잘못된 값 마스크)."""
+    text = values.astype("string").str.strip().fillna("")
+    unknown = text.str.lower().isin(_UNKNOWN_HOURS).to_numpy()
+    numbers = pd.to_numeric(text.where(~unknown), errors="coerce").to_numpy(dtype=float)
+    bad = ~unknown & ~((numbers >= 0) & (numbers < 24) & (numbers == np.floor(numbers)))
+    hours = np.where(unknown | bad, 0, numbers).astype(np.int64)
+    branches = np.where(unknown | bad, -1, HOUR_BRANCH_ARRAY[hours])
+    return branches.astype(np.int64), bad
+
+
+def to_datetimes(values: pd.Series) -> pd.Series:
+    """
+    양력 날짜 열 → datetime64 Series (읽을 수 없으면 NaT). 문자열은 YYYY-MM-DD 만 받고,
+    Parquet date32/timestamp 열(pandas 에서 date 객체·datetime64)은 문자열로 바꾸지 않고 그대로 쓴다.
+    시간대가 있으면 그 지역의 날짜를 쓴다.
+    """
+    if pd.api.types.infer_dtype(values, skipna=True) in ("datetime64", "datetime", "date"):
+        dates = pd.to_datetime(values, errors="coerce")
+        if getattr(dates.dt, "tz", None) is not None:
+            dates = dates.dt.tz_localize(None)
+        return dates
+    return pd.to_datetime(values.astype("string").str.strip(), format="%Y-%m-%d", errors="coerce")
+
+
+def _parse_dates(frame: pd.DataFrame, date_col: str, calendar: str, leap_col):
+    """날짜 열 → (양력 datetime64[D] 배열(NaT 포함), 형식 오류 마스크, 없는 음력 날짜 마스크)."""
+    if calendar == CALENDAR_LUNAR:
+        leap_values = frame[leap_col] if leap_col is not None and leap_col in frame else None
+        solar, bad = lunar.parse_lunar_column(frame[date_col], leap_values)
+        return solar, bad, np.isnat(solar) & ~bad
+    solar = to_datetimes(frame[date_col]).to_numpy(dtype="datetime64[D]")
+    return solar, np.isnat(solar), np.zeros(len(frame), dtype=bool)
+
+
+def process_chunk(frame: pd.DataFrame, date_col: str, hour_col, variant: str,
+                  calendar: str = CALENDAR_SOLAR, leap_col=None):
+    """입력 조각 → (결과 DataFrame, 거부 DataFrame)."""
+    solar, bad_date, no_lunar = _parse_dates(frame, date_col, calendar, leap_col)
+    if hour_col is not None and hour_col in frame:
+        branches, bad_hour = _parse_hours(frame[hour_col])
+    else:
+        branches = np.full(len(frame), -1, dtype=np.int64)
+        bad_hour = np.zeros(len(frame), dtype=bool)
+
+    day_values = np.where(np.isnat(solar), np.datetime64("1970-01-01"), solar)
+    rows = gapja_batch(day_values, branches)
+    out_of_range = rows["year"] < 0
+
+    reason = np.full(len(frame), "", dtype=object)
+    reason[out_of_range] = "만세력 범위 밖"
+    reason[no_lunar] = "없는 음력 날짜"
+    reason[bad_hour] = "시 형식 오류"
+    reason[bad_date] = "날짜 형식 오류"
+    rejected = bad_date | no_lunar | bad_hour | out_of_range
+
+    ok = ~rejected
+    rows = rows[ok]
+    result = frame.loc[ok].reset_index(drop=True)
+    if calendar == CALENDAR_LUNAR:
+        result["solar_date"] = solar[ok].astype(str)
+
+    idx = np.stack([rows[key].astype(np.int64) for key in ("year", "month", "day", "hour")])
+    for key, values in zip(("year", "month", "day", "hour"), idx):
+        result[f"{key}_ganji"] = _GANJI[values]
+
+    # 오행 점수 (시 모름(-1)은 빼고 셈)
+    stem_w, branch_w = ELEMENT_WEIGHTS[variant]
+    known = idx >= 0
+    safe = np.where(known, idx, 0)
+    stem_el = np.where(known, STEM_ELEMENT[safe % 10], -1)
+    branch_el = np.where(known, BRANCH_ELEMENT[safe % 12], -1)
+    counts = np.stack([
+        stem_w * (stem_el == e).sum(axis=0) + branch_w * (branch_el == e).sum(axis=0)
+        for e in range(len(ELEMENTS))
+    ], axis=1)
+    for e, field in enumerate(ELEMENT_FIELDS):
+        result[field] = counts[:, e].astype(np.int16)
+
+    # max/min 은 동점이면 목·화·토·금·수 순서로 앞선 것 (argmax/argmin 과 같음)
+    result["dominant"] = _ELEMENT_NAMES[counts.argmax(axis=1)]
+    result["weak"] = _ELEMENT_NAMES[counts.argmin(axis=1)]
+    day_element = _ELEMENT_NAMES[STEM_ELEMENT[idx[2] % 10]]
+    result["day_element"] = day_element
+    if variant == VARIANT_MANSE:
+        result["reading_key"] = day_element
+    else:
+        count_text = pd.Series(counts[:, 0].astype(str), dtype=object)
+        for e in range(1, len(ELEMENTS)):
+            count_text = count_text + "," + counts[:, e].astype(str)
+        result["reading_key"] = pd.Series(day_element, dtype=object) + "|" + count_text
+
+    rejects = frame.loc[rejected].reset_index(drop=True)
+    rejects["reason"] = reason[rejected]
+    return result, rejects
+
+
+# ---------------------------------------------------------
+# 입출력 (조각 단위 스트리밍)
+# ---------------------------------------------------------
+def _is_parquet(path: str) -> bool:
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise SystemExit("Parquet 입출력에는 pyarrow 가 필요합니다. (pip install pyarrow)") from None
+
+
+def read_chunks(path: str, chunk_rows: int):
+    if _is_parquet(path):
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_rows, dtype=str, keep_default_na=False)
+
+
+class ChunkWriter:
+    """
+    CSV 는 이어 쓰기, Parquet 은 ParquetWriter 로 row group 을 하나씩 추가.
+    빈 조각은 건너뛰되, 끝까지 한 행도 없으면 close() 가 빈 조각의 머리글(스키마)만 쓴다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.parquet = _is_parquet(path)
+        self._writer = None
+        self._started = False
+        self._empty = None
+        if self.parquet:
+            _require_pyarrow()
+
+    def write(self, frame: pd.DataFrame):
+        if not len(frame):
+            if self._empty is None:
+                self._empty = frame
+            return
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        else:
+            frame.to_csv(self.path, mode="a" if self._started else "w",
+                         header=not self._started, index=False)
+        self._started = True
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        elif not self._started and self._empty is not None:
+            # 모든 행이 거부돼도 열 이름이 있는 빈 파일을 남긴다
+            if self.parquet:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                pq.write_table(pa.Table.from_pandas(self._empty, preserve_index=False), self.path)
+            else:
+                self._empty.to_csv(self.path, index=False)
+            self._started = True
+
+
+def map_chunks(func, chunks, workers: int, args=()):
+    """
+    func(조각, *args) 결과를 입력 순서대로. workers > 1 이면 프로세스 풀에서 실행하고,
+    동시에 넘기는 조각은 workers×2 개까지만 둔다 (메모리 일정).
+    """
+    if workers <= 1:
+        for frame in chunks:
+            yield func(frame, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for frame in chunks:
+            in_flight.append(pool.submit(func, frame, *args))
+            if len(in_flight) >= workers * 2:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def run(input_path, output_path, rejects_path=None, date_col="birth_date", hour_col="birth_hour",
+        variant=VARIANT_MANSE, workers=1, chunk_rows=CHUNK, progress=True,
+        calendar=CALENDAR_SOLAR, leap_col=None):
+    """입력 파일 전체를 처리하고 (처리 행 수, 거부 행 수, 경과 초)를 돌려준다."""
+    writer = ChunkWriter(output_path)
+    reject_writer = ChunkWriter(rejects_path) if rejects_path else None
+    done = rejected = 0
+    start = time.perf_counter()
+    try:
+        chunks = read_chunks(input_path, chunk_rows)
+        args = (date_col, hour_col, variant, calendar, leap_col)
+        for result, rejects in map_chunks(process_chunk, chunks, workers, args):
+            writer.write(result)
+            if reject_writer is not None:
+                reject_writer.write(rejects)
+            done += len(result)
+            rejected += len(rejects)
+            if progress:
+                elapsed = time.perf_counter() - start
+                print(f"\r{done + rejected:,}행 처리 ({(done + rejected) / elapsed:,.0f} rows/s)",
+                      end="", file=sys.stderr, flush=True)
+    finally:
+        writer.close()
+        if reject_writer is not None:
+            reject_writer.close()
+    return done, rejected, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV/Parquet 대량 사주 계산")
+    parser.add_argument("input", help="입력 파일 (.csv 또는 .parquet)")
+    parser.add_argument("output", help="출력 파일 (.csv 또는 .parquet)")
+    parser.add_argument("--rejects", help="거부 행 파일 (없으면 건수만 보고)")
+    parser.add_argument("--date-col", default="birth_date")
+    parser.add_argument("--hour-col", default="birth_hour")
+    parser.add_argument("--variant", default=VARIANT_MANSE, choices=VARIANTS)
+    parser.add_argument("--calendar", default=CALENDAR_SOLAR, choices=CALENDARS, help="생년월일 열의 달력")
+    parser.add_argument("--leap-col", help="음력 윤달 여부 열 (1/true/윤, --calendar lunar 일 때)")
+    parser.add_argument("--workers", type=int, default=1, help="작업 프로세스 수")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="조각당 행 수")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        parser.error(f"입력 파일이 없습니다: {args.input}")
+
+    done, rejected, elapsed = run(args.input, args.output, args.rejects, args.date_col,
+                                  args.hour_col, args.variant, args.workers, args.chunk,
+                                  calendar=args.calendar, leap_col=args.leap_col)
+    total = done + rejected
+    print(f"\n완료: {done:,}행 출력, 거부 {rejected:,}행, {elapsed:.1f}초 "
+          f"({total / elapsed if elapsed else 0:,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+프로세스 전체가 함께 쓰는 SajuReport 캐시.
+
+Streamlit 은 세션마다 스크립트를 다시 실행하지만 import 한 모듈은 프로세스에 하나뿐이라,
+여기 둔 캐시는 모든 세션·스크립트 실행 스레드가 공유합니다. 키는
+(양력 ordinal, 시지(모르면 -1), 앱 종류, 운세 연도) 이고, 가장 오래 안 쓴 항목부터 버립니다.
+
+    report = report_cache.get_or_build(key, lambda: build_report(...))
+    report_cache.stats()   # {"size": ..., "maxsize": ..., "hits": ..., "misses": ...}
+
+크기는 SAJU_REPORT_CACHE_SIZE 환경 변수(기본 4096) 또는 resize() 로 정합니다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+CACHE_SIZE_ENV = "SAJU_REPORT_CACHE_SIZE"
+DEFAULT_CACHE_SIZE = 4096
+
+
+class LRUCache:
+    """잠금 하나로 보호하는 크기 제한 LRU 캐시 + 적중/실패 횟수."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError("maxsize 는 0 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_build(self, key, build):
+        """
+        캐시에 있으면 그 값을, 없으면 build() 결과를 넣고 돌려준다.
+        build() 는 잠금 밖에서 실행한다(같은 키가 동시에 들어오면 두 번 계산될 수 있지만 결과는 같다).
+        None 은 실패로 보고 캐시하지 않는다.
+        """
+        value = self.get(key)
+        if value is None:
+            value = build()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def resize(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError("maxsize 는 0 이상이어야 합니다.")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+
+def _size_from_env() -> int:
+    value = os.environ.get(CACHE_SIZE_ENV)
+    if not value:
+        return DEFAULT_CACHE_SIZE
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return DEFAULT_CACHE_SIZE
+
+
+report_cache = LRUCache(_size_from_env())
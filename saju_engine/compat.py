@@ -0,0 +1,265 @@
+"""
+궁합(宮合) 점수 – 두 사주 묶음(N명 × M명)의 점수 행렬을 배열 연산으로 계산.
+
+한 사람은 오행 개수 벡터(count_elements 와 같은 [목, 화, 토, 금, 수])와 일간·일지 인덱스로
+나타냅니다 (batch.four_pillars_batch 결과의 d_stem, d_branch, wood~water 와 같음).
+
+점수(0~100) = 50
+    + ELEMENT_WEIGHT × (상생 흐름 − 상극 흐름)   오행 비율 p 에 대해 p_a · (G + Gᵀ) · p_b − p_a · (C + Cᵀ) · p_b
+    + STEM_WEIGHT    × STEM_PAIR[일간 a, 일간 b]   천간합 +2, 상생 +1, 상극 −1
+    + BRANCH_WEIGHT  × BRANCH_PAIR[일지 a, 일지 b] 육합 +2, 충 −2
+
+일간·일지 항은 일주(60갑자) 쌍 표 PAIR_TABLE(60 × 60)로 합쳐 두고, 오른쪽 묶음의 일주를
+원-핫 행렬로 바꿔 오행 항과 함께 (N, 65) × (65, M) 행렬곱 한 번으로 블록을 계산합니다.
+큰 풀은 score_tiles() 로 TILE × TILE 블록씩 계산하고, top_k() 는 블록마다 상위 k 명만 남겨
+전체 N × M 행렬을 만들지 않습니다.
+
+배치 결과에서 만세력 범위 밖(또는 1582년 그레고리력 공백) 날짜라 일주가 -1 인 행은
+valid 마스크로 표시해 두고 점수를 매기지 않습니다. score_matrix 에서는 그 행·열이 NaN,
+top_k 에서는 후보에서 빠지고, 그런 a 행의 결과는 인덱스 -1 · 점수 NaN 입니다.
+
+    a = ChartVectors.from_batch(four_pillars_batch(dates_a, hours_a))
+    b = ChartVectors.from_batch(four_pillars_batch(dates_b, hours_b))
+    score_matrix(a, b)          # (N, M) float32
+    idx, scores = top_k(a, b, k=10)
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from saju_engine.batch import ELEMENT_FIELDS
+from saju_engine.daily import BRANCH_CLASH, BRANCH_HARMONY, BRANCH_LUT
+from saju_engine.fortune_year import CONTROL, GENERATE
+from saju_engine.pillars import STEM_ELEMENT
+
+TILE = 4096
+
+ELEMENT_WEIGHT = 20.0
+STEM_WEIGHT = 7.5
+BRANCH_WEIGHT = 7.5
+
+# 두 사람 사이 오행이 서로 생해 주는/극하는 정도 (대칭)
+HARMONY = (GENERATE + GENERATE.T).astype(np.float32)
+CONFLICT = (CONTROL + CONTROL.T).astype(np.float32)
+ELEMENT_AFFINITY = HARMONY - CONFLICT
+
+
+def _stem_pair():
+    elements = np.array(STEM_ELEMENT)
+    ea, eb = elements[:, None], elements[None, :]
+    table = np.zeros((10, 10), dtype=np.float32)
+    table += (GENERATE[ea, eb] | GENERATE[eb, ea])
+    table -= (CONTROL[ea, eb] | CONTROL[eb, ea])
+    a, b = np.arange(10)[:, None], np.arange(10)[None, :]
+    table[(a - b) % 10 == 5] = 2.0   # 천간합: 갑기, 을경, 병신, 정임, 무계
+    table.setflags(write=False)
+    return table
+
+
+def _branch_pair():
+    table = np.zeros((12, 12), dtype=np.float32)
+    table[BRANCH_LUT == BRANCH_HARMONY] = 2.0
+    table[BRANCH_LUT == BRANCH_CLASH] = -2.0
+    table.setflags(write=False)
+    return table
+
+
+STEM_PAIR = _stem_pair()
+BRANCH_PAIR = _branch_pair()
+
+
+def _pair_table():
+    g = np.arange(60)
+    stems, branches = g % 10, g % 12
+    table = (50.0
+             + STEM_WEIGHT * STEM_PAIR[stems[:, None], stems[None, :]]
+             + BRANCH_WEIGHT * BRANCH_PAIR[branches[:, None], branches[None, :]]).astype(np.float32)
+    table.setflags(write=False)
+    return table
+
+
+# PAIR_TABLE[일주 a, 일주 b] = 50 + 일간 항 + 일지 항
+PAIR_TABLE = _pair_table()
+
+
+class ChartVectors(namedtuple("ChartVectors", ["counts", "day_stem", "day_branch", "valid"])):
+    """
+    counts: (N, 5) 오행 개수, day_stem: (N,) 일간 0~9, day_branch: (N,) 일지 0~11,
+    valid: (N,) bool – False 인 행은 점수를 매기지 않는다 (값은 0 으로 채워 둠).
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_batch(cls, result):
+        """four_pillars_batch 결과(PILLARS_DTYPE) → ChartVectors. 일주가 -1 인 행은 valid=False."""
+        counts = np.stack([result[field] for field in ELEMENT_FIELDS], axis=1)
+        valid = (result["d_stem"] >= 0) & (result["d_branch"] >= 0)
+        return cls.from_arrays(counts, result["d_stem"], result["d_branch"], valid)
+
+    @classmethod
+    def from_reports(cls, reports):
+        """SajuReport 목록 → ChartVectors (앱 종류별 가중치가 적용된 counts 그대로)."""
+        from saju_engine.pillars import ELEMENTS
+
+        counts = [[r.counts[e] for e in ELEMENTS] for r in reports]
+        stems = [r.pillars.day % 10 for r in reports]
+        branches = [r.pillars.day % 12 for r in reports]
+        return cls.from_arrays(counts, stems, branches)
+
+    @classmethod
+    def from_arrays(cls, counts, day_stem, day_branch, valid=None):
+        """
+        배열 → ChartVectors. valid 를 주지 않으면 모든 행이 유효해야 하며,
+        유효한 행의 일간·일지가 범위를 벗어나거나 음양이 어긋나면(일주가 아님) ValueError.
+        """
+        counts = np.asarray(counts, dtype=np.float32)
+        day_stem = np.asarray(day_stem, dtype=np.intp)
+        day_branch = np.asarray(day_branch, dtype=np.intp)
+        if counts.ndim != 2 or counts.shape[1] != 5:
+            raise ValueError("counts 는 (N, 5) 배열이어야 합니다.")
+        valid = np.ones(len(counts), dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+        if not len(counts) == len(day_stem) == len(day_branch) == len(valid):
+            raise ValueError("counts, day_stem, day_branch, valid 의 길이가 다릅니다.")
+
+        bad = valid & ((day_stem < 0) | (day_stem >= 10) | (day_branch < 0) | (day_branch >= 12)
+                       | (day_stem % 2 != day_branch % 2))
+        if bad.any():
+            row = int(np.flatnonzero(bad)[0])
+            raise ValueError(f"일간은 0~9, 일지는 0~11 이고 음양이 같아야 합니다: "
+                             f"{row}행 ({day_stem[row]}, {day_branch[row]})")
+        if not valid.all():
+            counts = np.where(valid[:, None], counts, 0.0).astype(np.float32)
+            day_stem = np.where(valid, day_stem, 0)
+            day_branch = np.where(valid, day_branch, 0)
+        return cls(counts, day_stem, day_branch, valid)
+
+    def __len__(self):
+        return len(self.counts)
+
+    @property
+    def day_gapja(self):
+        """일간·일지 → 일주 60갑자 인덱스 (6·천간 − 5·지지) mod 60."""
+        return (6 * self.day_stem - 5 * self.day_branch) % 60
+
+    def slice(self, start: int, stop: int):
+        return ChartVectors(self.counts[start:stop], self.day_stem[start:stop], self.day_branch[start:stop],
+                            self.valid[start:stop])
+
+
+def _proportions(counts):
+    totals = counts.sum(axis=1, keepdims=True)
+    return counts / np.maximum(totals, 1)
+
+
+class _Prepared:
+    """
+    양쪽 묶음을 행렬곱 한 번으로 점수가 나오는 특징 행렬로 바꿔 둔다.
+    left  = [오행 비율 × 관계 행렬 × 가중치 | PAIR_TABLE[일주 a]]   (N, 65)
+    right = [오행 비율ᵀ ; 일주 b 원-핫ᵀ]                            (65, M)
+    무효 행·열 마스크는 하나라도 있을 때만 들고 있다.
+    """
+
+    __slots__ = ("left", "right", "bad_rows", "bad_cols")
+
+    def __init__(self, a: ChartVectors, b: ChartVectors):
+        element_left = (_proportions(a.counts) @ ELEMENT_AFFINITY) * ELEMENT_WEIGHT
+        self.left = np.hstack([element_left, PAIR_TABLE[a.day_gapja]]).astype(np.float32)
+
+        right = np.zeros((5 + 60, len(b)), dtype=np.float32)
+        right[:5] = _proportions(b.counts).T
+        right[5 + b.day_gapja, np.arange(len(b))] = 1.0
+        self.right = right
+
+        self.bad_rows = None if a.valid.all() else ~a.valid
+        self.bad_cols = None if b.valid.all() else ~b.valid
+
+    def block(self, i0, i1, j0, j1, out=None, fill=np.nan):
+        """점수 블록. 무효 행·열 칸은 fill."""
+        scores = np.matmul(self.left[i0:i1], self.right[:, j0:j1], out=out)
+        np.clip(scores, 0.0, 100.0, out=scores)
+        if self.bad_rows is not None:
+            scores[self.bad_rows[i0:i1]] = fill
+        if self.bad_cols is not None:
+            scores[:, self.bad_cols[j0:j1]] = fill
+        return scores
+
+
+# ---------------------------------------------------------
+# 점수 행렬
+# ---------------------------------------------------------
+def score_matrix(a: ChartVectors, b: ChartVectors) -> np.ndarray:
+    """(N, M) float32 점수 행렬 (무효 행·열은 NaN). 큰 풀에는 score_tiles 나 top_k 를 쓴다."""
+    return _Prepared(a, b).block(0, len(a), 0, len(b))
+
+
+def score_tiles(a: ChartVectors, b: ChartVectors, tile: int = TILE):
+    """(i0, j0, 블록) 을 차례로 yield. 블록 크기는 최대 tile × tile 이라 메모리가 일정하다."""
+    prepared = _Prepared(a, b)
+    for i0 in range(0, len(a), tile):
+        i1 = min(i0 + tile, len(a))
+        for j0 in range(0, len(b), tile):
+            j1 = min(j0 + tile, len(b))
+            yield i0, j0, prepared.block(i0, i1, j0, j1)
+
+
+def top_k(a: ChartVectors, b: ChartVectors, k: int = 10, tile: int = TILE, exclude_self: bool = False):
+    """
+    a 의 각 사람에 대해 b 에서 점수가 높은 k 명 → (인덱스 (N, k) int64, 점수 (N, k) float32).
+    블록마다 후보를 k 명으로 줄여 합치므로 전체 행렬을 만들지 않는다.
+    exclude_self=True 는 a 와 b 가 같은 풀일 때 자기 자신(같은 인덱스)을 뺀다.
+    점수는 내림차순(같은 점수끼리는 인덱스 오름차순). k 번째 점수와 동점인 후보가 여럿이면
+    그중 누가 남을지는 정하지 않는다. b 의 무효 행은 후보에서 빠지고(k 는 유효 후보 수까지),
+    a 의 무효 행은 인덱스 -1 · 점수 NaN 으로 채운다.
+    """
+    n, m = len(a), len(b)
+    m_valid = int(b.valid.sum())
+    k = min(k, m_valid - 1 if exclude_self else m_valid)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int64), np.empty((n, 0), dtype=np.float32)
+
+    prepared = _Prepared(a, b)
+    best_idx = np.empty((n, k), dtype=np.int64)
+    best_score = np.empty((n, k), dtype=np.float32)
+    buffer = np.empty((min(tile, n), min(tile, m)), dtype=np.float32)
+
+    for i0 in range(0, n, tile):
+        i1 = min(i0 + tile, n)
+        rows = np.arange(i1 - i0)[:, None]
+        cand_idx = np.empty((i1 - i0, 0), dtype=np.int64)
+        cand_score = np.empty((i1 - i0, 0), dtype=np.float32)
+
+        for j0 in range(0, m, tile):
+            j1 = min(j0 + tile, m)
+            block = prepared.block(i0, i1, j0, j1, out=buffer[:i1 - i0, :j1 - j0], fill=-np.inf)
+            if exclude_self:
+                lo, hi = max(i0, j0), min(i1, j1)
+                if lo < hi:
+                    diag = np.arange(lo, hi)
+                    block[diag - i0, diag - j0] = -1.0
+
+            # 블록에서 먼저 상위 k 를 고른 뒤 지금까지 후보와 합쳐 다시 k 로 줄임
+            width = j1 - j0
+            if width > k:
+                top = np.argpartition(block, width - k, axis=1)[:, width - k:]
+            else:
+                top = np.broadcast_to(np.arange(width), block.shape)
+            idx = np.concatenate([cand_idx, top + j0], axis=1)
+            score = np.concatenate([cand_score, block[rows, top]], axis=1)
+            if score.shape[1] > k:
+                keep = np.argpartition(score, score.shape[1] - k, axis=1)[:, score.shape[1] - k:]
+                idx, score = idx[rows, keep], score[rows, keep]
+            cand_idx, cand_score = idx, score
+
+        # 점수 내림차순, 동점은 인덱스 오름차순
+        order = np.lexsort((cand_idx, -cand_score), axis=1)
+        best_idx[i0:i1] = cand_idx[rows, order]
+        best_score[i0:i1] = cand_score[rows, order]
+
+    # 무효 a 행(과 혹시 남은 무효 후보)은 -1 / NaN
+    missing = best_score < 0.0
+    if missing.any():
+        best_idx[missing] = -1
+        best_score[missing] = np.nan
+    return best_idx, best_score
@@ -0,0 +1,227 @@
+"""
+대운(大運) 계산 – 대운수(시작 나이)와 10년 단위 대운 기둥.
+
+- 방향: 연간이 양(갑·병·무·경·임)인 남자와 음(을·정·기·신·계)인 여자는 순행,
+  그 밖에는 역행합니다.
+- 대운수: 순행은 태어난 시각부터 다음 절(節)까지, 역행은 직전 절부터 태어난 시각까지의
+  시간을 재어 3일 = 1년(1일 = 4개월)으로 환산합니다.
+- 기둥: 절기 기준 월주에서 순행이면 다음 갑자, 역행이면 이전 갑자로 한 칸씩 나아갑니다.
+
+절 시각은 solar_terms 의 사전 계산 인덱스를 쓰므로 한 명당 비용은 이진 탐색 한 번과
+산술 연산뿐입니다. 연주·월주도 같은 절기 인덱스(입춘·절 기준)로 구하므로 앱이 보여 주는
+만세력 테이블의 음력 기준 연주·월주와 다를 수 있습니다(월주는 약 4분의 1의 날짜에서).
+그래서 결과에 기준 연주·월주(year_gapja, month_gapja)를 함께 담고, daewoon_markdown() 은
+이를 대운 표 위에 '절기 기준'으로 표시하며 화면의 기둥과 다르면 안내 문구를 붙입니다.
+
+    chart = daewoon(date(1990, 5, 17), 14, "여성")
+    chart.start_age                       # 대운수
+    chart.month_ganji                     # 대운을 세는 절기 기준 월주
+    [p.ganji for p in chart.pillars]      # ['신사', '경진', ...]
+
+    result = daewoon_batch(birth_times, is_male)   # 배열 계산
+"""
+
+from collections import namedtuple
+from datetime import date, datetime
+
+import numpy as np
+
+from saju_engine import solar_terms
+from saju_engine.manse_table import GAPJA_NAMES
+
+DEFAULT_COUNT = 10
+MIN_COUNT = 8
+MAX_COUNT = 10
+
+# 시를 모를 때 쓰는 시각 (정오)
+UNKNOWN_HOUR = 12
+
+MINUTES_PER_MONTH = solar_terms.MINUTES_PER_DAY // 4        # 1일 = 4개월
+MINUTES_PER_YEAR = solar_terms.MINUTES_PER_DAY * 3          # 3일 = 1년
+
+MALE_VALUES = {"남성", "남자", "남", "male", "m"}
+FEMALE_VALUES = {"여성", "여자", "여", "female", "f"}
+
+DaewoonPillar = namedtuple("DaewoonPillar", ["age", "gapja", "ganji"])
+
+# forward = 순행 여부, start_age = 대운수(첫 대운 나이), start_months = 절까지 거리(개월, 내림),
+# pillars = DaewoonPillar 튜플, year_gapja / month_gapja = 대운 기준인 절기 기준 연주·월주
+class Daewoon(namedtuple("Daewoon", ["forward", "start_age", "start_months", "pillars",
+                                     "year_gapja", "month_gapja"])):
+    __slots__ = ()
+
+    @property
+    def year_ganji(self) -> str:
+        return GAPJA_NAMES[self.year_gapja]
+
+    @property
+    def month_ganji(self) -> str:
+        return GAPJA_NAMES[self.month_gapja]
+
+
+def parse_gender(value):
+    """앱 입력('남성', '여자' 등) → 남자 True / 여자 False / 알 수 없음 None."""
+    if isinstance(value, bool):
+        return value
+    text = str(value or "").strip().lower()
+    if text in MALE_VALUES:
+        return True
+    if text in FEMALE_VALUES:
+        return False
+    return None
+
+
+def is_forward(year_gapja: int, male: bool) -> bool:
+    """연간 음양 + 성별 → 순행 여부."""
+    return (year_gapja % 2 == 0) == male
+
+
+def start_age_from_minutes(minutes: int) -> int:
+    """절까지 거리(분) → 대운수. 3일 = 1년, 반올림하고 최소 1."""
+    return max(1, (minutes + MINUTES_PER_YEAR // 2) // MINUTES_PER_YEAR)
+
+
+def _check_count(count: int):
+    if not MIN_COUNT <= count <= MAX_COUNT:
+        raise ValueError(f"대운 개수는 {MIN_COUNT}~{MAX_COUNT} 사이여야 합니다: {count}")
+
+
+# ---------------------------------------------------------
+# 한 명
+# ---------------------------------------------------------
+def daewoon(birth, hour=None, gender=None, minute: int = 0, count: int = DEFAULT_COUNT):
+    """
+    양력 생일(date 또는 datetime) + 태어난 시(0~23, 모르면 None=정오) + 성별 → Daewoon.
+    성별을 알 수 없으면 ValueError, 절기 인덱스 범위 밖이면 None.
+    """
+    _check_count(count)
+    male = parse_gender(gender)
+    if male is None:
+        raise ValueError(f"대운은 성별(남/여)이 필요합니다: {gender}")
+
+    if isinstance(birth, datetime):
+        key = solar_terms.minute_key(birth)
+    else:
+        key = solar_terms.minute_key(birth, UNKNOWN_HOUR if hour is None else hour, minute)
+
+    try:
+        prev_key, next_key = solar_terms.surrounding_jeol(key)
+    except ValueError:
+        return None
+    year_gapja = solar_terms.year_gapja_from_key(key)
+    month_gapja = solar_terms.month_gapja_from_key(key)
+
+    forward = is_forward(year_gapja, male)
+    distance = next_key - key if forward else key - prev_key
+    start_age = start_age_from_minutes(distance)
+    step = 1 if forward else -1
+
+    pillars = []
+    for i in range(count):
+        g = (month_gapja + step * (i + 1)) % 60
+        pillars.append(DaewoonPillar(start_age + 10 * i, g, GAPJA_NAMES[g]))
+    return Daewoon(forward, start_age, distance // MINUTES_PER_MONTH, tuple(pillars),
+                   year_gapja, month_gapja)
+
+
+def current_pillar(chart: Daewoon, age: int):
+    """나이 → 그 나이에 해당하는 DaewoonPillar (첫 대운 전이면 None)."""
+    current = None
+    for pillar in chart.pillars:
+        if pillar.age > age:
+            break
+        current = pillar
+    return current
+
+
+def daewoon_markdown(chart: Daewoon, shown=None) -> str:
+    """
+    앱 화면용 요약 + 나이별 대운 표 (마크다운).
+    shown 에 화면에 보여 준 Pillars 를 주면, 절기 기준 연주·월주가 그와 다를 때 안내 문구를 붙인다.
+    """
+    direction = "순행" if chart.forward else "역행"
+    years, months = divmod(chart.start_months, 12)
+    lines = [
+        f"- **대운 기준 (절기 기준):** 연주 {chart.year_ganji}  ·  월주 {chart.month_ganji}",
+        f"- **방향:** {direction}  ·  **대운수:** {chart.start_age}"
+        f" (절기까지 {years}년 {months}개월 환산)",
+    ]
+    if shown is not None and (shown.year, shown.month) != (chart.year_gapja, chart.month_gapja):
+        lines.append(
+            f"- 위 사주 4기둥(연주 {shown.ganji('year')} · 월주 {shown.ganji('month')})은 만세력의 음력 월 기준이라, "
+            "입춘·절기로 나누는 대운 기준 기둥과 다릅니다. 대운은 절기 기준 월주에서 한 칸씩 셉니다."
+        )
+    lines += [
+        "",
+        "| 나이 | " + " | ".join(f"{p.age}세" for p in chart.pillars) + " |",
+        "|" + "---|" * (len(chart.pillars) + 1),
+        "| 대운 | " + " | ".join(p.ganji for p in chart.pillars) + " |",
+    ]
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# 배열 계산
+# ---------------------------------------------------------
+def daewoon_dtype(count: int = DEFAULT_COUNT) -> np.dtype:
+    return np.dtype([("forward", np.bool_), ("start_age", np.int8),
+                     ("start_months", np.int16), ("pillars", np.int8, (count,)),
+                     ("year", np.int8), ("month", np.int8)])
+
+
+def daewoon_batch(birth_times, male, count: int = DEFAULT_COUNT) -> np.ndarray:
+    """
+    태어난 시각 배열(datetime64 또는 KST 분 키) + 남자 여부 bool 배열 → 구조화 배열.
+    필드: forward, start_age, start_months, pillars(count 개 60갑자 인덱스),
+    year/month(절기 기준 연주·월주). 절기 인덱스 범위 밖은 start_age = -1, 나머지 기둥 -1.
+    """
+    _check_count(count)
+    keys = np.asarray(birth_times)
+    if np.issubdtype(keys.dtype, np.datetime64):
+        keys = solar_terms.minute_keys(keys)
+    keys = keys.astype(np.int64)
+    male = np.asarray(male, dtype=bool)
+
+    prev_key, next_key, pos = solar_terms.surrounding_jeol_batch(keys)
+    year_gapja = solar_terms.year_pillar_batch(keys).astype(np.int64)
+    month_gapja = solar_terms.month_pillar_batch(keys).astype(np.int64)
+    valid = pos >= 0
+
+    forward = (year_gapja % 2 == 0) == male
+    distance = np.where(forward, next_key - keys, keys - prev_key)
+    start_age = np.maximum(1, (distance + MINUTES_PER_YEAR // 2) // MINUTES_PER_YEAR)
+
+    step = np.where(forward, 1, -1)[:, None]
+    pillars = (month_gapja[:, None] + step * np.arange(1, count + 1)) % 60
+
+    out = np.empty(len(keys), dtype=daewoon_dtype(count))
+    out["forward"] = forward & valid
+    out["start_age"] = np.where(valid, start_age, -1)
+    out["start_months"] = np.where(valid, distance // MINUTES_PER_MONTH, -1)
+    out["pillars"] = np.where(valid[:, None], pillars, -1)
+    out["year"] = np.where(valid, year_gapja, -1)
+    out["month"] = np.where(valid, month_gapja, -1)
+    return out
+
+
+def birth_times(dates, hours=None) -> np.ndarray:
+    """생년월일 배열 + 시(0~23, 모르면 -1) 배열 → daewoon_batch 용 datetime64[m] 배열."""
+    days = np.asarray(dates, dtype="datetime64[D]")
+    if hours is None:
+        hour_values = np.full(len(days), UNKNOWN_HOUR, dtype=np.int64)
+    else:
+        hour_values = np.asarray(hours, dtype=np.int64)
+        hour_values = np.where(hour_values < 0, UNKNOWN_HOUR, hour_values)
+    return days.astype("datetime64[m]") + hour_values.astype("timedelta64[h]")
+
+
+if __name__ == "__main__":
+    import sys
+
+    birth_date = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else date(1990, 5, 17)
+    birth_hour = int(sys.argv[2]) if len(sys.argv) > 2 and sys.argv[2] != "-" else None
+    chart = daewoon(birth_date, birth_hour, sys.argv[3] if len(sys.argv) > 3 else "남성")
+    print(f"절기 기준 연주 {chart.year_ganji} · 월주 {chart.month_ganji}")
+    print(f"{'순행' if chart.forward else '역행'}, 대운수 {chart.start_age} ({chart.start_months}개월)")
+    for pillar in chart.pillars:
+        print(f"{pillar.age:>3}세  {pillar.ganji}")
@@ -0,0 +1,248 @@
+"""
+일진(日辰) 운세 – 날짜별 일주와 사용자 일주의 관계를 미리 계산하는 작업.
+
+일진은 하루에 한 칸씩 60갑자를 돌기 때문에, "사용자 일주 × 그날 일주" 조합은 60 × 60 뿐입니다.
+DAY_LUT 에 조합마다 관계 코드(uint8)를 미리 넣어 두고, 사용자 배열 × 날짜 배열은
+팬시 인덱싱 한 번(DAY_LUT[사용자, 날짜])으로 계산합니다.
+
+- 천간: 그날 천간 오행이 사용자 일간 오행과 어떤 관계인지 (fortune_year.RELATION, 10 × 10)
+- 지지: 그날 지지와 사용자 일지가 충(沖)인지 육합(六合)인지 (12 × 12)
+- 코드 = 천간 관계 × 3 + 지지 관계 (0~14), 사용자 일주를 모르면 UNKNOWN_CODE
+
+    daily_codes(user_gapja, date(2026, 1, 1), 30)   # (사용자 수, 30) uint8
+    daily_reading(user_gapja, date(2026, 1, 1))     # DailyReading (점수·문구 포함)
+
+푸시 발송용 일괄 작업 (입력은 batch_cli 출력처럼 day_ganji 열 또는 birth_date 열):
+
+    python -m saju_engine.daily charts.csv daily.csv --start 2026-01-01 --days 30 --legend legend.csv
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from saju_engine.batch_cli import CHUNK, ChunkWriter, map_chunks, read_chunks, to_datetimes
+from saju_engine.day_pillar import DAY_GAPJA_OFFSET, EPOCH_ORDINAL
+from saju_engine.fortune_year import (
+    RELATION,
+    RELATION_OFFICER,
+    RELATION_OUTPUT,
+    RELATION_RESOURCE,
+    RELATION_SAME,
+    RELATION_WEALTH,
+)
+from saju_engine.manse_table import GAPJA_NAMES
+from saju_engine.pillars import STEM_ELEMENT
+
+# 지지 관계
+BRANCH_NONE = 0
+BRANCH_CLASH = 1     # 충: 정반대 지지 (자-오, 축-미, ...)
+BRANCH_HARMONY = 2   # 육합: 자축, 인해, 묘술, 진유, 사신, 오미
+BRANCH_STATES = 3
+
+UNKNOWN_CODE = 255
+
+
+def _stem_lut():
+    """STEM_LUT[사용자 일간, 그날 천간] → 관계 코드."""
+    elements = np.array(STEM_ELEMENT, dtype=np.int64)
+    return RELATION[elements[:, None], elements[None, :]].astype(np.uint8)
+
+
+def _branch_lut():
+    """BRANCH_LUT[사용자 일지, 그날 지지] → 지지 관계."""
+    a = np.arange(12)[:, None]
+    b = np.arange(12)[None, :]
+    lut = np.full((12, 12), BRANCH_NONE, dtype=np.uint8)
+    lut[(a - b) % 12 == 6] = BRANCH_CLASH
+    lut[(a + b) % 12 == 1] = BRANCH_HARMONY
+    return lut
+
+
+def _day_lut():
+    g = np.arange(60)
+    lut = (_stem_lut()[(g % 10)[:, None], (g % 10)[None, :]] * BRANCH_STATES
+           + _branch_lut()[(g % 12)[:, None], (g % 12)[None, :]]).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+STEM_LUT = _stem_lut()
+BRANCH_LUT = _branch_lut()
+# DAY_LUT[사용자 일주 60갑자, 그날 일주 60갑자] → 코드 (0~14)
+DAY_LUT = _day_lut()
+
+CODE_COUNT = 5 * BRANCH_STATES
+
+# 관계별 (기본 점수, 한 줄 문구)
+RELATION_MESSAGES = {
+    RELATION_SAME: (3, "나와 같은 기운이 들어오는 날. 스스로 밀고 나가는 일이 잘 풀립니다."),
+    RELATION_OUTPUT: (3, "내 기운을 밖으로 쓰는 날. 표현·발표·창작에 힘이 실립니다."),
+    RELATION_RESOURCE: (4, "도움을 받는 날. 배우고 부탁하기 좋습니다."),
+    RELATION_OFFICER: (2, "압박이 들어오는 날. 규칙을 지키고 무리한 약속은 피하세요."),
+    RELATION_WEALTH: (4, "실속을 챙기는 날. 정리·거래·돈 관리에 좋습니다."),
+}
+BRANCH_MESSAGES = {
+    BRANCH_NONE: (0, ""),
+    BRANCH_CLASH: (-1, " 일지와 충(沖)이 드는 날이라 이동·다툼에 주의하세요."),
+    BRANCH_HARMONY: (1, " 일지와 합(合)이 드는 날이라 사람 운이 좋습니다."),
+}
+
+DailyReading = namedtuple("DailyReading", ["date", "ganji", "code", "relation", "branch", "score", "message"])
+
+
+def _code_table():
+    scores = np.zeros(CODE_COUNT, dtype=np.int8)
+    messages = []
+    for code in range(CODE_COUNT):
+        relation, branch = divmod(code, BRANCH_STATES)
+        base, text = RELATION_MESSAGES[relation]
+        delta, note = BRANCH_MESSAGES[branch]
+        scores[code] = min(5, max(1, base + delta))
+        messages.append(text + note)
+    scores.setflags(write=False)
+    return scores, tuple(messages)
+
+
+# 코드 → 점수(1~5), 코드 → 문구
+CODE_SCORES, CODE_MESSAGES = _code_table()
+
+
+# ---------------------------------------------------------
+# 날짜 / 사용자 → 코드
+# ---------------------------------------------------------
+def day_gapja_range(start: date, days: int) -> np.ndarray:
+    """start 부터 days 일 동안의 일주 60갑자 인덱스 int64 배열."""
+    return (start.toordinal() + DAY_GAPJA_OFFSET + np.arange(days, dtype=np.int64)) % 60
+
+
+def daily_codes(user_gapja, start: date, days: int) -> np.ndarray:
+    """
+    사용자 일주 60갑자 인덱스 배열(모르면 -1) → (사용자 수, days) uint8 코드 배열.
+    DAY_LUT 조회 한 번으로 계산한다.
+    """
+    users = np.asarray(user_gapja, dtype=np.int64)
+    known = (users >= 0) & (users < 60)
+    codes = DAY_LUT[np.where(known, users, 0)[:, None], day_gapja_range(start, days)[None, :]]
+    codes[~known] = UNKNOWN_CODE
+    return codes
+
+
+def daily_reading(user_gapja: int, on_date: date) -> DailyReading:
+    """사용자 일주 하나 + 날짜 → DailyReading."""
+    day = (on_date.toordinal() + DAY_GAPJA_OFFSET) % 60
+    code = int(DAY_LUT[user_gapja, day])
+    relation, branch = divmod(code, BRANCH_STATES)
+    return DailyReading(on_date, GAPJA_NAMES[day], code, relation, branch,
+                        int(CODE_SCORES[code]), CODE_MESSAGES[code])
+
+
+def legend_frame() -> pd.DataFrame:
+    """코드 → 관계·점수·문구 표 (발송 시스템이 코드를 문구로 바꿀 때 사용)."""
+    codes = np.arange(CODE_COUNT)
+    return pd.DataFrame({
+        "code": codes,
+        "relation": codes // BRANCH_STATES,
+        "branch": codes % BRANCH_STATES,
+        "score": CODE_SCORES,
+        "message": CODE_MESSAGES,
+    })
+
+
+# ---------------------------------------------------------
+# 일괄 작업 (batch_cli 의 조각 스트리밍 재사용)
+# ---------------------------------------------------------
+_GANJI_INDEX = {name: i for i, name in enumerate(GAPJA_NAMES)}
+
+
+def _user_gapja(frame: pd.DataFrame, day_col: str, date_col: str) -> np.ndarray:
+    """조각 → 사용자 일주 60갑자 인덱스 int64 배열 (읽을 수 없으면 -1)."""
+    if day_col in frame:
+        values = frame[day_col].astype("string").str.strip()
+        return values.map(_GANJI_INDEX).fillna(-1).to_numpy(dtype=np.int64)
+    dates = to_datetimes(frame[date_col])
+    bad = dates.isna().to_numpy()
+    days = dates.to_numpy(dtype="datetime64[D]", na_value=np.datetime64("1970-01-01"))
+    gapja = (days.astype(np.int64) + EPOCH_ORDINAL + DAY_GAPJA_OFFSET) % 60
+    return np.where(bad, -1, gapja)
+
+
+def process_chunk(frame: pd.DataFrame, day_col: str, date_col: str, id_cols, start: date, days: int):
+    """입력 조각 → (날짜별 코드 열이 붙은 DataFrame, 거부 DataFrame)."""
+    users = _user_gapja(frame, day_col, date_col)
+    ok = users >= 0
+    codes = daily_codes(users[ok], start, days)
+
+    keep = [c for c in id_cols if c in frame] or list(frame.columns)
+    result = frame.loc[ok, keep].reset_index(drop=True)
+    columns = [(start + timedelta(days=i)).isoformat() for i in range(days)]
+    result = pd.concat([result, pd.DataFrame(codes, columns=columns)], axis=1)
+
+    rejects = frame.loc[~ok].reset_index(drop=True)
+    rejects["reason"] = "일주를 알 수 없음"
+    return result, rejects
+
+
+def run(input_path, output_path, start: date, days: int, rejects_path=None, day_col="day_ganji",
+        date_col="birth_date", id_cols=("user_id",), workers=1, chunk_rows=CHUNK, progress=True):
+    """사용자 파일 전체에 대해 start 부터 days 일의 코드를 계산한다. (처리 행, 거부 행, 초)."""
+    writer = ChunkWriter(output_path)
+    reject_writer = ChunkWriter(rejects_path) if rejects_path else None
+    done = rejected = 0
+    started = time.perf_counter()
+    try:
+        chunks = read_chunks(input_path, chunk_rows)
+        args = (day_col, date_col, tuple(id_cols), start, days)
+        for result, rejects in map_chunks(process_chunk, chunks, workers, args):
+            writer.write(result)
+            if reject_writer is not None:
+                reject_writer.write(rejects)
+            done += len(result)
+            rejected += len(rejects)
+            if progress:
+                elapsed = time.perf_counter() - started
+                print(f"\r{done + rejected:,}명 처리 ({(done + rejected) * days / elapsed:,.0f} 명·일/s)",
+                      end="", file=sys.stderr, flush=True)
+    finally:
+        writer.close()
+        if reject_writer is not None:
+            reject_writer.close()
+    return done, rejected, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="사용자별 일진 코드 일괄 계산")
+    parser.add_argument("input", help="사용자 파일 (.csv 또는 .parquet)")
+    parser.add_argument("output", help="출력 파일 (.csv 또는 .parquet) – 날짜별 코드 열")
+    parser.add_argument("--start", type=date.fromisoformat, default=date.today(), help="시작일 (기본 오늘)")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--day-col", default="day_ganji", help="사용자 일주 열 (예: '임오')")
+    parser.add_argument("--date-col", default="birth_date", help="일주 열이 없을 때 쓰는 생년월일 열")
+    parser.add_argument("--id-col", action="append", help="출력에 남길 열 (여러 번 지정 가능, 기본 user_id)")
+    parser.add_argument("--legend", help="코드 → 점수·문구 표를 저장할 CSV")
+    parser.add_argument("--rejects", help="일주를 알 수 없는 행을 저장할 파일")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk", type=int, default=CHUNK)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        parser.error(f"입력 파일이 없습니다: {args.input}")
+    if args.days < 1:
+        parser.error("--days 는 1 이상이어야 합니다.")
+
+    if args.legend:
+        legend_frame().to_csv(args.legend, index=False)
+    done, rejected, elapsed = run(args.input, args.output, args.start, args.days, args.rejects,
+                                  args.day_col, args.date_col, args.id_col or ("user_id",),
+                                  args.workers, args.chunk)
+    print(f"\n완료: {done:,}명 × {args.days}일, 거부 {rejected:,}명, {elapsed:.1f}초", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
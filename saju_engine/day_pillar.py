@@ -0,0 +1,86 @@
+"""
+일주(日柱) 계산 – 달력 라이브러리 없이 날짜 번호만으로 구합니다.
+
+일진은 하루에 한 칸씩 60갑자를 도는 순수한 modulo-60 함수입니다.
+
+    일주 60갑자 인덱스 = (율리우스일 + 49) % 60 = (date.toordinal() + 14) % 60
+
+KoreanLunarCalendar 가 지원하는 전 범위에서 라이브러리 결과와 같습니다.
+(python -m saju_engine.day_pillar 로 만세력 테이블과 대조할 수 있습니다.)
+"""
+
+import sys
+from datetime import date
+
+import numpy as np
+
+# date.toordinal() 기준 보정값 (율리우스일 기준이면 49)
+DAY_GAPJA_OFFSET = 14
+JULIAN_DAY_OFFSET = 1721425  # 율리우스일 = ordinal + 1721425
+
+# numpy datetime64[D] 의 0일(1970-01-01)에 해당하는 ordinal
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def day_gapja(ordinal: int) -> int:
+    """date ordinal → 일주 60갑자 인덱스(0~59)."""
+    return (ordinal + DAY_GAPJA_OFFSET) % 60
+
+
+def day_pillar(value):
+    """
+    datetime.date 또는 ordinal → (일간 인덱스, 일지 인덱스).
+    천간은 0~9 (갑~계), 지지는 0~11 (자~해).
+    """
+    ordinal = value.toordinal() if isinstance(value, date) else value
+    idx = (ordinal + DAY_GAPJA_OFFSET) % 60
+    return idx % 10, idx % 12
+
+
+def day_pillar_from_jdn(jdn: int):
+    """율리우스일 → (일간 인덱스, 일지 인덱스)."""
+    return day_pillar(jdn - JULIAN_DAY_OFFSET)
+
+
+def to_ordinals(dates) -> np.ndarray:
+    """datetime64 배열 또는 ordinal 배열 → int64 ordinal 배열."""
+    arr = np.asarray(dates)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return arr.astype("datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+    return arr.astype(np.int64, copy=False)
+
+
+def day_pillar_batch(ordinals):
+    """
+    ordinal(또는 datetime64) 배열 → (일간 int8 배열, 일지 int8 배열).
+    파이썬 객체를 만들지 않고 배열 연산만 사용합니다.
+    """
+    idx = to_ordinals(ordinals) + DAY_GAPJA_OFFSET
+    np.remainder(idx, 60, out=idx)
+    return (idx % 10).astype(np.int8), (idx % 12).astype(np.int8)
+
+
+# ---------------------------------------------------------
+# 검증 – 만세력 테이블(= 라이브러리 결과)과 전 범위 대조
+# ---------------------------------------------------------
+def verify_against_table():
+    """만세력 테이블의 모든 날짜에 대해 일주가 같은지 확인하고 불일치 날짜 목록을 돌려준다."""
+    from saju_engine import manse_table
+
+    table = np.frombuffer(manse_table.load_table(), dtype=np.uint8)
+    table = table.reshape(-1, manse_table.RECORD_SIZE)
+
+    ordinals = np.arange(manse_table.DAY_COUNT, dtype=np.int64) + manse_table.BASE_ORDINAL
+    stems, branches = day_pillar_batch(ordinals)
+    expected = table[:, 2].astype(np.int64)
+
+    bad = np.nonzero((expected % 10 != stems) | (expected % 12 != branches))[0]
+    return [date.fromordinal(int(manse_table.BASE_ORDINAL + i)) for i in bad]
+
+
+if __name__ == "__main__":
+    mismatches = verify_against_table()
+    for d in mismatches[:20]:
+        print("불일치:", d)
+    print(f"일주 검증 완료: 불일치 {len(mismatches)}건")
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,157 @@
+"""
+PNG 내보내기용 한글 폰트 찾기.
+
+프로세스당 한 번만 폰트 폴더를 훑어 한글 글리프('가')가 있는 폰트를 고르고 경로를 캐시해
+둡니다. 이후 내보내기는 탐색 비용이 없습니다. 글리프 확인은 Pillow 로 하므로 Pillow 렌더러는
+matplotlib 을 import 하지 않습니다. matplotlib FontProperties 는 처음 요청할 때 만듭니다.
+
+- SAJU_FONT_PATH 환경 변수에 폰트 파일 경로를 주면 그 파일을 먼저 씁니다.
+- 없으면 KOREAN_FONT_NAMES 순서(Noto CJK → Nanum → 맑은 고딕 …)로 FONT_DIRS 를 찾습니다.
+
+    python -m saju_engine.fonts   # 선택된 폰트 경로 출력
+"""
+
+import os
+import sys
+import threading
+
+FONT_PATH_ENV = "SAJU_FONT_PATH"
+
+FONT_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "C:/Windows/Fonts",
+]
+
+# 파일 이름(소문자)에 들어가는 조각, 앞쪽이 우선
+KOREAN_FONT_NAMES = [
+    "notosanscjk",
+    "notosanskr",
+    "notoserifcjk",
+    "nanumgothic",
+    "nanumbarungothic",
+    "nanum",
+    "malgun",
+    "applesdgothicneo",
+    "gulim",
+    "batang",
+    "unfonts",
+    "baekmuk",
+]
+
+FONT_EXTENSIONS = (".ttf", ".ttc", ".otf")
+
+_lock = threading.Lock()
+_resolved = False
+_font_path = None
+_font_properties = None
+
+# 어느 폰트에도 글리프가 없는 코드포인트 – 이 글자와 같은 모양이면 .notdef(빈 네모)로 그려진 것
+_MISSING_CHAR = "\U0010fffd"
+
+
+def _has_hangul(path: str) -> bool:
+    try:
+        from PIL import ImageFont
+    except ImportError:
+        return _has_hangul_ft2font(path)
+    try:
+        font = ImageFont.truetype(path, 24)
+        mask = font.getmask("가")
+        return mask.getbbox() is not None and bytes(mask) != bytes(font.getmask(_MISSING_CHAR))
+    except Exception:
+        return False
+
+
+def _has_hangul_ft2font(path: str) -> bool:
+    """Pillow 가 없는 환경(matplotlib 렌더러만 사용)용."""
+    try:
+        from matplotlib.ft2font import FT2Font
+        return ord("가") in FT2Font(path).get_charmap()
+    except Exception:
+        return False
+
+
+def _candidates():
+    """폰트 폴더의 (우선순위, 경로) 목록. 이름이 맞지 않는 파일은 건너뛴다."""
+    found = []
+    for root_dir in FONT_DIRS:
+        if not os.path.isdir(root_dir):
+            continue
+        for dirpath, _dirnames, filenames in os.walk(root_dir):
+            for name in filenames:
+                lower = name.lower()
+                if not lower.endswith(FONT_EXTENSIONS):
+                    continue
+                for rank, key in enumerate(KOREAN_FONT_NAMES):
+                    if key in lower:
+                        # 같은 순위면 Regular/Medium 을 Bold 보다 앞에
+                        found.append((rank, "bold" in lower, os.path.join(dirpath, name)))
+                        break
+    found.sort()
+    return [path for _rank, _bold, path in found]
+
+
+def find_korean_font():
+    """한글을 그릴 수 있는 폰트 파일 경로. 못 찾으면 None."""
+    override = os.environ.get(FONT_PATH_ENV)
+    if override and os.path.isfile(override) and _has_hangul(override):
+        return override
+
+    for path in _candidates():
+        if _has_hangul(path):
+            return path
+    return None
+
+
+def _resolve():
+    global _resolved, _font_path
+    if _resolved:
+        return
+    with _lock:
+        if _resolved:
+            return
+        _font_path = find_korean_font()
+        _resolved = True
+
+
+def korean_font_path():
+    """캐시된 한글 폰트 경로 (없으면 None)."""
+    _resolve()
+    return _font_path
+
+
+def korean_font_properties():
+    """캐시된 한글 FontProperties (없으면 None → matplotlib 기본 폰트 사용)."""
+    global _font_properties
+    _resolve()
+    if _font_path is None:
+        return None
+    if _font_properties is None:
+        with _lock:
+            if _font_properties is None:
+                from matplotlib.font_manager import FontProperties
+                _font_properties = FontProperties(fname=_font_path)
+    return _font_properties
+
+
+def reset():
+    """환경 변수나 설치 폰트를 바꾼 뒤 다시 찾도록 캐시를 비운다."""
+    global _resolved, _font_path, _font_properties
+    with _lock:
+        _resolved = False
+        _font_path = None
+        _font_properties = None
+
+
+if __name__ == "__main__":
+    path = korean_font_path()
+    if path is None:
+        print("한글 폰트를 찾지 못했습니다. (fonts-noto-cjk / fonts-nanum 설치 또는 "
+              f"{FONT_PATH_ENV} 지정)")
+        sys.exit(1)
+    print(f"한글 폰트: {path}")
@@ -0,0 +1,318 @@
+"""
+2026년(병오년) 운세 해석과 사전 렌더링한 해석 테이블.
+
+love_2026 ~ moving_2026 과 element_relation_2026 은 일간 오행과 오행 개수 벡터에만 의존합니다.
+count_elements 가 만들 수 있는 상태(합계 6 또는 8, 일간 오행 1개 이상)는 수천 가지뿐이라
+build_fragment_table() 이 모든 상태의 문구를 한 번 만들어 두고, 요청 시에는
+reading_2026() 이 딕셔너리 조회 한 번으로 결과를 돌려줍니다.
+
+    python -m saju_engine.fortune_2026 dump tests/fixtures/fortune_2026.json   # 전체 출력 회귀 픽스처 저장
+    python -m saju_engine.fortune_2026 check tests/fixtures/fortune_2026.json  # 픽스처와 현재 출력 대조
+"""
+
+import json
+import sys
+import threading
+from collections import namedtuple
+from itertools import product
+from types import MappingProxyType
+
+from saju_engine.fortune_year import ELEMENTS, control_map, generate_map, year_profile  # noqa: F401
+
+YEAR = 2026
+_profile = year_profile(YEAR)
+
+YEAR_ELEMENT = _profile.element  # "화"
+YEAR_GANJI = _profile.ganji      # "병오"
+
+
+# 2026년 – 일간과의 관계 (문구는 연도 엔진이 미리 만들어 둔 것)
+def element_relation_2026(day_element):
+    return _profile.relation_text(day_element)
+
+
+# ---------------------------------------------------------
+# 2026 연애운
+# ---------------------------------------------------------
+def love_2026(day_element, counts):
+    fire = counts["화"]
+    water = counts["수"]
+    wood = counts["목"]
+
+    lines = []
+    lines.append(f"### 💖 2026년 연애운 ({YEAR_GANJI})\n")
+    lines.append(element_relation_2026(day_element))
+
+    if fire >= 4:
+        lines.append(
+            "- 화(火)가 매우 강해 감정기복이 커지고 예민해질 수 있는 해입니다.\n"
+            "- 연애 중이라면 **소통 방식이 가장 큰 변수**가 됩니다."
+        )
+    elif water >= 3:
+        lines.append(
+            "- 수(水) 기운이 넉넉해 상대 마음을 잘 읽고 따뜻하게 다가갈 수 있습니다.\n"
+            "- 표현만 조금만 늘려도 훨씬 좋은 흐름이 만들어집니다."
+        )
+    else:
+        lines.append(
+            "- 새로운 인연보다는 **기존 관계가 깊어지는 진심의 해**입니다.\n"
+            "- 과거 인연과 재회할 가능성도 있습니다."
+        )
+
+    if wood == 0:
+        lines.append(
+            "- 목(木) 부족 → 주도성이 약해 타이밍을 놓치기 쉬움.\n"
+            "- 작은 메시지·안부만 먼저 보내도 연애운이 크게 상승합니다."
+        )
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# 2026 재물운
+# ---------------------------------------------------------
+def money_2026(day_element, counts):
+    metal = counts["금"]
+    earth = counts["토"]
+
+    lines = []
+    lines.append("### 💰 2026년 재물운\n")
+    lines.append("- 화(火)의 영향으로 **돈의 흐름이 빠르게 순환**하는 해입니다.")
+
+    if metal >= 4:
+        lines.append(
+            "- 금(金) 강함 → 투자 감각 상승, 숫자 감각 날카로움.\n"
+            "- 단, 욕심이 과하면 손실 위험 커짐. 리스크 관리 필수!"
+        )
+    elif earth >= 3:
+        lines.append(
+            "- 토(土) 많음 → 기반 다지기·저축·부채정리 유리.\n"
+            "- 급하게 투자하기보다 안정적 구조가 유리."
+        )
+    else:
+        lines.append(
+            "- ‘버는 만큼 나가는’ 구조.\n"
+            "- 소비 관리·정기 지출 점검이 핵심."
+        )
+
+    lines.append("- **2026 재테크 키워드:** 현금흐름 관리, 지출 통제, 계약 조항 확인.")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# 2026 직업·커리어운
+# ---------------------------------------------------------
+def job_2026(day_element, counts):
+    wood = counts["목"]
+    fire = counts["화"]
+    metal = counts["금"]
+
+    lines = []
+    lines.append("### 💼 2026년 직업·커리어운\n")
+    lines.append("- 환경 변화가 잦고 새로운 기회가 자주 들어오는 해입니다.")
+
+    if wood >= 3:
+        lines.append(
+            "- 목(木) 강함 → 이직·전직·창업 욕구 증가.\n"
+            "- 상반기 준비·하반기 실행이 이상적."
+        )
+
+    if fire >= 3:
+        lines.append(
+            "- 화(火) 강함 → 영업·교육·홍보·기획 등 ‘사람을 상대하는 직무’에서 성과 상승.\n"
+            "- 과로 주의!"
+        )
+
+    if metal == 0:
+        lines.append(
+            "- 금(金) 부족 → 문서·계약·법적 실수 주의. 서류 2회 검토 필수."
+        )
+    else:
+        lines.append(
+            "- 새로운 사람·조직과의 협력이 많아지고 네트워크 확장이 유리."
+        )
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# 2026 건강운
+# ---------------------------------------------------------
+def health_2026(day_element, counts):
+    fire = counts["화"]
+    water = counts["수"]
+    earth = counts["토"]
+
+    lines = []
+    lines.append("### 💊 2026년 건강운\n")
+    lines.append("- 화(火)는 심장·혈압·눈·신경계와 직접적 관련이 있습니다.")
+
+    if fire >= 4:
+        lines.append(
+            "- 화 과다 → 심혈·혈압 문제 가능성.\n"
+            "- 카페인·야식·스트레스 관리 필수."
+        )
+
+    if water == 0:
+        lines.append(
+            "- 수 부족 → 순환기·신장·방광 불균형.\n"
+            "- 물 섭취·유산소 운동이 큰 도움."
+        )
+
+    if earth >= 3:
+        lines.append(
+            "- 토 과다 → 소화기 부담.\n"
+            "- 밀가루·과식 줄이고 쉽게 소화되는 식단 추천."
+        )
+
+    lines.append("- 작은 습관을 꾸준히 만들면 문제 없이 지나가는 해입니다.")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# 2026 이사·주거운
+# ---------------------------------------------------------
+def moving_2026(day_element, counts):
+    wood = counts["목"]
+    earth = counts["토"]
+
+    lines = []
+    lines.append("### 🏡 2026년 이사·주거운\n")
+    lines.append("- 생활 환경을 정리하거나 바꾸고 싶은 욕구가 커지는 해입니다.")
+
+    if earth >= 4:
+        lines.append(
+            "- 토(土) 강함 → 실제 이사보다 인테리어·정리·개선이 더 유리."
+        )
+    elif wood >= 3:
+        lines.append(
+            "- 목(木) 강함 → 실제 이사 가능성이 큼.\n"
+            "- 채광·통풍·거리·편의성 위주로 선택하면 좋음."
+        )
+    else:
+        lines.append(
+            "- 무난한 이사운이 들어오는 해.\n"
+            "- 계약 조건·보증금만 꼼꼼히 확인!"
+        )
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# 사전 렌더링 해석 테이블
+# ---------------------------------------------------------
+Reading2026 = namedtuple("Reading2026", ["relation", "love", "money", "job", "health", "moving"])
+
+# count_elements 의 합계: 시 모름 = 3기둥 × 2글자, 시 있음 = 4기둥 × 2글자
+COUNT_TOTALS = (6, 8)
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def _counts_dict(counts):
+    return dict(zip(ELEMENTS, counts))
+
+
+def render_reading(day_element, counts):
+    """(일간 오행, [목, 화, 토, 금, 수] 개수) → Reading2026. 해석 함수를 직접 호출한다."""
+    counts = _counts_dict(counts)
+    return Reading2026(
+        element_relation_2026(day_element),
+        love_2026(day_element, counts),
+        money_2026(day_element, counts),
+        job_2026(day_element, counts),
+        health_2026(day_element, counts),
+        moving_2026(day_element, counts),
+    )
+
+
+def reachable_states():
+    """count_elements 가 만들 수 있는 (일간 오행, 개수 튜플) 상태 전체."""
+    for total in COUNT_TOTALS:
+        for head in product(range(total + 1), repeat=4):
+            rest = total - sum(head)
+            if rest < 0:
+                continue
+            counts = head + (rest,)
+            for e, day_element in enumerate(ELEMENTS):
+                # 일간 글자가 자기 오행을 최소 1개 만든다
+                if counts[e] >= 1:
+                    yield day_element, counts
+
+
+def build_fragment_table():
+    """모든 상태의 해석 문구를 미리 만든 읽기 전용 매핑. 같은 문구는 객체 하나를 공유한다."""
+    shared = {}
+    table = {}
+    for day_element, counts in reachable_states():
+        reading = render_reading(day_element, counts)
+        table[(day_element, counts)] = Reading2026(*(shared.setdefault(s, s) for s in reading))
+    return MappingProxyType(table)
+
+
+def fragment_table():
+    """프로세스당 1회 만드는 해석 테이블."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = build_fragment_table()
+    return _table
+
+
+def reading_2026(day_element, counts):
+    """
+    일간 오행 + 오행 개수(딕셔너리 또는 [목, 화, 토, 금, 수] 순서열) → Reading2026.
+    테이블에 없는 상태(직접 만든 개수 등)는 해석 함수로 바로 만든다.
+    """
+    if isinstance(counts, dict):
+        counts = tuple(counts[e] for e in ELEMENTS)
+    else:
+        counts = tuple(counts)
+    reading = fragment_table().get((day_element, counts))
+    if reading is None:
+        reading = render_reading(day_element, counts)
+    return reading
+
+
+# ---------------------------------------------------------
+# 회귀 픽스처 – 전체 상태의 출력을 JSON 으로 저장/대조
+# ---------------------------------------------------------
+def _state_key(day_element, counts):
+    return day_element + "|" + ",".join(map(str, counts))
+
+
+def dump_fixture(path):
+    table = fragment_table()
+    data = {_state_key(*state): list(reading) for state, reading in table.items()}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+    return len(data)
+
+
+def check_fixture(path):
+    """픽스처와 현재 해석 함수 출력을 대조하고 다른 상태 키 목록을 돌려준다."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    table = fragment_table()
+    current = {_state_key(*state): list(reading) for state, reading in table.items()}
+    keys = sorted(set(data) | set(current))
+    return [key for key in keys if data.get(key) != current.get(key)]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] not in ("dump", "check"):
+        print("사용법: python -m saju_engine.fortune_2026 dump|check <fixture.json>")
+        sys.exit(2)
+
+    if sys.argv[1] == "dump":
+        print(f"해석 픽스처 저장: {dump_fixture(sys.argv[2])}개 상태 → {sys.argv[2]}")
+    else:
+        changed = check_fixture(sys.argv[2])
+        for key in changed[:20]:
+            print("변경:", key)
+        print(f"해석 픽스처 대조 완료: 변경 {len(changed)}건")
+        sys.exit(1 if changed else 0)
@@ -0,0 +1,229 @@
+"""
+연도별 세운(歲運) 엔진 – 대상 연도의 연주 기운과 일간의 관계.
+
+오행 상생·상극을 5×5 정수 행렬(GENERATE, CONTROL)로 두고, 두 행렬에서 일간 오행 × 연도 오행
+관계표(RELATION)를 미리 만들어 둡니다. 연도마다 필요한 간지·오행·관계 문구는
+year_profile(year) 가 처음 요청될 때 한 번 만들어 캐시하므로, 한 프로세스에서 2026년·2027년·
+임의 연도 요청을 동시에 받아도 다시 계산하지 않습니다.
+
+    profile = year_profile(2027)
+    profile.ganji                    # '정미'
+    profile.relation("수")           # RELATION_OFFICER (연도 기운이 일간을 극함)
+    profile.relation_text("수")      # 화면용 문구
+    profile.topic_text("love", "수") # 관계별 기본 연애운 문구
+    relation_codes(day_elements, 2027)  # 오행 인덱스 배열 → 관계 코드 배열
+"""
+
+import threading
+
+import numpy as np
+
+from saju_engine.manse_table import GAPJA_NAMES
+from saju_engine.pillars import BRANCH_ELEMENT, ELEMENTS, STEM_ELEMENT
+
+# 앱·서비스가 연도를 따로 주지 않을 때 쓰는 운세 연도
+DEFAULT_YEAR = 2026
+
+ELEMENT_HANJA = ["木", "火", "土", "金", "水"]
+
+# 오행 상생/상극 관계
+generate_map = {
+    "목": "화",
+    "화": "토",
+    "토": "금",
+    "금": "수",
+    "수": "목",
+}
+control_map = {
+    "목": "토",
+    "토": "수",
+    "수": "화",
+    "화": "금",
+    "금": "목",
+}
+
+_INDEX = {e: i for i, e in enumerate(ELEMENTS)}
+
+
+def _matrix(mapping):
+    m = np.zeros((len(ELEMENTS), len(ELEMENTS)), dtype=np.int8)
+    for src, dst in mapping.items():
+        m[_INDEX[src], _INDEX[dst]] = 1
+    m.setflags(write=False)
+    return m
+
+
+# GENERATE[a, b] == 1 : a 가 b 를 생함, CONTROL[a, b] == 1 : a 가 b 를 극함
+GENERATE = _matrix(generate_map)
+CONTROL = _matrix(control_map)
+
+# 일간 기준 연도 기운과의 관계 코드
+RELATION_SAME = 0      # 같은 오행 (비겁)
+RELATION_OUTPUT = 1    # 일간이 연도 기운을 생함 (식상)
+RELATION_RESOURCE = 2  # 연도 기운이 일간을 생함 (인성)
+RELATION_OFFICER = 3   # 연도 기운이 일간을 극함 (관성)
+RELATION_WEALTH = 4    # 일간이 연도 기운을 극함 (재성)
+RELATION_NEUTRAL = 5   # 오행이 아닌 값
+
+
+def _relation_matrix():
+    eye = np.eye(len(ELEMENTS), dtype=np.int8)
+    m = (
+        RELATION_SAME * eye
+        + RELATION_OUTPUT * GENERATE
+        + RELATION_RESOURCE * GENERATE.T
+        + RELATION_OFFICER * CONTROL.T
+        + RELATION_WEALTH * CONTROL
+    ).astype(np.int8)
+    m.setflags(write=False)
+    return m
+
+
+# RELATION[일간 오행, 연도 오행] → 관계 코드
+RELATION = _relation_matrix()
+
+# 관계별 문구 – {year} 는 연도, {element} 는 '화(火)' 같은 오행 표기.
+# 연도 기운이 일간을 극하면(관성) '억누르는', 일간이 연도 기운을 극하면(재성) '다스리는'.
+RELATION_TEMPLATES = {
+    RELATION_SAME: (
+        "{year}년은 당신의 일간과 같은 **{element} 기운이 극대화되는 해**입니다.\n"
+        "자신감·표현력·주도권이 강하게 살아나 스스로 길을 여는 힘이 커집니다."
+    ),
+    RELATION_OUTPUT: (
+        "{year}년의 {element}는 당신이 에너지를 내어 키우는 흐름입니다.\n"
+        "노력 대비 보상이 잘 들어오지만 체력 소모가 큰 해이니 균형이 필요합니다."
+    ),
+    RELATION_RESOURCE: (
+        "{year}년은 {element}가 당신을 도와주는 구조입니다.\n"
+        "귀인 등장·제안·기회·협력 같은 긍정적 흐름이 잘 들어오는 해입니다."
+    ),
+    RELATION_OFFICER: (
+        "{element}가 당신을 억누르는 구조라, 과도한 스트레스나 경쟁이 생기기 쉽습니다.\n"
+        "큰 욕심보다 안정적인 전략이 더 유리한 해입니다."
+    ),
+    RELATION_WEALTH: (
+        "{year}년은 {element} 기운을 다스리는 위치가 됩니다.\n"
+        "리더십·관리·조율 능력이 필요하며 중요한 역할을 맡게 될 수 있습니다."
+    ),
+    RELATION_NEUTRAL: (
+        "{year}년의 {element}는 당신에게 중립적인 흐름입니다.\n"
+        "큰 변동보다 꾸준함이 힘을 발휘하는 해입니다."
+    ),
+}
+
+# 연도별 전용 문구가 없을 때 쓰는 관계별 기본 운세
+TOPICS = ("love", "wealth", "career", "health", "move")
+TOPIC_TEMPLATES = {
+    "love": {
+        RELATION_SAME: "- 나와 닮은 사람에게 끌리기 쉬운 해입니다. 고집을 조금 내려놓으면 관계가 편안해집니다.",
+        RELATION_OUTPUT: "- 표현력이 살아나 먼저 다가가기 좋은 해입니다. 다만 말이 앞서지 않도록 속도를 맞추세요.",
+        RELATION_RESOURCE: "- 주변의 소개·도움으로 인연이 이어지기 쉬운 해입니다. 편안한 관계가 오래 갑니다.",
+        RELATION_OFFICER: "- 책임감 있는 관계가 들어오거나 관계에 부담을 느끼기 쉬운 해입니다. 기대치를 솔직하게 나누세요.",
+        RELATION_WEALTH: "- 현실적인 조건을 따지게 되는 해입니다. 마음과 조건의 균형을 잡는 것이 핵심입니다.",
+    },
+    "wealth": {
+        RELATION_SAME: "- 경쟁자·동료와 돈이 얽히기 쉬운 해입니다. 동업·보증·빌려주는 돈은 신중하게.",
+        RELATION_OUTPUT: "- 재능과 노력이 수입으로 이어지는 해입니다. 들어온 만큼 지출도 늘 수 있어 관리가 필요합니다.",
+        RELATION_RESOURCE: "- 큰 돈보다는 문서·자격·지원처럼 기반이 되는 자산이 늘어나는 해입니다.",
+        RELATION_OFFICER: "- 고정 지출·세금·의무 지출이 커지기 쉬운 해입니다. 보수적인 자금 운용이 유리합니다.",
+        RELATION_WEALTH: "- 재물 기회가 직접 눈에 들어오는 해입니다. 욕심을 조절하면 실속을 챙길 수 있습니다.",
+    },
+    "career": {
+        RELATION_SAME: "- 독립·주도적인 업무가 늘어나는 해입니다. 협업에서는 역할 분담을 분명히 하세요.",
+        RELATION_OUTPUT: "- 기획·표현·창작 업무에서 성과가 잘 드러나는 해입니다.",
+        RELATION_RESOURCE: "- 배움·자격·준비에 힘을 쓰기 좋은 해입니다. 윗사람의 도움을 받기 쉽습니다.",
+        RELATION_OFFICER: "- 책임과 평가가 커지는 해입니다. 규칙과 절차를 지키면 승진·인정으로 이어질 수 있습니다.",
+        RELATION_WEALTH: "- 성과가 숫자로 확인되는 해입니다. 관리·영업·운영 업무에서 능력을 발휘합니다.",
+    },
+    "health": {
+        RELATION_SAME: "- 에너지가 넘쳐 무리하기 쉬운 해입니다. 휴식 리듬을 먼저 정해 두세요.",
+        RELATION_OUTPUT: "- 기운을 많이 쓰는 해라 피로가 쌓이기 쉽습니다. 수면과 식사를 규칙적으로.",
+        RELATION_RESOURCE: "- 회복력이 좋은 해입니다. 다만 활동량이 줄지 않도록 가벼운 운동을 유지하세요.",
+        RELATION_OFFICER: "- 스트레스가 몸으로 드러나기 쉬운 해입니다. 긴장을 푸는 습관이 중요합니다.",
+        RELATION_WEALTH: "- 일 욕심으로 체력을 소모하기 쉬운 해입니다. 정기 검진을 챙기세요.",
+    },
+    "move": {
+        RELATION_SAME: "- 지금 자리를 지키려는 마음과 바꾸려는 마음이 함께 드는 해입니다. 서두르지 않아도 됩니다.",
+        RELATION_OUTPUT: "- 생활 공간을 새롭게 꾸미고 싶은 욕구가 커지는 해입니다.",
+        RELATION_RESOURCE: "- 가족·집안의 도움으로 주거 문제가 풀리기 쉬운 해입니다.",
+        RELATION_OFFICER: "- 직장·의무 때문에 이동이 생길 수 있는 해입니다. 계약 조건을 꼼꼼히 확인하세요.",
+        RELATION_WEALTH: "- 집·부동산을 현실적으로 따져 보게 되는 해입니다. 비용 계획부터 세우면 좋습니다.",
+    },
+}
+
+
+def element_label(element: str) -> str:
+    """'화' → '화(火)'."""
+    i = _INDEX.get(element)
+    return element if i is None else f"{element}({ELEMENT_HANJA[i]})"
+
+
+def year_gapja(year: int) -> int:
+    """양력 연도 → 그해 연주 60갑자 인덱스 (입춘 이후 기준)."""
+    return (year - 4) % 60
+
+
+# ---------------------------------------------------------
+# 연도별 자원 (한 번 만들어 캐시)
+# ---------------------------------------------------------
+class YearProfile:
+    """대상 연도의 연주와, 일간 오행 5가지 각각에 대한 관계 코드·문구를 미리 만든 객체."""
+
+    __slots__ = ("year", "gapja", "ganji", "element", "branch_element",
+                 "relations", "relation_texts", "topic_texts")
+
+    def __init__(self, year: int):
+        self.year = year
+        self.gapja = year_gapja(year)
+        self.ganji = GAPJA_NAMES[self.gapja]
+        self.element = ELEMENTS[STEM_ELEMENT[self.gapja % 10]]
+        self.branch_element = ELEMENTS[BRANCH_ELEMENT[self.gapja % 12]]
+
+        col = _INDEX[self.element]
+        self.relations = tuple(int(code) for code in RELATION[:, col])
+        label = element_label(self.element)
+        self.relation_texts = tuple(
+            RELATION_TEMPLATES[code].format(year=year, element=label) for code in self.relations
+        )
+        self.topic_texts = {
+            topic: tuple(TOPIC_TEMPLATES[topic][code] for code in self.relations) for topic in TOPICS
+        }
+
+    def relation(self, day_element: str) -> int:
+        i = _INDEX.get(day_element)
+        return RELATION_NEUTRAL if i is None else self.relations[i]
+
+    def relation_text(self, day_element: str) -> str:
+        i = _INDEX.get(day_element)
+        if i is None:
+            return RELATION_TEMPLATES[RELATION_NEUTRAL].format(
+                year=self.year, element=element_label(self.element))
+        return self.relation_texts[i]
+
+    def topic_text(self, topic: str, day_element: str) -> str:
+        i = _INDEX.get(day_element)
+        return "" if i is None else self.topic_texts[topic][i]
+
+    def __repr__(self):
+        return f"YearProfile({self.year} {self.ganji}, {self.element})"
+
+
+_profiles = {}
+_profiles_lock = threading.Lock()
+
+
+def year_profile(year: int) -> YearProfile:
+    """연도별 YearProfile (프로세스당 연도마다 1회 생성)."""
+    profile = _profiles.get(year)
+    if profile is None:
+        with _profiles_lock:
+            profile = _profiles.get(year)
+            if profile is None:
+                profile = _profiles[year] = YearProfile(year)
+    return profile
+
+
+def relation_codes(day_elements, year: int):
+    """일간 오행 인덱스 배열(0~4) → 관계 코드 int8 배열."""
+    col = _INDEX[year_profile(year).element]
+    return RELATION[np.asarray(day_elements, dtype=np.int64), col]
@@ -0,0 +1,89 @@
+"""
+시주(時柱) 계산 – 두 앱과 배치 경로가 함께 쓰는 조회 테이블.
+
+- HOUR_BRANCH_TABLE[시]            : 0~23시 → 시지 인덱스 (23시·0시 = 자시)
+- HOUR_STEM_TABLE[일간][시지]       : 10×12 시간 인덱스 (갑기일 갑자시, 을경일 병자시, ...)
+- minute_branch_table(offset)[분]   : 하루 1440분 → 시지 인덱스 (경계를 offset 분만큼 민 표)
+- HOUR_LABELS                       : 만세력 앱 선택 상자 문구 ("23:00~01:00 (자시)" ...)
+
+예전 두 앱 구현과의 차등 테스트는 tests/test_hours.py 에 있습니다.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from saju_engine.manse_table import earthly_branches, gapja_index
+
+HOUR_BRANCH_TABLE = tuple((hour + 1) // 2 % 12 for hour in range(24))
+
+HOUR_STEM_TABLE = tuple(
+    tuple((day_stem * 2 + branch) % 10 for branch in range(12))
+    for day_stem in range(10)
+)
+
+HOUR_BRANCH_ARRAY = np.array(HOUR_BRANCH_TABLE, dtype=np.int8)
+HOUR_STEM_ARRAY = np.array(HOUR_STEM_TABLE, dtype=np.int8)
+
+HOUR_LABELS = [
+    f"{(2 * b - 1) % 24:02d}:00~{(2 * b + 1) % 24:02d}:00 ({earthly_branches[b]}시)"
+    for b in range(12)
+]
+HOUR_LABEL_TO_BRANCH = {label: b for b, label in enumerate(HOUR_LABELS)}
+
+
+@lru_cache(maxsize=8)
+def minute_branch_table(offset_minutes: int = 0) -> tuple:
+    """
+    하루 1440분 → 시지 인덱스 표.
+    offset_minutes 만큼 경계를 늦춘다 (예: 30 이면 자시 = 23:30~01:30).
+    """
+    return tuple((minute - offset_minutes + 60) % 1440 // 120 % 12 for minute in range(1440))
+
+
+# ---------------------------------------------------------
+# 단일 조회
+# ---------------------------------------------------------
+def hour_branch(hour: int, minute: int = 0, offset_minutes: int = 0) -> int:
+    """태어난 시(·분) → 시지 인덱스."""
+    if offset_minutes == 0:
+        return HOUR_BRANCH_TABLE[hour]
+    return minute_branch_table(offset_minutes)[hour * 60 + minute]
+
+
+def hour_stem(day_stem: int, branch: int) -> int:
+    """일간 인덱스 + 시지 인덱스 → 시간 인덱스."""
+    return HOUR_STEM_TABLE[day_stem][branch]
+
+
+def hour_gapja(day_gapja: int, branch: int) -> int:
+    """일주 60갑자 인덱스 + 시지 인덱스 → 시주 60갑자 인덱스."""
+    return gapja_index(HOUR_STEM_TABLE[day_gapja % 10][branch], branch)
+
+
+def branch_hour(branch: int) -> int:
+    """시지 인덱스 → 그 시의 가운데 시각(시). 자시 = 0시, 축시 = 2시, ..."""
+    return branch * 2 % 24
+
+
+def label_to_branch(label: str):
+    """선택 상자 문구 → 시지 인덱스. '모름' 등 목록에 없는 값은 None."""
+    return HOUR_LABEL_TO_BRANCH.get(label)
+
+
+# ---------------------------------------------------------
+# 배열 조회
+# ---------------------------------------------------------
+def hour_pillar_batch(day_stems, hours):
+    """
+    일간 인덱스 배열 + 시(0~23, 모르면 -1) 배열 → (시간 int8, 시지 int8). 모르는 시는 -1.
+    """
+    day_stems = np.asarray(day_stems)
+    hours = np.asarray(hours)
+    known = (hours >= 0) & (hours < 24) & (day_stems >= 0)
+
+    branches = HOUR_BRANCH_ARRAY[np.where(known, hours, 0)]
+    stems = HOUR_STEM_ARRAY[np.where(known, day_stems, 0), branches]
+    branches[~known] = -1
+    stems[~known] = -1
+    return stems, branches
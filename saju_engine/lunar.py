@@ -0,0 +1,173 @@
+"""
+음력 ↔ 양력 변환 – 만세력 테이블에서 만든 양방향 배열로 O(1) 조회.
+
+- 양력 → 음력: 만세력 테이블 레코드의 음력 연·월·일·윤달 필드를 그대로 읽는다 (mmap, 복사 없음).
+- 음력 → 양력: 음력 날짜 키마다 양력 ordinal 을 담은 int32 배열(solar_by_lunar())을
+  테이블에서 한 번 만들어 두고 인덱싱한다 (약 3MB, 배열 연산 몇 번이라 수십 ms).
+
+    음력 키 = ((연 − FIRST_LUNAR_YEAR) × 12 + (월 − 1)) × 2 + 윤달) × 30 + (일 − 1)
+
+KoreanLunarCalendar.setLunarDate 와 같은 결과를 돌려주되, 없는 날짜(작은달 30일, 윤달이
+없는 해의 윤달 등)는 None / NaT 입니다. 라이브러리는 음력 1582-09-09 ~ 09-18 을 그레고리력
+개정으로 없어진 양력 1582-10-05 ~ 10-14 로 바꾸는데, 이 날짜들도 없는 날짜로 취급합니다.
+양력 테이블이 2050-12-31 에서 끝나므로 음력은 LAST_LUNAR_DATE(2050년 11월 18일)까지입니다.
+그 뒤 날짜는 lunar_in_range() 로 '없는 날짜'와 구분할 수 있습니다.
+
+    lunar_to_solar(1990, 4, 23)             # date(1990, 5, 17)
+    lunar_to_solar(2017, 5, 1, leap=True)   # date(2017, 6, 24)
+    solar_to_lunar(date(2017, 6, 24))       # LunarDate(2017, 5, 1, True)
+    lunar_to_solar_batch(years, months, days, leaps)   # datetime64[D] 배열
+"""
+
+import re
+import threading
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+
+from saju_engine import manse_table
+from saju_engine.day_pillar import EPOCH_ORDINAL, to_ordinals
+
+LunarDate = namedtuple("LunarDate", ["year", "month", "day", "leap"])
+
+FIRST_LUNAR_YEAR = 1000
+LAST_LUNAR_YEAR = 2050
+# 양력 테이블 범위(manse_table.MIN_DATE ~ MAX_DATE)에 해당하는 첫·마지막 음력 날짜
+FIRST_LUNAR_DATE = LunarDate(1000, 1, 1, False)
+LAST_LUNAR_DATE = LunarDate(2050, 11, 18, False)
+KEY_COUNT = (LAST_LUNAR_YEAR - FIRST_LUNAR_YEAR + 1) * 12 * 2 * 30
+
+# '1990-04-23', '1990-04-23 윤', '윤 1990-04-23', '1990-윤04-23', '2017-05-01 Intercalation'
+LUNAR_TEXT = re.compile(
+    r"^\s*(?P<pre>윤(?:달|월)?\s*)?(?P<year>\d{1,4})-(?P<mid>윤)?(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+    r"\s*(?P<post>\(?(?:윤(?:달|월)?|Intercalation)\)?)?\s*$"
+)
+_LEAP_VALUES = {"1", "true", "t", "y", "yes", "윤", "윤달", "윤월", "o"}
+
+_solar_by_lunar = None
+_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# 음력 → 양력 배열
+# ---------------------------------------------------------
+def lunar_keys(years, months, days, leaps) -> np.ndarray:
+    """음력 연·월·일·윤달 배열 → 음력 키 int64 배열 (범위 밖이면 -1)."""
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    leaps = np.asarray(leaps, dtype=bool).astype(np.int64)
+    valid = ((years >= FIRST_LUNAR_YEAR) & (years <= LAST_LUNAR_YEAR)
+             & (months >= 1) & (months <= 12) & (days >= 1) & (days <= 30))
+    keys = (((years - FIRST_LUNAR_YEAR) * 12 + (months - 1)) * 2 + leaps) * 30 + (days - 1)
+    return np.where(valid, keys, -1)
+
+
+def build_solar_by_lunar() -> np.ndarray:
+    """만세력 테이블 → 음력 키별 양력 ordinal int32 배열 (없는 날짜 -1)."""
+    records = manse_table.records()
+    ordinals = np.arange(manse_table.DAY_COUNT, dtype=np.int64) + manse_table.BASE_ORDINAL
+    gap_start, gap_end = manse_table.GREGORIAN_GAP
+    keep = (ordinals < gap_start) | (ordinals > gap_end)
+    records, ordinals = records[keep], ordinals[keep]
+
+    leap = records["flags"] & manse_table.FLAG_INTERCALATION
+    keys = lunar_keys(records["lunar_year"], records["lunar_month"], records["lunar_day"], leap)
+    table = np.full(KEY_COUNT, -1, dtype=np.int32)
+    table[keys] = ordinals
+    table.setflags(write=False)
+    return table
+
+
+def solar_by_lunar() -> np.ndarray:
+    """프로세스당 한 번 만드는 음력 키 → 양력 ordinal 배열."""
+    global _solar_by_lunar
+    if _solar_by_lunar is None:
+        with _lock:
+            if _solar_by_lunar is None:
+                _solar_by_lunar = build_solar_by_lunar()
+    return _solar_by_lunar
+
+
+# ---------------------------------------------------------
+# 한 건
+# ---------------------------------------------------------
+def lunar_to_solar(year: int, month: int, day: int, leap: bool = False):
+    """음력 날짜(윤달이면 leap=True) → 양력 date. 없는 날짜거나 범위 밖이면 None."""
+    key = int(lunar_keys(year, month, day, leap))
+    if key < 0:
+        return None
+    ordinal = int(solar_by_lunar()[key])
+    return date.fromordinal(ordinal) if ordinal >= 0 else None
+
+
+def lunar_in_range(year: int, month: int, day: int, leap: bool = False) -> bool:
+    """음력 날짜가 FIRST_LUNAR_DATE ~ LAST_LUNAR_DATE 안인지 (실제로 있는 날짜인지는 따지지 않음)."""
+    def order(d):
+        return d.year, d.month, bool(d.leap), d.day   # 윤달은 같은 숫자의 평달 다음
+    return order(FIRST_LUNAR_DATE) <= order(LunarDate(year, month, day, leap)) <= order(LAST_LUNAR_DATE)
+
+
+def solar_to_lunar(value: date):
+    """양력 date → LunarDate. 범위 밖이거나 없는 날짜면 None."""
+    entry = manse_table.lunar_date(value.year, value.month, value.day)
+    return LunarDate(*entry) if entry is not None else None
+
+
+def lunar_label(lunar: LunarDate) -> str:
+    """LunarDate → '1990년 4월 23일' / '2017년 윤5월 1일'."""
+    leap = "윤" if lunar.leap else ""
+    return f"{lunar.year}년 {leap}{lunar.month}월 {lunar.day}일"
+
+
+# ---------------------------------------------------------
+# 배열 (CSV 파이프라인용)
+# ---------------------------------------------------------
+def lunar_to_solar_batch(years, months, days, leaps=None) -> np.ndarray:
+    """음력 연·월·일·윤달 배열 → 양력 datetime64[D] 배열 (없는 날짜 NaT)."""
+    if leaps is None:
+        leaps = np.zeros(np.shape(years), dtype=bool)
+    keys = lunar_keys(years, months, days, leaps)
+    ordinals = np.where(keys >= 0, solar_by_lunar()[np.maximum(keys, 0)], -1).astype(np.int64)
+    out = (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+    out[ordinals < 0] = np.datetime64("NaT")
+    return out
+
+
+def solar_to_lunar_batch(dates) -> np.ndarray:
+    """양력 날짜 배열(datetime64 또는 ordinal) → (연, 월, 일, 윤달) 구조화 배열 (범위 밖은 연 0)."""
+    ordinals = to_ordinals(dates)
+    offsets = ordinals - manse_table.BASE_ORDINAL
+    gap_start, gap_end = manse_table.GREGORIAN_GAP
+    valid = (offsets >= 0) & (offsets < manse_table.DAY_COUNT) & ((ordinals < gap_start) | (ordinals > gap_end))
+    rows = manse_table.records()[np.where(valid, offsets, 0)]
+
+    out = np.zeros(len(ordinals), dtype=[("year", np.int16), ("month", np.int8), ("day", np.int8),
+                                         ("leap", np.bool_)])
+    out["year"] = np.where(valid, rows["lunar_year"], 0)
+    out["month"] = np.where(valid, rows["lunar_month"], 0)
+    out["day"] = np.where(valid, rows["lunar_day"], 0)
+    out["leap"] = valid & (rows["flags"] & manse_table.FLAG_INTERCALATION).astype(bool)
+    return out
+
+
+def parse_lunar_column(values, leap_values=None):
+    """
+    음력 날짜 문자열 열(pandas Series) + 윤달 열(없으면 None) → (양력 datetime64[D] 배열, 형식 오류 마스크).
+    윤달은 윤달 열('1', 'true', '윤' 등) 또는 날짜 문자열의 '윤' 표시로 지정한다.
+    형식은 맞지만 없는 음력 날짜는 NaT 이고 형식 오류 마스크에는 들어가지 않는다.
+    """
+    import pandas as pd
+
+    parts = values.astype("string").str.extract(LUNAR_TEXT)
+    bad = parts["year"].isna().to_numpy()
+    numbers = parts[["year", "month", "day"]].apply(pd.to_numeric).fillna(0).to_numpy(dtype=np.int64)
+    leap = parts[["pre", "mid", "post"]].notna().any(axis=1).to_numpy()
+    if leap_values is not None:
+        text = leap_values.astype("string").str.strip().str.lower().fillna("")
+        leap = leap | text.isin(_LEAP_VALUES).to_numpy()
+
+    solar = lunar_to_solar_batch(numbers[:, 0], numbers[:, 1], numbers[:, 2], leap)
+    solar[bad] = np.datetime64("NaT")
+    return solar, bad
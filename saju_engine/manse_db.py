@@ -0,0 +1,346 @@
+"""
+만세력 SQLite 내보내기 – BI·리포팅 도구가 SQL 로 달력 데이터를 조회할 수 있게 한다.
+
+만세력 테이블(KoreanLunarCalendar 와 같은 결과)의 모든 날짜를 한 트랜잭션으로 넣고,
+간지 열마다 ManseDB.days() 가 읽는 열을 모두 담은 커버링 인덱스를 만들어, 간지 조건 질의가
+테이블을 읽지 않고 인덱스만으로 끝납니다(EXPLAIN QUERY PLAN 의 'USING COVERING INDEX').
+기간만 주는 질의는 ordinal(rowid) 범위로 테이블 B-tree 를 바로 읽습니다.
+
+    manse(ordinal PK, solar_date, lunar_year, lunar_month, lunar_day, leap,
+          year_gapja, month_gapja, day_gapja)        간지는 60갑자 인덱스 0~59
+    gapja(idx PK, ganji, stem, branch)                인덱스 → '병오' 같은 이름
+    manse_named                                       간지 이름을 붙인 뷰 (BI 도구용)
+    manse_meta(key, value)                            형식 버전·범위·원본 테이블 체크섬
+
+    python -m saju_engine.manse_db build [경로]
+    python -m saju_engine.manse_db days --day 갑자 --from 2026-01-01 --to 2026-12-31
+    python -m saju_engine.manse_db months --month 병오 --from-year 1900 --to-year 2050
+
+    with ManseDB() as db:
+        db.days(day="갑자", start=date(2026, 1, 1), end=date(2026, 12, 31))
+        db.months("병오", 1900, 2050)
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+
+from saju_engine import manse_table
+from saju_engine.day_pillar import EPOCH_ORDINAL
+from saju_engine.manse_table import GAPJA_NAMES, earthly_branches, heavenly_stems
+
+SCHEMA_VERSION = 2
+
+DEFAULT_DB_PATH = os.environ.get(
+    "SAJU_MANSE_DB",
+    os.path.join(os.path.dirname(__file__), "data", "manse.sqlite"),
+)
+
+SCHEMA = """
+CREATE TABLE manse (
+    ordinal     INTEGER PRIMARY KEY,
+    solar_date  TEXT    NOT NULL,
+    lunar_year  INTEGER NOT NULL,
+    lunar_month INTEGER NOT NULL,
+    lunar_day   INTEGER NOT NULL,
+    leap        INTEGER NOT NULL,
+    year_gapja  INTEGER NOT NULL,
+    month_gapja INTEGER NOT NULL,
+    day_gapja   INTEGER NOT NULL
+);
+CREATE TABLE gapja (
+    idx    INTEGER PRIMARY KEY,
+    ganji  TEXT NOT NULL UNIQUE,
+    stem   TEXT NOT NULL,
+    branch TEXT NOT NULL
+);
+CREATE TABLE manse_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE VIEW manse_named AS
+    SELECT m.solar_date, m.lunar_year, m.lunar_month, m.lunar_day, m.leap,
+           y.ganji AS year_ganji, mo.ganji AS month_ganji, d.ganji AS day_ganji
+    FROM manse m
+    JOIN gapja y ON y.idx = m.year_gapja
+    JOIN gapja mo ON mo.idx = m.month_gapja
+    JOIN gapja d ON d.idx = m.day_gapja;
+"""
+
+# 인덱스는 데이터를 다 넣은 뒤에 만든다 (한 번에 정렬해서 만드는 편이 훨씬 빠름).
+# 모든 인덱스에는 rowid(= ordinal)가 함께 들어가므로 ordinal 은 따로 넣지 않는다.
+# 간지 인덱스는 (간지, 양력일) 뒤에 days() 가 읽는 나머지 열을 모두 붙여 커버링 인덱스로 만든다.
+# manse_month 는 months() 의 (음력 연·월·윤달, 양력일) 순서가 먼저다.
+INDEXES = """
+CREATE UNIQUE INDEX manse_solar_date ON manse (solar_date);
+CREATE INDEX manse_year  ON manse (year_gapja, solar_date,
+                                   lunar_year, lunar_month, lunar_day, leap, month_gapja, day_gapja);
+CREATE INDEX manse_month ON manse (month_gapja, lunar_year, lunar_month, leap, solar_date,
+                                   lunar_day, year_gapja, day_gapja);
+CREATE INDEX manse_day   ON manse (day_gapja, solar_date,
+                                   lunar_year, lunar_month, lunar_day, leap, year_gapja, month_gapja);
+CREATE INDEX manse_lunar ON manse (lunar_year, lunar_month, leap, lunar_day, solar_date);
+"""
+
+DayRow = namedtuple("DayRow", ["solar_date", "lunar_year", "lunar_month", "lunar_day", "leap",
+                               "year_ganji", "month_ganji", "day_ganji"])
+MonthRow = namedtuple("MonthRow", ["lunar_year", "lunar_month", "leap", "start", "end"])
+
+_GANJI_INDEX = {name: i for i, name in enumerate(GAPJA_NAMES)}
+
+
+# ---------------------------------------------------------
+# 내보내기
+# ---------------------------------------------------------
+def _rows():
+    """만세력 테이블 → INSERT 용 튜플 목록 (그레고리력 공백 제외)."""
+    records = manse_table.records()
+    ordinals = np.arange(manse_table.DAY_COUNT, dtype=np.int64) + manse_table.BASE_ORDINAL
+    gap_start, gap_end = manse_table.GREGORIAN_GAP
+    keep = (ordinals < gap_start) | (ordinals > gap_end)
+    records, ordinals = records[keep], ordinals[keep]
+
+    solar = (ordinals - EPOCH_ORDINAL).astype("datetime64[D]").astype(str)
+    leap = (records["flags"] & manse_table.FLAG_INTERCALATION).astype(bool)
+    columns = (ordinals, solar, records["lunar_year"], records["lunar_month"], records["lunar_day"],
+               leap, records["year"], records["month"], records["day"])
+    return list(zip(*(column.tolist() for column in columns)))
+
+
+def _execute_script(conn, script: str):
+    # executescript() 는 열린 트랜잭션을 먼저 COMMIT 하므로 문장을 하나씩 실행한다
+    for statement in script.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+
+
+def build_database(path: str = DEFAULT_DB_PATH) -> int:
+    """
+    SQLite 파일을 새로 만든다. 같은 폴더의 고유한 임시 파일에 한 트랜잭션으로 넣고 인덱스·통계까지
+    만든 뒤 os.replace 로 바꿔 끼우므로, 만드는 동안에도 기존 파일을 읽는 도구는 영향을 받지 않고
+    여러 프로세스가 동시에 만들어도 서로의 임시 파일을 건드리지 않는다. 넣은 날짜 수를 돌려준다.
+    """
+    rows = _rows()
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + ".",
+                                     suffix=".tmp", delete=False) as f:
+        tmp_path = f.name   # 빈 파일은 SQLite 가 새 데이터베이스로 연다
+
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        # 새 파일이라 실패하면 버리면 되므로 저널·동기화는 끈다
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("BEGIN")
+        _execute_script(conn, SCHEMA)
+        conn.executemany("INSERT INTO manse VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT INTO gapja VALUES (?, ?, ?, ?)",
+                         [(i, GAPJA_NAMES[i], heavenly_stems[i % 10], earthly_branches[i % 12])
+                          for i in range(60)])
+        meta = {
+            "schema_version": SCHEMA_VERSION,
+            "table_format_version": manse_table.FORMAT_VERSION,
+            "first_date": rows[0][1],
+            "last_date": rows[-1][1],
+            "day_count": len(rows),
+            "table_crc32": manse_table.table_checksum(),
+        }
+        conn.executemany("INSERT INTO manse_meta VALUES (?, ?)", [(k, str(v)) for k, v in meta.items()])
+        _execute_script(conn, INDEXES)
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+    except BaseException:
+        conn.close()
+        os.remove(tmp_path)
+        raise
+    conn.close()
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+# ---------------------------------------------------------
+# 조회
+# ---------------------------------------------------------
+def gapja_value(value) -> int:
+    """'병오' 또는 0~59 → 60갑자 인덱스."""
+    if isinstance(value, str):
+        if value.strip() not in _GANJI_INDEX:
+            raise ValueError(f"간지로 쓸 수 없습니다: {value}")
+        return _GANJI_INDEX[value.strip()]
+    number = int(value)
+    if not 0 <= number < 60:
+        raise ValueError(f"60갑자 인덱스는 0~59 사이여야 합니다: {value}")
+    return number
+
+
+def _iso(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _ordinal(value) -> int:
+    return (value if isinstance(value, date) else date.fromisoformat(value)).toordinal()
+
+
+def _file_meta(path: str) -> dict:
+    """파일의 manse_meta 전체 (읽을 수 없으면 빈 딕셔너리)."""
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            return dict(conn.execute("SELECT key, value FROM manse_meta"))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+
+
+def _schema_version(path: str):
+    """파일의 manse_meta.schema_version (읽을 수 없으면 None)."""
+    value = _file_meta(path).get("schema_version")
+    return int(value) if value is not None else None
+
+
+def _is_current(path: str) -> bool:
+    """지금 스키마이고, 지금 불러온 만세력 테이블로 만든 파일인지."""
+    meta = _file_meta(path)
+    return (meta.get("schema_version") == str(SCHEMA_VERSION)
+            and meta.get("table_crc32") == str(manse_table.table_checksum()))
+
+
+class ManseDB:
+    """
+    읽기 전용 질의 API. 파일이 없으면 만세력 테이블로 먼저 만든다.
+    커넥션은 만든 스레드에서만 쓴다 (sqlite3 기본 동작).
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        if not os.path.exists(path) or not _is_current(path):
+            # 없거나, 예전 스키마(커버링이 아닌 인덱스)거나, 다른 만세력 테이블로 만든 파일이면 다시 만든다
+            try:
+                build_database(path)
+            except OSError:
+                if not os.path.exists(path):
+                    raise
+                # 읽기 전용 배포 환경이면 있는 파일을 그대로 쓴다
+        self.path = path
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def meta(self) -> dict:
+        return dict(self.conn.execute("SELECT key, value FROM manse_meta"))
+
+    def days(self, year=None, month=None, day=None, start=None, end=None):
+        """
+        간지 조건(연·월·일, 이름 또는 인덱스)과 양력 기간(양끝 포함)에 맞는 날짜 → DayRow 목록.
+        간지 조건이 있으면 해당 커버링 인덱스만 읽고, 기간만 있으면 ordinal(rowid) 범위로 읽는다.
+        """
+        where, params = [], []
+        for column, value in (("year_gapja", year), ("month_gapja", month), ("day_gapja", day)):
+            if value is not None:
+                where.append(f"m.{column} = ?")
+                params.append(gapja_value(value))
+        # 간지 인덱스는 (간지, 양력일, …) 순서라 기간은 solar_date 로 건다
+        date_column, to_key = ("m.solar_date", _iso) if where else ("m.ordinal", _ordinal)
+        if start is not None:
+            where.append(f"{date_column} >= ?")
+            params.append(to_key(start))
+        if end is not None:
+            where.append(f"{date_column} <= ?")
+            params.append(to_key(end))
+        if not where:
+            raise ValueError("조건이나 기간을 하나 이상 지정해야 합니다.")
+
+        sql = (
+            "SELECT m.solar_date, m.lunar_year, m.lunar_month, m.lunar_day, m.leap, "
+            "y.ganji, mo.ganji, d.ganji FROM manse m "
+            "JOIN gapja y ON y.idx = m.year_gapja "
+            "JOIN gapja mo ON mo.idx = m.month_gapja "
+            "JOIN gapja d ON d.idx = m.day_gapja "
+            "WHERE " + " AND ".join(where) + f" ORDER BY {date_column}"
+        )
+        return [DayRow(s, ly, lm, ld, bool(leap), yg, mg, dg)
+                for s, ly, lm, ld, leap, yg, mg, dg in self.conn.execute(sql, params)]
+
+    def months(self, month, first_year: int, last_year: int):
+        """
+        월 간지가 month 인 음력 달 목록 (음력 연도 first_year ~ last_year) → MonthRow.
+        만세력 테이블의 월 간지는 음력 월 기준이므로 기간도 음력 연도로 준다.
+        """
+        sql = (
+            "SELECT lunar_year, lunar_month, leap, MIN(solar_date), MAX(solar_date) FROM manse "
+            "WHERE month_gapja = ? AND lunar_year BETWEEN ? AND ? "
+            "GROUP BY lunar_year, lunar_month, leap ORDER BY lunar_year, lunar_month, leap"
+        )
+        rows = self.conn.execute(sql, (gapja_value(month), first_year, last_year))
+        return [MonthRow(y, m, bool(leap), start, end) for y, m, leap, start, end in rows]
+
+    def explain(self, sql: str, params=()):
+        """질의 계획 (인덱스를 타는지 확인용)."""
+        return [row[-1] for row in self.conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+# ---------------------------------------------------------
+# 명령행
+# ---------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="만세력 SQLite 내보내기·조회")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite 파일 경로")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="데이터베이스 새로 만들기")
+    build.add_argument("path", nargs="?", help="출력 경로 (기본 --db)")
+
+    days = commands.add_parser("days", help="간지 조건에 맞는 날짜")
+    days.add_argument("--year")
+    days.add_argument("--month")
+    days.add_argument("--day")
+    days.add_argument("--from", dest="start", type=date.fromisoformat)
+    days.add_argument("--to", dest="end", type=date.fromisoformat)
+
+    months = commands.add_parser("months", help="월 간지가 같은 음력 달")
+    months.add_argument("--month", required=True)
+    months.add_argument("--from-year", type=int, default=manse_table.MIN_DATE.year)
+    months.add_argument("--to-year", type=int, default=manse_table.MAX_DATE.year)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        path = args.path or args.db
+        started = time.perf_counter()
+        count = build_database(path)
+        print(f"저장 완료: {path} ({count:,}일, {time.perf_counter() - started:.1f}초)")
+        return 0
+
+    with ManseDB(args.db) as db:
+        started = time.perf_counter()
+        try:
+            if args.command == "days":
+                rows = db.days(args.year, args.month, args.day, args.start, args.end)
+            else:
+                rows = db.months(args.month, args.from_year, args.to_year)
+        except ValueError as e:
+            parser.error(str(e))
+        elapsed = (time.perf_counter() - started) * 1000
+        for row in rows:
+            print(*row, sep="\t")
+        print(f"{len(rows):,}건, {elapsed:.1f}ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+"""
+사전 계산된 만세력 테이블.
+
+KoreanLunarCalendar 가 지원하는 양력 전 범위(1000-02-13 ~ 2050-12-31)의 하루하루에 대해
+연·월·일 60갑자 인덱스(0~59), 윤달 여부, 음력 날짜를 8바이트 고정 길이 레코드로 저장합니다.
+
+    헤더(32바이트) = 매직 b"SAJUMANS", 버전, 레코드 크기, 첫 날짜 ordinal, 일수, 레코드 CRC32
+    레코드         = [연 간지, 월 간지, 일 간지, 플래그(bit0 = 윤달), 음력 연(uint16 LE), 음력 월, 음력 일]
+
+레코드 위치는 날짜의 ordinal 과 기준일(1000-02-13)의 차이이므로 조회는 O(1) 입니다.
+테이블은 한 번만 만들어 바이너리 파일로 저장해 두고, 이후에는 파일을 mmap 으로 열어
+복사 없이 씁니다. 같은 호스트의 Streamlit·배치 워커는 모두 같은 페이지 캐시를 공유하고,
+records() 는 그 메모리를 np.frombuffer 로 감싼 구조화 배열(RECORD_DTYPE)입니다.
+헤더의 범위·버전·크기·체크섬이 맞지 않는 파일(예: 예전 4바이트 형식)은 다시 만듭니다.
+
+    python -m saju_engine.manse_table build [경로]   # 테이블 파일 생성
+    python -m saju_engine.manse_table verify [경로]  # 라이브러리와 전 범위 대조
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+from datetime import date
+
+import numpy as np
+
+heavenly_stems = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
+earthly_branches = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
+
+# 60갑자 이름 ("갑자", "을축", ...) – 인덱스 i 는 천간 i % 10, 지지 i % 12
+GAPJA_NAMES = [heavenly_stems[i % 10] + earthly_branches[i % 12] for i in range(60)]
+
+FORMAT_MAGIC = b"SAJUMANS"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<8sHHiII8x")   # 매직, 버전, 레코드 크기, 첫 ordinal, 일수, CRC32, 예비
+HEADER_SIZE = HEADER.size             # 32
+
+RECORD_SIZE = 8
+RECORD_DTYPE = np.dtype([("year", "u1"), ("month", "u1"), ("day", "u1"), ("flags", "u1"),
+                         ("lunar_year", "<u2"), ("lunar_month", "u1"), ("lunar_day", "u1")])
+FLAG_INTERCALATION = 0x01
+
+MIN_DATE = date(1000, 2, 13)
+MAX_DATE = date(2050, 12, 31)
+BASE_ORDINAL = MIN_DATE.toordinal()
+DAY_COUNT = MAX_DATE.toordinal() - BASE_ORDINAL + 1
+
+# 1582-10-05 ~ 1582-10-14 는 그레고리력 개정으로 존재하지 않는 날짜 (라이브러리도 거부)
+GREGORIAN_GAP = (date(1582, 10, 5).toordinal(), date(1582, 10, 14).toordinal())
+
+DEFAULT_TABLE_PATH = os.environ.get(
+    "SAJU_MANSE_TABLE",
+    os.path.join(os.path.dirname(__file__), "data", "manse_table.bin"),
+)
+
+_table = None
+_table_map = None   # load_table() 결과가 가리키는 mmap (프로세스가 끝날 때까지 열어 둔다)
+_table_lock = threading.Lock()
+_table_crc = None
+
+
+# ---------------------------------------------------------
+# 60갑자 인덱스 유틸리티
+# ---------------------------------------------------------
+def gapja_index(stem_idx: int, branch_idx: int) -> int:
+    """(천간, 지지) 인덱스 → 60갑자 인덱스(0~59). 짝이 맞지 않는 조합은 -1."""
+    if (stem_idx - branch_idx) % 2:
+        return -1
+    return (6 * stem_idx - 5 * branch_idx) % 60
+
+
+def gapja_name(idx: int) -> str:
+    """60갑자 인덱스 → '정유' 같은 두 글자 간지."""
+    return GAPJA_NAMES[idx]
+
+
+def gapja_string(entry) -> str:
+    """lookup() 결과 → getGapJaString() 과 같은 '정유년 병오월 임오일' 문자열."""
+    y_idx, m_idx, d_idx, is_leap = entry
+    text = f"{GAPJA_NAMES[y_idx]}년 {GAPJA_NAMES[m_idx]}월 {GAPJA_NAMES[d_idx]}일"
+    if is_leap:
+        text += " (윤월)"
+    return text
+
+
+# ---------------------------------------------------------
+# 테이블 생성 (라이브러리 음력 데이터를 한 번만 순회)
+# ---------------------------------------------------------
+def build_table() -> bytearray:
+    """
+    KoreanLunarCalendar 의 음력 데이터를 음력 1000-01-01 부터 하루씩 순회하며 테이블을 만든다.
+    간지 계산식은 라이브러리 내부(__getGapJa)와 동일하다.
+    """
+    from korean_lunar_calendar import KoreanLunarCalendar as K
+
+    def sexagenary(count, stem_offset, branch_offset):
+        return gapja_index((count + stem_offset) % 10, (count + branch_offset) % 12)
+
+    table = bytearray(DAY_COUNT * RECORD_SIZE)
+    pos = 0
+    abs_days = 1  # 음력 1000-01-01 = 양력 1000-02-13
+    year = K.KOREAN_LUNAR_BASE_YEAR
+
+    while pos < DAY_COUNT:
+        data = K.KOREAN_LUNAR_DATA[year - K.KOREAN_LUNAR_BASE_YEAR]
+        leap_month = (data >> 12) & 0x0F
+        y_idx = sexagenary(year - K.KOREAN_LUNAR_BASE_YEAR,
+                           K.GAPJA_YEAR_CHEONGAN_OFFSET, K.GAPJA_YEAR_GANJI_OFFSET)
+
+        months = []
+        for month in range(1, 13):
+            big = (data >> (12 - month)) & 0x01
+            months.append((month, 30 if big else 29, 0))
+            if month == leap_month:
+                big = (data >> 16) & 0x01
+                months.append((month, 30 if big else 29, FLAG_INTERCALATION))
+
+        for month, days, flags in months:
+            month_count = month + 12 * (year - K.KOREAN_LUNAR_BASE_YEAR)
+            m_idx = sexagenary(month_count, K.GAPJA_MONTH_CHEONGAN_OFFSET, K.GAPJA_MONTH_GANJI_OFFSET)
+            for lunar_day in range(1, days + 1):
+                if pos >= DAY_COUNT:
+                    break
+                d_idx = sexagenary(abs_days, K.GAPJA_DAY_CHEONGAN_OFFSET, K.GAPJA_DAY_GANJI_OFFSET)
+                off = pos * RECORD_SIZE
+                table[off] = y_idx
+                table[off + 1] = m_idx
+                table[off + 2] = d_idx
+                table[off + 3] = flags
+                table[off + 4:off + 6] = year.to_bytes(2, "little")
+                table[off + 6] = month
+                table[off + 7] = lunar_day
+                pos += 1
+                abs_days += 1
+        year += 1
+
+    return table
+
+
+def pack_header(records) -> bytes:
+    """레코드 바이트 → 파일 헤더 (범위·버전·체크섬)."""
+    return HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, RECORD_SIZE, BASE_ORDINAL, DAY_COUNT,
+                       zlib.crc32(records))
+
+
+def check_header(data, path: str = "") -> memoryview:
+    """
+    파일 전체(bytes 또는 mmap) → 레코드 부분 memoryview (복사 없음).
+    매직·버전·범위·크기·체크섬 중 하나라도 맞지 않으면 RuntimeError.
+    """
+    if len(data) < HEADER_SIZE:
+        raise RuntimeError("만세력 테이블 파일 헤더가 없습니다: " + path)
+    magic, version, record_size, first, count, checksum = HEADER.unpack_from(data)
+    if magic != FORMAT_MAGIC or version != FORMAT_VERSION:
+        raise RuntimeError(f"만세력 테이블 파일 형식/버전이 다릅니다: {path} (v{version})")
+    if (record_size, first, count) != (RECORD_SIZE, BASE_ORDINAL, DAY_COUNT):
+        raise RuntimeError("만세력 테이블 파일의 범위나 레코드 크기가 맞지 않습니다: " + path)
+    if len(data) - HEADER_SIZE != DAY_COUNT * RECORD_SIZE:
+        raise RuntimeError("만세력 테이블 파일 크기가 맞지 않습니다: " + path)
+    records = memoryview(data)[HEADER_SIZE:]
+    if zlib.crc32(records) != checksum:
+        records.release()   # mmap 을 닫을 수 있도록 참조를 놓는다
+        raise RuntimeError("만세력 테이블 파일 체크섬이 맞지 않습니다: " + path)
+    return records
+
+
+def save_table(table, path: str = DEFAULT_TABLE_PATH):
+    """
+    레코드 바이트(build_table 결과)에 헤더를 붙여 저장한다. 같은 폴더의 고유한 임시 파일에 쓴 뒤
+    os.replace 로 바꿔 끼우므로 여러 프로세스가 동시에 저장해도 서로의 임시 파일을 덮지 않는다.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + ".",
+                                     suffix=".tmp", delete=False) as f:
+        try:
+            f.write(pack_header(table))
+            f.write(table)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    os.chmod(f.name, 0o644)   # NamedTemporaryFile 은 0600 으로 만든다
+    os.replace(f.name, path)
+
+
+def read_table_file(path: str) -> bytes:
+    """파일을 메모리로 읽어 헤더를 검사하고 레코드 바이트를 돌려준다 (검증·도구용)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return check_header(data, path).tobytes()
+
+
+def map_table_file(path: str):
+    """파일을 읽기 전용 mmap 으로 열고 헤더를 검사한다. → (mmap, 레코드 memoryview)."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return mapped, check_header(mapped, path)
+    except RuntimeError:
+        mapped.close()
+        raise
+
+
+def load_table(path: str = DEFAULT_TABLE_PATH):
+    """
+    테이블을 프로세스당 한 번만 연다. 파일을 mmap 으로 열어 레코드 부분 memoryview 를
+    돌려주므로 워커가 여럿이어도 메모리는 페이지 캐시 한 벌뿐이다.
+    파일이 없거나 헤더가 맞지 않으면 라이브러리 데이터로 만들어 저장을 시도하고,
+    둘 다 불가능하면 RuntimeError.
+    """
+    global _table, _table_map
+    if _table is not None:
+        return _table
+
+    with _table_lock:
+        if _table is not None:
+            return _table
+
+        table = None
+        if os.path.exists(path):
+            try:
+                _table_map, table = map_table_file(path)
+            except (RuntimeError, ValueError, OSError):
+                table = None  # 예전 형식이거나 손상된 파일 → 다시 만든다
+        if table is None:
+            try:
+                table = bytes(build_table())
+            except ImportError:
+                raise RuntimeError("만세력 테이블 파일이 없고 KoreanLunarCalendar 라이브러리도 설치되지 않았습니다.")
+            try:
+                save_table(table, path)
+                _table_map, table = map_table_file(path)
+            except OSError:
+                pass  # 읽기 전용 배포 환경이면 메모리에만 둔다
+
+        _table = table
+        return _table
+
+
+def records() -> np.ndarray:
+    """테이블 전체를 복사 없이 RECORD_DTYPE 구조화 배열로 본다 (읽기 전용)."""
+    return np.frombuffer(load_table(), dtype=RECORD_DTYPE)
+
+
+def table_checksum() -> int:
+    """불러온 테이블 레코드의 CRC32 (파일 헤더의 체크섬과 같은 값). 파생 색인의 유효성 확인용."""
+    global _table_crc
+    if _table_crc is None:
+        _table_crc = zlib.crc32(load_table())
+    return _table_crc
+
+
+# ---------------------------------------------------------
+# 조회
+# ---------------------------------------------------------
+def day_offset(year: int, month: int, day: int):
+    """양력 날짜 → 테이블 레코드 위치. 지원 범위 밖이거나 없는 날짜면 None."""
+    try:
+        ordinal = date(year, month, day).toordinal()
+    except (TypeError, ValueError):
+        return None
+    return ordinal_offset(ordinal)
+
+
+def ordinal_offset(ordinal: int):
+    """date ordinal → 테이블 레코드 위치. 지원 범위 밖이거나 없는 날짜면 None."""
+    offset = ordinal - BASE_ORDINAL
+    if offset < 0 or offset >= DAY_COUNT:
+        return None
+    if GREGORIAN_GAP[0] <= ordinal <= GREGORIAN_GAP[1]:
+        return None
+    return offset
+
+
+def lookup(year: int, month: int, day: int):
+    """
+    양력 날짜 → (연 간지, 월 간지, 일 간지, 윤달 여부).
+    간지는 0~59 인덱스이며, 라이브러리가 거부하는 날짜는 None.
+    """
+    offset = day_offset(year, month, day)
+    if offset is None:
+        return None
+
+    table = load_table()
+    off = offset * RECORD_SIZE
+    return table[off], table[off + 1], table[off + 2], bool(table[off + 3] & FLAG_INTERCALATION)
+
+
+def get_ganji_from_solar(year: int, month: int, day: int):
+    """
+    양력 → (연 간지, 월 간지, 일 간지, '정유년 병오월 임오일') – 예전 앱의
+    KoreanLunarCalendar 기반 get_ganji_from_solar 와 같은 결과를 테이블에서 꺼낸다.
+    라이브러리가 거부하는 날짜면 None.
+    """
+    entry = lookup(year, month, day)
+    if entry is None:
+        return None
+    y_idx, m_idx, d_idx, _ = entry
+    return GAPJA_NAMES[y_idx], GAPJA_NAMES[m_idx], GAPJA_NAMES[d_idx], gapja_string(entry)
+
+
+def lunar_date(year: int, month: int, day: int):
+    """양력 → (음력 연, 월, 일, 윤달 여부). 범위 밖이거나 없는 날짜면 None."""
+    offset = day_offset(year, month, day)
+    if offset is None:
+        return None
+
+    table = load_table()
+    off = offset * RECORD_SIZE
+    return (int.from_bytes(table[off + 4:off + 6], "little"), table[off + 6], table[off + 7],
+            bool(table[off + 3] & FLAG_INTERCALATION))
+
+
+# ---------------------------------------------------------
+# 검증 모드 – 모든 날짜를 라이브러리 결과와 대조
+# ---------------------------------------------------------
+def verify_table(table=None, verbose: bool = False):
+    """
+    지원 범위의 모든 날짜에 대해 KoreanLunarCalendar 의 getGapJaString()·음력 날짜와 테이블을 대조한다.
+    불일치한 (날짜, 라이브러리 문자열, 테이블 문자열) 목록을 돌려준다.
+    """
+    from korean_lunar_calendar import KoreanLunarCalendar
+
+    if table is None:
+        table = load_table()
+
+    cal = KoreanLunarCalendar()
+    mismatches = []
+    checked = 0
+
+    for offset in range(DAY_COUNT):
+        d = date.fromordinal(BASE_ORDINAL + offset)
+        ok = cal.setSolarDate(d.year, d.month, d.day)
+        in_table = day_offset(d.year, d.month, d.day) is not None
+
+        if ok != in_table:
+            mismatches.append((d, "valid" if ok else "invalid", "valid" if in_table else "invalid"))
+            continue
+        if not ok:
+            continue
+
+        off = offset * RECORD_SIZE
+        entry = (table[off], table[off + 1], table[off + 2], bool(table[off + 3] & FLAG_INTERCALATION))
+        expected = cal.getGapJaString()
+        actual = gapja_string(entry)
+        if expected != actual:
+            mismatches.append((d, expected, actual))
+        lunar = (int.from_bytes(table[off + 4:off + 6], "little"), table[off + 6], table[off + 7])
+        if lunar != (cal.lunarYear, cal.lunarMonth, cal.lunarDay):
+            mismatches.append((d, cal.LunarIsoFormat(), "%04d-%02d-%02d" % lunar))
+        checked += 1
+
+        if verbose and d.month == 1 and d.day == 1 and d.year % 50 == 0:
+            print(f"  {d.year}년 ... 불일치 {len(mismatches)}건", file=sys.stderr)
+
+    return checked, mismatches
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "verify"
+
+    if command == "build":
+        path = argv[1] if len(argv) > 1 else DEFAULT_TABLE_PATH
+        save_table(build_table(), path)
+        print(f"만세력 테이블 저장: {path} (v{FORMAT_VERSION}, {DAY_COUNT}일, "
+              f"{HEADER_SIZE + DAY_COUNT * RECORD_SIZE} bytes)")
+        return 0
+
+    if command == "verify":
+        path = argv[1] if len(argv) > 1 else DEFAULT_TABLE_PATH
+        table = read_table_file(path) if os.path.exists(path) else bytes(build_table())
+        checked, mismatches = verify_table(table, verbose=True)
+        for m in mismatches[:20]:
+            print("불일치:", *m)
+        print(f"검증 완료: {checked}일 대조, 불일치 {len(mismatches)}건")
+        return 1 if mismatches else 0
+
+    print("사용법: python -m saju_engine.manse_table [build [경로] | verify]")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
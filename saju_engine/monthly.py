@@ -0,0 +1,174 @@
+"""
+월운(月運) 타임라인 – 대상 연도 12개월의 월주와 월별 해석을 차례로 내보내는 생성기.
+
+사주 연도는 입춘부터 다음 해 입춘 전까지이고, 각 달은 절(節)에서 시작합니다.
+절 시각과 월주는 solar_terms 의 사전 계산 인덱스에서 꺼냅니다.
+
+- month_table(year, day_element): 12개월의 월주·기간·오행·일간과의 관계.
+  사용자마다 다시 만들지 않도록 (연도, 일간 오행) 단위로 공용 LRU 캐시에 둡니다.
+- timeline(year, day_element, counts): MonthReading 을 한 달씩 yield 하는 생성기.
+  본문(text)은 처음 읽을 때 만들어지므로 화면은 한 달씩 그리고, API 는 offset/limit 로
+  필요한 달만 꺼내면 됩니다.
+
+    for month in timeline(2026, "수", report.counts):
+        st.markdown(month.text)
+
+    list(timeline(2026, "수", counts, offset=3, limit=3))   # 4~6번째 달만
+"""
+
+from collections import namedtuple
+from itertools import islice
+
+from saju_engine import solar_terms
+from saju_engine.cache import LRUCache
+from saju_engine.fortune_year import (
+    RELATION,
+    RELATION_OFFICER,
+    RELATION_OUTPUT,
+    RELATION_RESOURCE,
+    RELATION_SAME,
+    RELATION_WEALTH,
+    element_label,
+)
+from saju_engine.manse_table import GAPJA_NAMES
+from saju_engine.pillars import BRANCH_ELEMENT, ELEMENTS, STEM_ELEMENT
+
+MONTHS = 12
+MONTH_CACHE_SIZE = 256
+
+# 한 달의 공통 정보 (사용자와 무관, (연도, 일간 오행) 마다 12개)
+# index 0 = 인월(입춘~), start/end = 절입 시각 datetime(KST), end 는 다음 달 시작
+MonthBase = namedtuple("MonthBase", ["index", "start", "end", "gapja", "ganji",
+                                     "stem_element", "branch_element", "relation"])
+
+MONTH_RELATION_TEXT = {
+    RELATION_SAME: "나와 같은 기운이 들어와 주관이 뚜렷해지는 달입니다. 혼자 밀어붙이기보다 주변과 속도를 맞추세요.",
+    RELATION_OUTPUT: "내 기운을 밖으로 쓰는 달입니다. 표현·기획·발표처럼 결과물을 내는 일에 힘이 실립니다.",
+    RELATION_RESOURCE: "도움과 배움이 들어오는 달입니다. 공부·준비·부탁이 잘 통합니다.",
+    RELATION_OFFICER: "책임과 압박이 커지는 달입니다. 규칙과 일정 관리를 단단히 하면 평가로 돌아옵니다.",
+    RELATION_WEALTH: "실속을 챙기는 달입니다. 돈·계약·정리 정돈에 좋은 흐름입니다.",
+}
+
+_month_cache = LRUCache(MONTH_CACHE_SIZE)
+
+
+def _jeol_keys_for_year(year: int):
+    """사주 연도 year 의 절 13개 분 키 (입춘 ~ 다음 해 입춘)."""
+    terms = solar_terms.term_table()
+    row = year - solar_terms.FIRST_YEAR
+    if row < 0 or row + 1 >= len(terms):
+        raise ValueError(f"절기 인덱스 범위를 벗어난 연도입니다: {year}")
+    # 절은 짝수 열 (0 소한, 2 입춘, ..., 22 대설)
+    this_year = [int(k) for k in terms[row, 2::2]]          # 입춘 ~ 대설 (11개)
+    next_year = [int(terms[row + 1, 0]), int(terms[row + 1, 2])]  # 다음 해 소한, 입춘
+    return this_year + next_year
+
+
+def build_month_table(year: int, day_element: str):
+    """(연도, 일간 오행) → MonthBase 12개 튜플."""
+    day_index = ELEMENTS.index(day_element)
+    keys = _jeol_keys_for_year(year)
+    months = []
+    for i in range(MONTHS):
+        gapja = solar_terms.month_gapja_from_key(keys[i])
+        stem_element = STEM_ELEMENT[gapja % 10]
+        months.append(MonthBase(
+            i,
+            solar_terms.key_to_datetime(keys[i]),
+            solar_terms.key_to_datetime(keys[i + 1]),
+            gapja,
+            GAPJA_NAMES[gapja],
+            ELEMENTS[stem_element],
+            ELEMENTS[BRANCH_ELEMENT[gapja % 12]],
+            int(RELATION[day_index, stem_element]),
+        ))
+    return tuple(months)
+
+
+def month_table(year: int, day_element: str):
+    """공용 캐시에서 (연도, 일간 오행) 월 표를 꺼내고 없으면 만든다."""
+    return _month_cache.get_or_build((year, day_element), lambda: build_month_table(year, day_element))
+
+
+# ---------------------------------------------------------
+# 사용자별 월운 (본문은 처음 읽을 때 렌더링)
+# ---------------------------------------------------------
+class MonthReading:
+    """한 달의 월운. counts 는 [목, 화, 토, 금, 수] 개수(원국), text 는 지연 렌더링."""
+
+    __slots__ = ("base", "counts", "_text")
+
+    def __init__(self, base: MonthBase, counts):
+        self.base = base
+        self.counts = counts
+        self._text = None
+
+    @property
+    def counts_with_month(self):
+        """원국 개수에 그달 월주 두 글자를 더한 개수."""
+        counts = list(self.counts)
+        counts[ELEMENTS.index(self.base.stem_element)] += 1
+        counts[ELEMENTS.index(self.base.branch_element)] += 1
+        return counts
+
+    @property
+    def title(self) -> str:
+        b = self.base
+        return (f"{b.start.month}월 {b.start.day}일 ~ {b.end.month}월 {b.end.day}일 "
+                f"({b.ganji}월)")
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._render()
+        return self._text
+
+    def _render(self) -> str:
+        b = self.base
+        lines = [f"#### 📅 {self.title}", MONTH_RELATION_TEXT[b.relation]]
+
+        weakest = min(self.counts)
+        strongest = max(self.counts)
+        for element in dict.fromkeys((b.stem_element, b.branch_element)):
+            n = self.counts[ELEMENTS.index(element)]
+            if n == weakest < strongest:
+                lines.append(f"- 부족한 {element_label(element)} 기운을 채워 주는 달이라 균형이 좋아집니다.")
+            elif n == strongest and n >= 3:
+                lines.append(f"- 이미 강한 {element_label(element)} 기운이 더해져 한쪽으로 치우치기 쉽습니다.")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        b = self.base
+        return {
+            "index": b.index,
+            "start": b.start.isoformat(timespec="minutes"),
+            "end": b.end.isoformat(timespec="minutes"),
+            "ganji": b.ganji,
+            "stem_element": b.stem_element,
+            "branch_element": b.branch_element,
+            "relation": b.relation,
+            "counts": dict(zip(ELEMENTS, self.counts_with_month)),
+            "text": self.text,
+        }
+
+    def __repr__(self):
+        return f"MonthReading({self.base.ganji}, {self.base.start:%Y-%m-%d})"
+
+
+def _counts_vector(counts):
+    if isinstance(counts, dict):
+        return tuple(counts[e] for e in ELEMENTS)
+    return tuple(counts)
+
+
+def timeline(year: int, day_element: str, counts, offset: int = 0, limit=None):
+    """대상 연도의 MonthReading 을 한 달씩 yield. offset/limit 로 일부만 꺼낼 수 있다."""
+    counts = _counts_vector(counts)
+    months = month_table(year, day_element)
+    stop = None if limit is None else offset + limit
+    for base in islice(months, offset, stop):
+        yield MonthReading(base, counts)
+
+
+def cache_stats() -> dict:
+    return _month_cache.stats()
@@ -0,0 +1,151 @@
+"""
+정수로 인코딩한 사주 네 기둥 값 객체.
+
+각 기둥은 60갑자 인덱스(0~59) 하나로 들고, 천간/지지/오행/띠는 미리 만든 표에서
+인덱스로 바로 꺼냅니다. 요청마다 간지 문자열을 쪼개거나 딕셔너리를 찾을 필요가 없습니다.
+
+    p = from_date(date(1990, 5, 17))
+    p.ganji("day")        # '임오'
+    p.day_element         # '수'
+    p.element_counts()    # [목, 화, 토, 금, 수] 개수
+
+pack()/unpack() 으로 int 하나(네 기둥 6bit × 4 + 시 유무 1bit + 윤달 1bit)로도 주고받을 수 있습니다.
+"""
+
+from datetime import date
+
+from saju_engine import manse_table
+from saju_engine.day_pillar import day_gapja
+from saju_engine.manse_table import GAPJA_NAMES, earthly_branches, heavenly_stems
+
+ELEMENTS = ["목", "화", "토", "금", "수"]
+ANIMALS = ["쥐", "소", "호랑이", "토끼", "용", "뱀", "말", "양", "원숭이", "닭", "개", "돼지"]
+
+# 천간/지지 인덱스 → 오행 인덱스 (목0 화1 토2 금3 수4)
+STEM_ELEMENT = (0, 0, 1, 1, 2, 2, 3, 3, 4, 4)
+BRANCH_ELEMENT = (4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4)
+
+KEYS = ("year", "month", "day", "hour")
+
+_PACK_HOUR_KNOWN = 1 << 24
+_PACK_LEAP = 1 << 25
+
+
+class Pillars:
+    """
+    연·월·일·시 60갑자 인덱스. hour 는 태어난 시를 모르면 None.
+    leap 은 만세력 기준 음력 윤달 여부(간지 문자열 표시용).
+    """
+
+    __slots__ = ("year", "month", "day", "hour", "leap")
+
+    def __init__(self, year: int, month: int, day: int, hour=None, leap: bool = False):
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hour = hour
+        self.leap = leap
+
+    # -----------------------------------------------------
+    # 인덱스 / 문자 접근
+    # -----------------------------------------------------
+    def stem(self, key: str) -> int:
+        return getattr(self, key) % 10
+
+    def branch(self, key: str) -> int:
+        return getattr(self, key) % 12
+
+    def stem_name(self, key: str) -> str:
+        return heavenly_stems[getattr(self, key) % 10]
+
+    def branch_name(self, key: str) -> str:
+        return earthly_branches[getattr(self, key) % 12]
+
+    def ganji(self, key: str):
+        """'정유' 같은 두 글자 간지. 시를 모르면 None."""
+        idx = getattr(self, key)
+        return None if idx is None else GAPJA_NAMES[idx]
+
+    def __getitem__(self, key: str):
+        """예전 딕셔너리 형식과 같은 (천간, 지지) 튜플. 시를 모르면 None."""
+        idx = getattr(self, key)
+        if idx is None:
+            return None
+        return heavenly_stems[idx % 10], earthly_branches[idx % 12]
+
+    @property
+    def hour_known(self) -> bool:
+        return self.hour is not None
+
+    @property
+    def day_element(self) -> str:
+        return ELEMENTS[STEM_ELEMENT[self.day % 10]]
+
+    @property
+    def animal(self) -> str:
+        return ANIMALS[self.year % 12]
+
+    def element_counts(self, stem_weight: int = 1, branch_weight: int = 1):
+        """[목, 화, 토, 금, 수] 개수. 천간·지지 가중치를 따로 줄 수 있다."""
+        counts = [0, 0, 0, 0, 0]
+        for idx in (self.year, self.month, self.day, self.hour):
+            if idx is None:
+                continue
+            counts[STEM_ELEMENT[idx % 10]] += stem_weight
+            counts[BRANCH_ELEMENT[idx % 12]] += branch_weight
+        return counts
+
+    def gapja_string(self) -> str:
+        """'정유년 병오월 임오일' (윤달이면 ' (윤월)' 추가)."""
+        return manse_table.gapja_string((self.year, self.month, self.day, self.leap))
+
+    def with_hour(self, hour):
+        return Pillars(self.year, self.month, self.day, hour, self.leap)
+
+    # -----------------------------------------------------
+    # int 하나로 압축
+    # -----------------------------------------------------
+    def pack(self) -> int:
+        value = self.year | (self.month << 6) | (self.day << 12)
+        if self.hour is not None:
+            value |= (self.hour << 18) | _PACK_HOUR_KNOWN
+        if self.leap:
+            value |= _PACK_LEAP
+        return value
+
+    @classmethod
+    def unpack(cls, value: int):
+        hour = (value >> 18) & 0x3F if value & _PACK_HOUR_KNOWN else None
+        return cls(value & 0x3F, (value >> 6) & 0x3F, (value >> 12) & 0x3F, hour, bool(value & _PACK_LEAP))
+
+    def __eq__(self, other):
+        return isinstance(other, Pillars) and self.pack() == other.pack()
+
+    def __hash__(self):
+        return self.pack()
+
+    def __repr__(self):
+        names = " ".join(self.ganji(key) or "-" for key in KEYS)
+        return f"Pillars({names})"
+
+
+def from_date(value: date):
+    """양력 date → 시 없는 Pillars. 만세력 범위 밖이면 None."""
+    ordinal = value.toordinal()
+    offset = manse_table.ordinal_offset(ordinal)
+    if offset is None:
+        return None
+
+    table = manse_table.load_table()
+    off = offset * manse_table.RECORD_SIZE
+    leap = bool(table[off + 3] & manse_table.FLAG_INTERCALATION)
+    return Pillars(table[off], table[off + 1], day_gapja(ordinal), None, leap)
+
+
+def from_solar(year: int, month: int, day: int):
+    """양력 연/월/일 → 시 없는 Pillars. 없는 날짜거나 범위 밖이면 None."""
+    try:
+        value = date(year, month, day)
+    except (TypeError, ValueError):
+        return None
+    return from_date(value)
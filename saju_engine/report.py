@@ -0,0 +1,109 @@
+"""
+두 앱이 함께 쓰는 사주 리포트 결과 객체.
+
+입력(양력 생일, 시지, 앱 종류, 운세 연도) 하나당 SajuReport 를 한 번 만들고,
+화면 출력 · PNG 내보내기 · JSON 응답은 모두 이 객체에 담긴 문구를 그대로 씁니다.
+해석 문구를 두 번 만들지 않고, 캐시할 때도 이 객체 하나만 보관하면 됩니다.
+
+    report = SajuReport("report", birth_date, hour_branch, pillars, counts, sections, 2026)
+    report.key              # (ordinal, 시지(모르면 -1), 앱 종류, 운세 연도) – 캐시 키
+    report.text("love")     # 섹션 본문
+    report.to_dict()        # JSON 으로 보낼 수 있는 딕셔너리
+"""
+
+from collections import namedtuple
+
+from saju_engine.fortune_year import DEFAULT_YEAR
+from saju_engine.pillars import ELEMENTS, KEYS
+
+# 앱 종류: 사주 리포트 앱(글자당 1개) / 만세력 앱(천간 2점·지지 1점)
+VARIANT_REPORT = "report"
+VARIANT_MANSE = "manse"
+VARIANTS = (VARIANT_REPORT, VARIANT_MANSE)
+
+# key = 앱 안에서 쓰는 이름, title = 화면·내보내기 제목, text = 마크다운 본문
+Section = namedtuple("Section", ["key", "title", "text"])
+
+
+def report_key(solar_date, hour_branch, variant, year: int = DEFAULT_YEAR):
+    """캐시 키: (양력 ordinal, 시지 인덱스(모르면 -1), 앱 종류, 운세 연도)."""
+    return solar_date.toordinal(), -1 if hour_branch is None else hour_branch, variant, year
+
+
+class SajuReport:
+    """
+    사주 계산 결과 + 렌더링이 끝난 해석 섹션.
+    counts 는 {"목": n, ...} 딕셔너리(앱별 가중치 적용), sections 는 Section 튜플,
+    year 는 연도 운세 섹션을 만든 기준 연도.
+    """
+
+    __slots__ = ("variant", "solar_date", "hour_branch", "pillars", "counts", "sections", "year",
+                 "_by_key")
+
+    def __init__(self, variant, solar_date, hour_branch, pillars, counts, sections,
+                 year: int = DEFAULT_YEAR):
+        if variant not in VARIANTS:
+            raise ValueError(f"알 수 없는 앱 종류: {variant}")
+        self.variant = variant
+        self.solar_date = solar_date
+        self.hour_branch = hour_branch
+        self.pillars = pillars
+        self.counts = counts
+        self.sections = tuple(sections)
+        self.year = year
+        self._by_key = {section.key: section for section in self.sections}
+
+    @property
+    def key(self):
+        """(양력 ordinal, 시지 인덱스(모르면 -1), 앱 종류, 운세 연도)."""
+        return report_key(self.solar_date, self.hour_branch, self.variant, self.year)
+
+    @property
+    def day_element(self) -> str:
+        return self.pillars.day_element
+
+    @property
+    def main_element(self) -> str:
+        """가장 강한 오행 (동점이면 목·화·토·금·수 순서로 앞선 것)."""
+        return max(self.counts, key=self.counts.get)
+
+    @property
+    def weak_element(self) -> str:
+        """가장 약한 오행 (동점이면 목·화·토·금·수 순서로 앞선 것)."""
+        return min(self.counts, key=self.counts.get)
+
+    def section(self, key: str):
+        return self._by_key.get(key)
+
+    def text(self, key: str, default: str = "") -> str:
+        section = self._by_key.get(key)
+        return default if section is None else section.text
+
+    # -----------------------------------------------------
+    # 내보내기
+    # -----------------------------------------------------
+    def to_dict(self) -> dict:
+        p = self.pillars
+        return {
+            "variant": self.variant,
+            "solar_date": self.solar_date.isoformat(),
+            "hour_branch": self.hour_branch,
+            "year": self.year,
+            "pillars": {key: p.ganji(key) for key in KEYS},
+            "gapja": p.gapja_string(),
+            "animal": p.animal,
+            "day_element": self.day_element,
+            "counts": {e: self.counts[e] for e in ELEMENTS},
+            "main_element": self.main_element,
+            "weak_element": self.weak_element,
+            "sections": [
+                {"key": s.key, "title": s.title, "text": s.text} for s in self.sections
+            ],
+        }
+
+    def to_text(self) -> str:
+        """섹션 전체를 '[제목]\\n본문' 형식 평문으로."""
+        return "\n\n".join(f"[{s.title}]\n{s.text}" for s in self.sections)
+
+    def __repr__(self):
+        return f"SajuReport({self.variant}, {self.solar_date}, {self.pillars!r}, {self.year})"
@@ -0,0 +1,273 @@
+"""
+사주 리포트 앱(saju_app.py 계열)의 계산·해석 로직.
+
+Streamlit 없이 import 할 수 있어 앱 화면, 배치, API, 벤치마크가 같은 코드를 씁니다.
+오행은 천간·지지 글자당 1개로 셉니다.
+
+    report = cached_report(date(1990, 5, 17), 14)   # SajuReport (범위 밖이면 None)
+    report.text("love")
+    cached_report(date(1990, 5, 17), 14, year=2027)  # 연도 운세 섹션만 2027년 기준
+
+연도 운세는 2026년이면 fortune_2026 의 사전 렌더링 해석을, 다른 연도면 연도 엔진
+(fortune_year)의 관계별 기본 문구로 같은 모양의 해석을 만듭니다.
+"""
+
+from datetime import date
+
+from saju_engine import export, hours
+from saju_engine import pillars as saju_pillars
+from saju_engine.cache import report_cache
+from saju_engine import fortune_2026
+from saju_engine.fortune_2026 import Reading2026, reading_2026
+from saju_engine.fortune_year import DEFAULT_YEAR, year_profile
+from saju_engine.report import VARIANT_REPORT, SajuReport, Section, report_key
+
+# ---------------------------------------------------------
+# 띠 표시 문구
+# ---------------------------------------------------------
+branch_to_animal = {
+    "자":"🐭 쥐띠","축":"🐮 소띠","인":"🐯 호랑이띠","묘":"🐰 토끼띠",
+    "진":"🐲 용띠","사":"🐍 뱀띠","오":"🐴 말띠","미":"🐑 양띠",
+    "신":"🐵 원숭이띠","유":"🐔 닭띠","술":"🐶 개띠","해":"🐷 돼지띠",
+}
+# ---------------------------------------------------------
+# PART 2 — 사주 4기둥 계산 + 오행 분석 + 띠 + 일간 성향
+# ---------------------------------------------------------
+
+# 4기둥 전체 계산 (만세력 범위 밖이면 None)
+def get_four_pillars(solar_date: date, hour):
+    pillars = saju_pillars.from_date(solar_date)
+    if pillars is None:
+        return None
+
+    # 시주: 공용 시지·시간 테이블
+    if hour is not None:
+        pillars = pillars.with_hour(hours.hour_gapja(pillars.day, hours.hour_branch(hour)))
+
+    return pillars
+
+
+# 오행 카운트 (천간·지지 글자당 1개)
+def count_elements(pillars):
+    return dict(zip(saju_pillars.ELEMENTS, pillars.element_counts()))
+
+
+# 일간 성향
+def get_day_master_trait(day_stem):
+    traits = {
+        "갑": "기둥 같은 강직함, 추진력, 정의감을 갖춘 리더형.",
+        "을": "섬세하고 배려 깊으며 감성적 안정감을 주는 스타일.",
+        "병": "태양처럼 밝고 에너지 넘치며 사람을 끄는 카리스마형.",
+        "정": "촛불 같은 따뜻함, 지식·지혜 기반의 전략가형.",
+        "무": "산처럼 안정적, 책임감 강하고 뚝심 있는 기운.",
+        "기": "논밭 같은 실속형, 현실적이며 균형 감각 뛰어남.",
+        "경": "강철 같은 결단력·경쟁력, 추진력 강한 실전형.",
+        "신": "보석 같은 매력, 감각적이며 창조적인 스타일.",
+        "임": "큰 물 같은 포용력·직관력·영감 풍부.",
+        "계": "가랑비 같은 섬세함, 분석력·관찰력 뛰어난 스타일."
+    }
+    return traits.get(day_stem, "일간 정보를 찾을 수 없습니다.")
+
+
+# 띠 정보
+def get_animal(branch):
+    return branch_to_animal.get(branch, "")
+
+
+# ---------------------------------------------------------
+# PART 3 — 2026년 (병오년) 전체 운세 해석 + 종합 사주 해석
+# ---------------------------------------------------------
+
+# ---------------------------------------------------------
+# ⭐ 사주 전체 종합 해석
+# ---------------------------------------------------------
+def full_saju_reading(pillars, element_counts, day_element):
+    d_s = pillars.stem_name("day")
+
+    strong = [e for e,c in element_counts.items() if c >= 4]
+    weak = [e for e,c in element_counts.items() if c <= 1]
+
+    lines = []
+    lines.append("## 🧿 사주 전체 종합 해석")
+
+    # 기본 성향
+    lines.append(f"### 🌈 기본 성향 (일간 중심)\n- 당신의 일간은 **{d_s}({day_element})** 입니다. "
+                 f"이는 성향적으로 '{get_day_master_trait(d_s)}' 기운이 핵심 성격을 이끕니다.")
+
+    # 오행 요약
+    lines.append("### 🔍 오행 균형 분석")
+    lines.append(
+        f"- 목:{element_counts['목']} · 화:{element_counts['화']} · 토:{element_counts['토']} · 금:{element_counts['금']} · 수:{element_counts['수']}"
+    )
+    if strong:
+        lines.append(f"- **강한 오행** → {', '.join(strong)} 기운이 성격·관계·기질에 큰 영향을 줍니다.")
+    if weak:
+        lines.append(f"- **약한 오행** → {', '.join(weak)} 분야에서 약점이 나타나기 쉬우며 보완이 필요합니다.")
+
+    # 연주
+    lines.append("### 👨‍👩‍👧 연주 기반 선천적 배경·가정운")
+    lines.append(
+        f"- 연주는 **{pillars.ganji('year')}**로, 유년기 환경과 선천적 기질을 의미합니다.\n"
+        f"- 어린 시절부터 형성된 가치관, 안정감, 감정 습관이 현재 성격의 기초가 됩니다."
+    )
+
+    # 월주
+    lines.append("### 🏛 월주 기반 사회성·직업·역량")
+    lines.append(
+        f"- 월주는 **{pillars.ganji('month')}**로, 사회적 능력·일 능력·직업 기조를 나타냅니다.\n"
+        f"- 사회에서 어떤 역할을 맡기 좋은지, 일 처리 방식이 어떤지 드러나는 자리입니다."
+    )
+
+    # 일주
+    lines.append("### ❤️ 일주 기반 성격·인간관계·연애")
+    lines.append(
+        f"- 일주는 **{pillars.ganji('day')}**이며, 당신의 성품·감정·대인관계 방식의 핵심입니다.\n"
+        "- 타고난 성격, 사람을 대하는 방식, 연애 성향이 강하게 드러납니다."
+    )
+
+    # 시주
+    if pillars.hour_known:
+        lines.append("### 🌙 시주 기반 재능·내면·노년운")
+        lines.append(
+            f"- 시주는 **{pillars.ganji('hour')}**로, 겉으로 드러나지 않는 재능·내면적 만족감·노년 안정과 깊은 관련이 있습니다."
+        )
+    else:
+        lines.append("### 🌙 시주 분석 없음")
+        lines.append("- 태어난 시간이 없어 내면·노년운 분석이 제한됩니다.")
+
+    # 디테일 성향 분석
+    lines.append("### 🔥 상세 성향 분석")
+    if '목' in strong: lines.append("- **목(木) 강함** → 성장욕구·도전·확장운이 강함.")
+    if '화' in strong: lines.append("- **화(火) 강함** → 에너지·표현력·매력 대폭 상승.")
+    if '토' in strong: lines.append("- **토(土) 강함** → 책임감·안정성·계획력이 우수.")
+    if '금' in strong: lines.append("- **금(金) 강함** → 분석·판단·이성·정확함이 뛰어남.")
+    if '수' in strong: lines.append("- **수(水) 강함** → 직감·지혜·유연함·지식 습득력 상승.")
+
+    if weak:
+        lines.append("\n### ⚠ 약점·보완 포인트")
+        if '목' in weak: lines.append("- **목 부족** → 추진력 약함 → 목표·루틴 강화 필요.")
+        if '화' in weak: lines.append("- **화 부족** → 의욕·표현력 약함 → 운동·대화 증가 필요.")
+        if '토' in weak: lines.append("- **토 부족** → 책임감 약함 → 일정관리 습관이 필요.")
+        if '금' in weak: lines.append("- **금 부족** → 집중력 떨어짐 → 정리·계획이 도움됨.")
+        if '수' in weak: lines.append("- **수 부족** → 직관·지혜 약함 → 휴식·명상 필요.")
+
+    lines.append("### 🧩 종합 결론")
+    lines.append(
+        "- 강한 오행은 인생의 무기가 되고, 약한 오행을 조금만 보완해도 전체 삶의 균형이 크게 높아집니다."
+    )
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# 연도 운세 – 2026년 외 연도는 연도 엔진 문구로
+# ---------------------------------------------------------
+# (Reading2026 필드, 아이콘, 본문 제목, fortune_year 주제)
+YEAR_TOPICS = (
+    ("love", "💖", "연애운", "love"),
+    ("money", "💰", "재물운", "wealth"),
+    ("job", "💼", "직업·커리어운", "career"),
+    ("health", "💊", "건강운", "health"),
+    ("moving", "🏡", "이사·주거운", "move"),
+)
+# 섹션 제목 (화면 탭·PNG 머리글)
+YEAR_SECTION_TITLES = {"love": "연애운", "money": "재물운", "job": "직업운",
+                       "health": "건강운", "moving": "이사·주거운"}
+
+
+def year_reading(day_element, counts, year: int = DEFAULT_YEAR):
+    """일간 오행 + 오행 개수 → 그해 Reading2026 (2026년은 사전 렌더링 테이블)."""
+    if year == fortune_2026.YEAR:
+        return reading_2026(day_element, counts)
+    profile = year_profile(year)
+    relation = profile.relation_text(day_element)
+    texts = [
+        f"### {icon} {year}년 {title} ({profile.ganji})\n\n{relation}\n{profile.topic_text(topic, day_element)}"
+        for _field, icon, title, topic in YEAR_TOPICS
+    ]
+    return Reading2026(relation, *texts)
+
+
+# ---------------------------------------------------------
+# ⭐ 리포트 객체 – 입력당 1회 계산, 화면·PNG 가 함께 사용
+# ---------------------------------------------------------
+def build_report(solar_date: date, hour, year: int = DEFAULT_YEAR):
+    pillars = get_four_pillars(solar_date, hour)
+    if pillars is None:
+        return None
+    hour_branch = None if hour is None else hours.hour_branch(hour)
+    return report_from_pillars(solar_date, hour_branch, pillars, year)
+
+
+def report_from_pillars(solar_date: date, hour_branch, pillars, year: int = DEFAULT_YEAR):
+    """이미 계산한 Pillars(배치 경로 등) → SajuReport."""
+    element_counts = count_elements(pillars)
+    day_element = pillars.day_element
+    reading = year_reading(day_element, element_counts, year)
+
+    sections = [
+        Section("full", "사주 전체 종합 해석", full_saju_reading(pillars, element_counts, day_element)),
+        Section("trait", "일간 성향", get_day_master_trait(pillars.stem_name("day"))),
+        *(Section(key, f"{year}년 {title}", getattr(reading, key))
+          for key, title in YEAR_SECTION_TITLES.items()),
+    ]
+    return SajuReport(VARIANT_REPORT, solar_date, hour_branch, pillars, element_counts, sections, year)
+
+
+def cached_report(solar_date: date, hour, year: int = DEFAULT_YEAR):
+    """프로세스 공용 캐시 (양력일, 시지, 앱 종류, 운세 연도) 조회 후 없을 때만 build_report."""
+    hour_branch = None if hour is None else hours.hour_branch(hour)
+    key = report_key(solar_date, hour_branch, VARIANT_REPORT, year)
+    return report_cache.get_or_build(key, lambda: build_report(solar_date, hour, year))
+
+
+# ---------------------------------------------------------
+# PNG 내보내기
+# ---------------------------------------------------------
+
+# 리포트 텍스트 (PNG 를 실제로 만들 때만 호출)
+def build_report_text(report, birth_date, hour_opt, gender):
+    p = report.pillars
+    counts = report.counts
+    return f"""
+🔮 프리미엄 사주 분석 리포트
+
+[기본 정보]
+- 생년월일: {birth_date}
+- 태어난 시: {hour_opt}
+- 성별: {gender}
+
+[사주 4기둥]
+- 연주: {p.ganji('year')} ({get_animal(p.branch_name('year'))})
+- 월주: {p.ganji('month')}
+- 일주: {p.ganji('day')} ({report.day_element})
+- 시주: {p.ganji('hour') or '정보 없음'}
+
+[오행 분포]
+- 목:{counts['목']}  화:{counts['화']}  토:{counts['토']}
+- 금:{counts['금']}  수:{counts['수']}
+
+[사주 전체 종합 해석]
+{report.text('full')}
+
+[{report.year}년 연애운]
+{report.text('love')}
+
+[{report.year}년 재물운]
+{report.text('money')}
+
+[{report.year}년 직업운]
+{report.text('job')}
+
+[{report.year}년 건강운]
+{report.text('health')}
+
+[{report.year}년 이사·주거운]
+{report.text('moving')}
+"""
+
+
+# PNG 는 다운로드를 누를 때 만들고, 같은 리포트는 캐시에서 바로 꺼냄
+def report_png_data(report, birth_date, hour_opt, gender):
+    key = (report.key, str(hour_opt), gender)
+    return export.report_png(key, lambda: build_report_text(report, birth_date, hour_opt, gender))
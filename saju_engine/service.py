@@ -0,0 +1,381 @@
+"""
+Streamlit 없이 사주 계산·해석을 JSON 으로 돌려주는 asyncio HTTP 서비스.
+
+표준 라이브러리(asyncio 스트림)만 쓰는 작은 HTTP/1.1 서버입니다.
+
+    python -m saju_engine.service --port 8600
+
+    GET  /health
+    GET  /v1/chart?date=1990-05-17&hour=14&variant=report&year=2027
+    POST /v1/chart   {"date": "1990-05-17", "hour": 14, "variant": "manse"}
+    POST /v1/charts  {"items": [{"date": ..., "hour": ..., "variant": ..., "year": ...}, ...]}
+    GET  /v1/timeline?date=1990-05-17&hour=14&year=2026&offset=0&limit=3
+
+hour 는 0~23 (모르면 생략 또는 null), variant 는 "report"(기본) 또는 "manse",
+year 는 연도 운세 기준 연도(생략하면 fortune_year.DEFAULT_YEAR).
+응답 본문은 SajuReport.to_dict() 입니다. /v1/timeline 은 월운(monthly.timeline)을
+offset/limit 만큼 돌려줍니다.
+
+짧은 시간(--window-ms) 안에 들어온 요청은 한 번에 모아 만세력 테이블을 배열로 조회하고
+(batch.gapja_batch), 결과는 앱과 같은 공용 캐시(cache.report_cache)에 넣습니다.
+배치 계산은 작업 스레드(asyncio.to_thread)에서 돌려 그동안에도 이벤트 루프가 다른 연결을
+받습니다. 캐시에 있는 요청은 모으지 않고 바로 응답합니다.
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import date
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from saju_engine import hours, manse_table, manse_variant, monthly, report_variant
+from saju_engine.batch import gapja_batch
+from saju_engine.cache import report_cache
+from saju_engine.fortune_year import DEFAULT_YEAR
+from saju_engine.pillars import Pillars
+from saju_engine.report import VARIANT_MANSE, VARIANT_REPORT, report_key
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+DEFAULT_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH = 512
+BULK_LIMIT = 1000
+MAX_BODY_BYTES = 1 << 20
+
+_VARIANT_MODULES = {VARIANT_REPORT: report_variant, VARIANT_MANSE: manse_variant}
+
+_STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                405: "Method Not Allowed", 413: "Payload Too Large", 414: "URI Too Long",
+                431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(ValueError):
+    """잘못된 요청 (400 으로 응답)."""
+
+
+# ---------------------------------------------------------
+# 입력 해석
+# ---------------------------------------------------------
+def parse_chart_request(data) -> tuple:
+    """{"date", "hour", "variant", "year"} → (date, 시지 인덱스 또는 None, variant, 운세 연도)."""
+    if not isinstance(data, dict):
+        raise RequestError("요청은 JSON 객체여야 합니다.")
+    try:
+        solar_date = date.fromisoformat(str(data["date"]))
+    except KeyError:
+        raise RequestError("date 가 필요합니다. (예: 1990-05-17)") from None
+    except ValueError:
+        raise RequestError(f"date 형식이 올바르지 않습니다: {data['date']}") from None
+
+    hour = data.get("hour")
+    if hour in (None, "", "모름"):
+        branch = None
+    else:
+        try:
+            hour = int(hour)
+        except (TypeError, ValueError):
+            raise RequestError(f"hour 는 0~23 정수여야 합니다: {hour}") from None
+        if not 0 <= hour < 24:
+            raise RequestError(f"hour 는 0~23 정수여야 합니다: {hour}")
+        branch = hours.hour_branch(hour)
+
+    variant = data.get("variant") or VARIANT_REPORT
+    if variant not in _VARIANT_MODULES:
+        raise RequestError(f"variant 는 {VARIANT_REPORT} 또는 {VARIANT_MANSE} 입니다: {variant}")
+
+    year = data.get("year")
+    if year in (None, ""):
+        year = DEFAULT_YEAR
+    else:
+        first, last = manse_table.MIN_DATE.year, manse_table.MAX_DATE.year
+        try:
+            year = int(year)
+        except (TypeError, ValueError):
+            raise RequestError(f"year 는 {first}~{last} 정수여야 합니다: {year}") from None
+        if not first <= year <= last:
+            raise RequestError(f"year 는 {first}~{last} 정수여야 합니다: {year}")
+    return solar_date, branch, variant, year
+
+
+# ---------------------------------------------------------
+# 배치 계산
+# ---------------------------------------------------------
+def compute_reports(items):
+    """
+    [(date, 시지, variant, 운세 연도)] → [SajuReport 또는 None]. 간지는 배열 한 번으로 조회하고
+    결과는 공용 캐시에 넣는다.
+    """
+    dates = np.array([item[0] for item in items], dtype="datetime64[D]")
+    branches = np.array([-1 if item[1] is None else item[1] for item in items], dtype=np.int64)
+    rows = gapja_batch(dates, branches)
+
+    reports = []
+    for (solar_date, branch, variant, fortune_year), row in zip(items, rows.tolist()):
+        year, month, day, hour, leap = row
+        if year < 0:
+            reports.append(None)
+            continue
+        pillars = Pillars(year, month, day, None if hour < 0 else hour, leap)
+        report = _VARIANT_MODULES[variant].report_from_pillars(solar_date, branch, pillars, fortune_year)
+        report_cache.put(report.key, report)
+        reports.append(report)
+    return reports
+
+
+class ChartBatcher:
+    """
+    window 초 안에 들어온 캐시 미스 요청을 모아 compute_reports 한 번으로 계산한다.
+    계산은 작업 스레드에서 돌리고, 같은 키로 동시에 들어온 요청(계산 중인 것 포함)은
+    같은 Future 를 기다린다.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW_MS / 1000, max_batch: int = DEFAULT_MAX_BATCH):
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.batched_items = 0
+        self._pending = {}
+        self._running = {}
+        self._tasks = set()
+        self._timer = None
+
+    async def get(self, solar_date, branch, variant, year=DEFAULT_YEAR):
+        key = report_key(solar_date, branch, variant, year)
+        report = report_cache.get(key)
+        if report is not None:
+            return report
+
+        entry = self._pending.get(key) or self._running.get(key)
+        if entry is not None:
+            return await entry[0]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[key] = (future, (solar_date, branch, variant, year))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        self.batches += 1
+        self.batched_items += len(pending)
+        self._running.update(pending)
+        task = asyncio.get_running_loop().create_task(self._compute(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _compute(self, pending):
+        entries = list(pending.values())
+        try:
+            reports = await asyncio.to_thread(compute_reports, [item for _future, item in entries])
+        except Exception as exc:  # 배치 전체 실패 → 기다리는 요청 모두에 전달
+            for future, _item in entries:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        finally:
+            for key in pending:
+                self._running.pop(key, None)
+        for (future, _item), report in zip(entries, reports):
+            if not future.done():
+                future.set_result(report)
+
+    def stats(self) -> dict:
+        return {"batches": self.batches, "batched_items": self.batched_items,
+                "pending": len(self._pending), "running": len(self._running)}
+
+
+# ---------------------------------------------------------
+# 라우팅
+# ---------------------------------------------------------
+class ChartService:
+    def __init__(self, batcher: ChartBatcher):
+        self.batcher = batcher
+
+    async def chart(self, data):
+        report = await self.batcher.get(*parse_chart_request(data))
+        if report is None:
+            raise RequestError("해당 날짜는 만세력 범위를 벗어났습니다. (지원: 1000~2050년)")
+        return report.to_dict()
+
+    async def charts(self, data):
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            raise RequestError('{"items": [...]} 형식이어야 합니다.')
+        if len(items) > BULK_LIMIT:
+            raise RequestError(f"items 는 최대 {BULK_LIMIT}개입니다.")
+
+        async def one(item):
+            try:
+                return await self.chart(item)
+            except RequestError as exc:
+                return {"error": str(exc)}
+
+        return {"results": await asyncio.gather(*(one(item) for item in items))}
+
+    async def timeline(self, data):
+        solar_date, branch, variant, year = parse_chart_request(data)
+        try:
+            offset = int(data.get("offset") or 0)
+            limit = int(data.get("limit") or monthly.MONTHS)
+        except (TypeError, ValueError):
+            raise RequestError("offset/limit 는 정수여야 합니다.") from None
+        if not 0 <= offset < monthly.MONTHS or limit < 1:
+            raise RequestError(f"offset 은 0~{monthly.MONTHS - 1}, limit 은 1 이상이어야 합니다.")
+
+        report = await self.batcher.get(solar_date, branch, variant, year)
+        if report is None:
+            raise RequestError("해당 날짜는 만세력 범위를 벗어났습니다. (지원: 1000~2050년)")
+        try:
+            months = [m.to_dict() for m in
+                      monthly.timeline(year, report.day_element, report.counts, offset, limit)]
+        except ValueError as exc:
+            raise RequestError(str(exc)) from None
+        return {"year": year, "offset": offset, "total": monthly.MONTHS, "months": months}
+
+    async def dispatch(self, method: str, target: str, body: bytes):
+        url = urlsplit(target)
+        path = url.path.rstrip("/") or "/"
+
+        if path == "/health":
+            return 200, {"status": "ok", "cache": report_cache.stats(), "batcher": self.batcher.stats()}
+        if path not in ("/v1/chart", "/v1/charts", "/v1/timeline"):
+            return 404, {"error": f"없는 경로: {path}"}
+
+        if method == "GET" and path in ("/v1/chart", "/v1/timeline"):
+            data = dict(parse_qsl(url.query))
+        elif method == "POST":
+            try:
+                data = json.loads(body or b"null")
+            except ValueError:
+                return 400, {"error": "JSON 본문을 읽을 수 없습니다."}
+        else:
+            return 405, {"error": f"{method} 는 지원하지 않습니다."}
+
+        try:
+            if path == "/v1/chart":
+                return 200, await self.chart(data)
+            if path == "/v1/timeline":
+                return 200, await self.timeline(data)
+            return 200, await self.charts(data)
+        except RequestError as exc:
+            return 400, {"error": str(exc)}
+
+
+# ---------------------------------------------------------
+# HTTP/1.1 연결 처리
+# ---------------------------------------------------------
+def _response(status: int, payload, keep_alive: bool) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("ascii") + body
+
+
+async def _read_line(reader):
+    """한 줄 읽기. 스트림 한도(기본 64KiB)보다 긴 줄이면 None."""
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        return None
+
+
+async def handle_connection(service: ChartService, reader, writer):
+    try:
+        while True:
+            request_line = await _read_line(reader)
+            if request_line is None:
+                writer.write(_response(414, {"error": "요청 줄이 너무 깁니다."}, False))
+                break
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(_response(400, {"error": "잘못된 요청 줄"}, False))
+                break
+
+            headers = {}
+            while True:
+                line = await _read_line(reader)
+                if line is None or line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if line is None:
+                writer.write(_response(431, {"error": "헤더 줄이 너무 깁니다."}, False))
+                break
+
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                writer.write(_response(400, {"error": "Content-Length 가 올바르지 않습니다."}, False))
+                break
+            if length > MAX_BODY_BYTES:
+                writer.write(_response(413, {"error": "본문이 너무 큽니다."}, False))
+                break
+            body = await reader.readexactly(length) if length else b""
+
+            try:
+                status, payload = await service.dispatch(method.upper(), target, body)
+            except Exception as exc:  # 예상 못 한 오류도 JSON 으로 알림
+                status, payload = 500, {"error": f"{type(exc).__name__}: {exc}"}
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                window_ms: float = DEFAULT_WINDOW_MS, max_batch: int = DEFAULT_MAX_BATCH):
+    service = ChartService(ChartBatcher(window_ms / 1000, max_batch))
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(service, r, w), host, port
+    )
+    print(f"사주 JSON 서비스: http://{host}:{port}  (배치 창 {window_ms}ms, 최대 {max_batch}건)", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사주 계산 JSON/HTTP 서비스")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS,
+                        help="요청을 모으는 시간 (0 이면 이벤트 루프 한 바퀴)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    args = parser.parse_args()
+
+    from saju_engine import manse_table
+    manse_table.load_table()  # 첫 요청 전에 테이블 로드
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+역색인 – "이런 간지·오행 조합이 나오는 날짜는?" 을 찾는 조회.
+
+만세력 테이블 전 범위(1000-02-13 ~ 2050-12-31, 그레고리력 공백 제외)의 하루하루를
+다섯 가지 값으로 색인합니다.
+
+- year, month, day : 연·월·일 60갑자 인덱스 (만세력 테이블 기준, 앱과 같은 결과)
+- dominant, weak   : 연·월·일 세 기둥의 오행 분포(manse_variant.get_element_distribution 과
+                     같은 천간 2점·지지 1점)에서 가장 많은/적은 오행 (동점이면 목·화·토·금·수 순 앞쪽)
+
+항목마다 값별로 해당 날짜 ordinal 을 오름차순으로 모아 둔 게시 목록(posting list)이 있고,
+여러 조건은 정렬 배열 교집합으로 계산합니다. 조건마다 먼저 기간으로 잘라 낸 뒤 가장 짧은
+목록부터 searchsorted 로 걸러 나가므로 결과가 작을수록 빠릅니다.
+
+색인은 한 번 만들어 파일 하나로 저장하고 이후에는 mmap 으로 읽습니다. 색인은 만세력 테이블에서
+만들어지므로, 헤더에 만든 때의 테이블 형식 버전과 레코드 CRC32 를 적어 두고 지금 테이블과
+다르면(테이블을 다시 만들었거나 SAJU_MANSE_TABLE 이 다른 파일이면) 새로 만듭니다.
+
+    헤더(32바이트) = 매직 b"SAJUSIGX", 색인 버전, 테이블 형식 버전, 테이블 CRC32, 행 수, 열 수
+    본문 = int32 (5, 61 + 날짜 수) 배열, 행 = FIELDS 순서
+    행[:61]  = 값별 시작 위치 (값 v 의 목록은 postings[offsets[v]:offsets[v + 1]], 남는 칸은 날짜 수)
+    행[61:]  = 값 → ordinal 순으로 정렬한 날짜 ordinal
+
+    query(day="임오", dominant="화", start=date(1990, 1, 1), end=date(2000, 12, 31))
+    to_ranges(ordinals)     # [(date, date), ...] 연속 구간
+
+    python -m saju_engine.signature_index build [경로]
+    python -m saju_engine.signature_index --day 임오 --dominant 화 --from 1990-01-01 --to 2000-12-31
+"""
+
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import threading
+from datetime import date
+
+import numpy as np
+
+from saju_engine import manse_table
+from saju_engine.batch import gapja_batch
+from saju_engine.manse_table import GAPJA_NAMES
+from saju_engine.pillars import BRANCH_ELEMENT, ELEMENTS, STEM_ELEMENT
+
+FIELDS = ("year", "month", "day", "dominant", "weak")
+FIELD_SIZES = {"year": 60, "month": 60, "day": 60, "dominant": 5, "weak": 5}
+
+HEADER = 61
+# 색인에 들어가는 날 수 (만세력 테이블 일수에서 1582년 그레고리력 공백을 뺀 값)
+INDEXED_DAYS = manse_table.DAY_COUNT - (manse_table.GREGORIAN_GAP[1] - manse_table.GREGORIAN_GAP[0] + 1)
+
+INDEX_MAGIC = b"SAJUSIGX"
+INDEX_VERSION = 1
+FILE_HEADER = struct.Struct("<8sHHIII8x")   # 매직, 색인 버전, 테이블 버전, 테이블 CRC32, 행, 열, 예비
+FILE_HEADER_SIZE = FILE_HEADER.size         # 32
+
+DEFAULT_INDEX_PATH = os.environ.get(
+    "SAJU_SIGNATURE_INDEX",
+    os.path.join(os.path.dirname(__file__), "data", "signature_index.bin"),
+)
+
+_GANJI_INDEX = {name: i for i, name in enumerate(GAPJA_NAMES)}
+
+_index = None
+_index_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# 색인 생성
+# ---------------------------------------------------------
+def day_ordinals() -> np.ndarray:
+    """색인 대상 날짜 ordinal 전체 (그레고리력 공백 제외) int64 배열."""
+    ordinals = np.arange(manse_table.BASE_ORDINAL, manse_table.BASE_ORDINAL + manse_table.DAY_COUNT,
+                         dtype=np.int64)
+    gap_start, gap_end = manse_table.GREGORIAN_GAP
+    return ordinals[(ordinals < gap_start) | (ordinals > gap_end)]
+
+
+def signature_values(ordinals) -> dict:
+    """날짜 ordinal 배열 → 항목별 값 배열 {year, month, day, dominant, weak}."""
+    result = gapja_batch(ordinals)
+    if (result["day"] < 0).any():
+        raise ValueError("만세력 테이블 범위 밖의 날짜가 있습니다.")
+    values = {field: result[field].astype(np.int64) for field in ("year", "month", "day")}
+
+    # 천간 2점·지지 1점 – get_element_distribution 과 같은 가중치
+    stem_element = np.array(STEM_ELEMENT, dtype=np.int64)
+    branch_element = np.array(BRANCH_ELEMENT, dtype=np.int64)
+    counts = np.zeros((len(result), 5), dtype=np.int64)
+    rows = np.arange(len(result))
+    for field in ("year", "month", "day"):
+        g = values[field]
+        counts[rows, stem_element[g % 10]] += 2
+        counts[rows, branch_element[g % 12]] += 1
+    values["dominant"] = counts.argmax(axis=1)
+    values["weak"] = counts.argmin(axis=1)
+    return values
+
+
+def build_index() -> np.ndarray:
+    """(5, HEADER + INDEXED_DAYS) int32 색인 배열을 만든다."""
+    ordinals = day_ordinals()
+    values = signature_values(ordinals)
+    index = np.empty((len(FIELDS), HEADER + len(ordinals)), dtype=np.int32)
+    for row, field in enumerate(FIELDS):
+        v = values[field]
+        # 안정 정렬이라 같은 값 안에서는 ordinal 오름차순이 유지된다
+        order = np.argsort(v, kind="stable")
+        offsets = np.full(HEADER, len(ordinals), dtype=np.int64)
+        offsets[0] = 0
+        offsets[1:FIELD_SIZES[field] + 1] = np.cumsum(np.bincount(v, minlength=FIELD_SIZES[field]))
+        index[row, :HEADER] = offsets
+        index[row, HEADER:] = ordinals[order]
+    return index
+
+
+def pack_file_header(index: np.ndarray) -> bytes:
+    """색인 배열 → 파일 헤더 (지금 불러온 만세력 테이블의 버전·체크섬 포함)."""
+    rows, cols = index.shape
+    return FILE_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, manse_table.FORMAT_VERSION,
+                            manse_table.table_checksum(), rows, cols)
+
+
+def save_index(index: np.ndarray, path: str = DEFAULT_INDEX_PATH):
+    """색인을 고유한 임시 파일에 쓴 뒤 바꿔 끼운다 (manse_table.save_table 과 같은 방식)."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + ".",
+                                     suffix=".tmp", delete=False) as f:
+        try:
+            f.write(pack_file_header(index))
+            f.write(np.ascontiguousarray(index, dtype="<i4").tobytes())
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    os.chmod(f.name, 0o644)
+    os.replace(f.name, path)
+
+
+def read_index_file(path: str):
+    """
+    색인 파일 → 읽기 전용 mmap 배열. 헤더가 지금 만세력 테이블(버전·CRC32)이나
+    색인 모양과 맞지 않으면 None.
+    """
+    with open(path, "rb") as f:
+        head = f.read(FILE_HEADER_SIZE)
+    if len(head) < FILE_HEADER_SIZE:
+        return None
+    magic, version, table_version, table_crc, rows, cols = FILE_HEADER.unpack(head)
+    if (magic, version) != (INDEX_MAGIC, INDEX_VERSION):
+        return None
+    if (table_version, table_crc) != (manse_table.FORMAT_VERSION, manse_table.table_checksum()):
+        return None
+    if (rows, cols) != (len(FIELDS), HEADER + INDEXED_DAYS):
+        return None
+    if os.path.getsize(path) != FILE_HEADER_SIZE + rows * cols * 4:
+        return None
+    index = np.memmap(path, dtype="<i4", mode="r", offset=FILE_HEADER_SIZE, shape=(rows, cols))
+    return index if _valid(index) else None
+
+
+def _valid(index) -> bool:
+    if index.shape != (len(FIELDS), HEADER + INDEXED_DAYS) or index.dtype != np.int32:
+        return False
+    offsets = index[:, :HEADER]
+    return bool((offsets[:, 0] == 0).all() and (offsets[:, -1] == INDEXED_DAYS).all()
+                and (np.diff(offsets, axis=1) >= 0).all())
+
+
+def load_index(path: str = DEFAULT_INDEX_PATH) -> np.ndarray:
+    """
+    색인을 프로세스당 한 번만 연다. 파일은 mmap 으로 읽어 필요한 부분만 메모리에 올라온다.
+    파일이 없거나, 모양이 맞지 않거나, 다른 만세력 테이블에서 만든 것이면 새로 만들어 저장을 시도한다.
+    """
+    global _index
+    if _index is not None:
+        return _index
+
+    with _index_lock:
+        if _index is not None:
+            return _index
+
+        index = None
+        if os.path.exists(path):
+            try:
+                index = read_index_file(path)
+            except (ValueError, OSError):
+                index = None
+        if index is None:
+            index = build_index()
+            try:
+                save_index(index, path)
+                mapped = read_index_file(path)
+                if mapped is not None:
+                    index = mapped
+            except OSError:
+                pass  # 읽기 전용 배포 환경이면 메모리에만 둔다
+
+        _index = index
+        return _index
+
+
+# ---------------------------------------------------------
+# 조회
+# ---------------------------------------------------------
+def field_value(field: str, value) -> int:
+    """조건 값 → 정수. 간지('임오'), 오행('화'), 정수 인덱스를 받는다."""
+    if field not in FIELD_SIZES:
+        raise ValueError(f"알 수 없는 항목입니다: {field}")
+    if isinstance(value, str):
+        text = value.strip()
+        table = _GANJI_INDEX if FIELD_SIZES[field] == 60 else {e: i for i, e in enumerate(ELEMENTS)}
+        if text not in table:
+            raise ValueError(f"{field} 값으로 쓸 수 없습니다: {value}")
+        return table[text]
+    number = int(value)
+    if not 0 <= number < FIELD_SIZES[field]:
+        raise ValueError(f"{field} 값은 0~{FIELD_SIZES[field] - 1} 사이여야 합니다: {value}")
+    return number
+
+
+def postings(field: str, value) -> np.ndarray:
+    """항목 값 하나의 날짜 ordinal 목록 (오름차순, 색인 mmap 의 view)."""
+    v = field_value(field, value)
+    row = FIELDS.index(field)
+    index = load_index()
+    start, stop = index[row, v], index[row, v + 1]
+    return index[row, HEADER + start:HEADER + stop]
+
+
+def _ordinal(value, default: int) -> int:
+    if value is None:
+        return default
+    if isinstance(value, date):
+        return value.toordinal()
+    return int(value)
+
+
+def intersect(lists) -> np.ndarray:
+    """오름차순 정렬 배열들의 교집합. 가장 짧은 배열부터 searchsorted 로 거른다."""
+    lists = sorted(lists, key=len)
+    result = np.asarray(lists[0], dtype=np.int64)
+    for other in lists[1:]:
+        if not len(result):
+            break
+        pos = np.searchsorted(other, result)
+        found = pos < len(other)
+        found[found] = other[pos[found]] == result[found]
+        result = result[found]
+    return result
+
+
+def query(year=None, month=None, day=None, dominant=None, weak=None, start=None, end=None) -> np.ndarray:
+    """
+    주어진 조건을 모두 만족하는 날짜 ordinal 오름차순 int64 배열.
+    start/end 는 date 또는 ordinal (양끝 포함). 조건이 하나도 없으면 ValueError.
+    """
+    conditions = {"year": year, "month": month, "day": day, "dominant": dominant, "weak": weak}
+    conditions = {field: value for field, value in conditions.items() if value is not None}
+    if not conditions:
+        raise ValueError("조건을 하나 이상 지정해야 합니다.")
+
+    lo = _ordinal(start, manse_table.BASE_ORDINAL)
+    hi = _ordinal(end, manse_table.BASE_ORDINAL + manse_table.DAY_COUNT - 1)
+    lists = []
+    for field, value in conditions.items():
+        ordinals = postings(field, value)
+        i, j = np.searchsorted(ordinals, [lo, hi + 1])
+        lists.append(ordinals[i:j])
+    return intersect(lists)
+
+
+def to_ranges(ordinals):
+    """날짜 ordinal 오름차순 배열 → 연속 구간 [(시작 date, 끝 date), ...]."""
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    if not len(ordinals):
+        return []
+    # 그레고리력 공백(1582-10-04 → 10-15)은 하루 차이로 본다
+    gap = manse_table.GREGORIAN_GAP
+    step = np.diff(ordinals)
+    step[(ordinals[:-1] == gap[0] - 1) & (ordinals[1:] == gap[1] + 1)] = 1
+    breaks = np.flatnonzero(step != 1)
+    starts = np.concatenate([[0], breaks + 1])
+    stops = np.concatenate([breaks, [len(ordinals) - 1]])
+    return [(date.fromordinal(int(ordinals[a])), date.fromordinal(int(ordinals[b])))
+            for a, b in zip(starts, stops)]
+
+
+def query_ranges(start=None, end=None, **conditions):
+    """query() 결과를 연속 날짜 구간 목록으로."""
+    return to_ranges(query(start=start, end=end, **conditions))
+
+
+# ---------------------------------------------------------
+# 명령행
+# ---------------------------------------------------------
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "build":
+        path = argv[1] if len(argv) > 1 else DEFAULT_INDEX_PATH
+        save_index(build_index(), path)
+        print(f"저장 완료: {path} ({INDEXED_DAYS:,}일)")
+        return
+
+    parser = argparse.ArgumentParser(description="간지·오행 조건으로 날짜 구간 찾기")
+    for field in FIELDS:
+        parser.add_argument(f"--{field}", help="간지(예: 임오)" if FIELD_SIZES[field] == 60 else "오행(예: 화)")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, help="시작일 (포함)")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, help="종료일 (포함)")
+    parser.add_argument("--limit", type=int, default=20, help="출력할 구간 수")
+    args = parser.parse_args(argv)
+
+    conditions = {field: getattr(args, field) for field in FIELDS}
+    try:
+        ordinals = query(start=args.start, end=args.end, **conditions)
+    except ValueError as e:
+        parser.error(str(e))
+    ranges = to_ranges(ordinals)
+    print(f"{len(ordinals):,}일, {len(ranges):,}개 구간")
+    for first, last in ranges[:args.limit]:
+        print(f"  {first}" if first == last else f"  {first} ~ {last}")
+
+
+if __name__ == "__main__":
+    main()
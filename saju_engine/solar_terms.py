@@ -0,0 +1,361 @@
+"""
+절기(節氣) 인덱스와 절기 기준 월주 계산.
+
+해마다 24절기의 시각을 태양 시황경으로 미리 계산해 정렬된 int64 배열에 담아 두고,
+월주는 이진 탐색(bisect / np.searchsorted) 한 번으로 구합니다.
+
+- 시각은 한국 표준시(UTC+9) 기준 "분" 단위 키로 저장합니다.
+      키 = date.toordinal() * 1440 + 시 * 60 + 분
+  그래서 절입 시각 직전·직후에 태어난 경우도 분 단위로 구분됩니다.
+- 태양 황경은 Meeus『Astronomical Algorithms』의 VSOP87 요약 급수로, 역표시→세계시는
+  ΔT 다항식 근사로 변환합니다. 근대 연도에서는 천문연구원 발표 시각과 1분 이내로 맞습니다.
+- 절(節) 12개(소한·입춘·경칩·…·대설)가 월의 경계이고, 입춘이 사주 연도의 경계입니다.
+
+참고: KoreanLunarCalendar.getGapJaString() 의 월 간지는 절기가 아니라 음력 월 기준이라
+이 모듈의 결과와 다를 수 있습니다. 앱의 기본 출력은 만세력 테이블(라이브러리 기준)을 따르고,
+이 모듈은 절기 기준 월주가 필요한 곳에서 씁니다.
+"""
+
+import bisect
+import os
+import tempfile
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+# 양력 1월부터 순서대로 (이름, 태양 황경)
+SOLAR_TERMS = [
+    ("소한", 285), ("대한", 300), ("입춘", 315), ("우수", 330),
+    ("경칩", 345), ("춘분", 0), ("청명", 15), ("곡우", 30),
+    ("입하", 45), ("소만", 60), ("망종", 75), ("하지", 90),
+    ("소서", 105), ("대서", 120), ("입추", 135), ("처서", 150),
+    ("백로", 165), ("추분", 180), ("한로", 195), ("상강", 210),
+    ("입동", 225), ("소설", 240), ("대설", 255), ("동지", 270),
+]
+TERM_NAMES = [name for name, _ in SOLAR_TERMS]
+
+# 절(節)은 짝수 위치(소한, 입춘, 경칩, ...), 중기(中氣)는 홀수 위치
+JEOL_NAMES = TERM_NAMES[0::2]
+
+FIRST_YEAR = 999
+LAST_YEAR = 2051
+TZ_OFFSET_MINUTES = 9 * 60
+
+MINUTES_PER_DAY = 1440
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "SAJU_SOLAR_TERMS",
+    os.path.join(os.path.dirname(__file__), "data", "solar_terms.npy"),
+)
+_JD_AT_ORDINAL_ZERO = 1721424.5  # ordinal 0 의 자정(UT) 율리우스일
+
+_lock = threading.Lock()
+_terms = None       # shape (연도 수, 24) int64 분 키
+_jeol_keys = None   # 절 12개 × 연도 수, 1차원 정렬 배열
+_jeol_list = None   # 단일 조회용 파이썬 리스트 (bisect)
+
+# 갑자년(1984) 입춘 → 병인월(60갑자 2) 을 기준으로 월 번호 → 월주 보정값
+_MONTH_GAPJA_OFFSET = (2 - ((1984 - FIRST_YEAR) * 12 + 1)) % 60
+
+
+# ---------------------------------------------------------
+# 천문 계산
+# ---------------------------------------------------------
+# 지구 일심 황경 VSOP87 요약 급수 (Meeus 부록 III) – (A, B, C): A·cos(B + C·τ)
+_VSOP87_L = (
+    (  # L0
+        (175347046, 0, 0), (3341656, 4.6692568, 6283.0758500), (34894, 4.6261, 12566.1517),
+        (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+        (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+        (1273, 2.0371, 529.6910), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+        (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694), (753, 2.533, 5507.553),
+        (505, 4.583, 18849.228), (492, 4.205, 775.523), (357, 2.920, 0.067),
+        (317, 5.849, 11790.629), (284, 1.899, 796.298), (271, 0.315, 10977.079),
+        (243, 0.345, 5486.778), (206, 4.806, 2544.314), (205, 1.869, 5573.143),
+        (202, 2.458, 6069.777), (156, 0.833, 213.299), (132, 3.411, 2942.463), (126, 1.083, 20.775),
+        (115, 0.645, 0.980), (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+        (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69), (85, 1.30, 6275.96),
+        (85, 3.67, 71430.70), (80, 1.81, 17260.15), (79, 3.04, 12036.46), (75, 1.76, 5088.63),
+        (74, 3.50, 3154.69), (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+        (61, 1.82, 7084.90), (57, 2.78, 6286.60), (56, 4.39, 14143.50), (56, 3.47, 6279.55),
+        (52, 0.19, 12139.55), (52, 1.33, 1748.02), (51, 0.28, 5856.48), (49, 0.49, 1194.45),
+        (41, 5.37, 8429.24), (41, 2.40, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+        (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77), (33, 0.59, 17789.85),
+        (30, 0.44, 83996.85), (30, 2.74, 1349.87), (25, 3.16, 4690.48),
+    ),
+    (  # L1
+        (628331966747, 0, 0), (206059, 2.678235, 6283.075850), (4303, 2.6351, 12566.1517),
+        (425, 1.590, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344), (93, 2.59, 18849.23),
+        (72, 1.14, 529.69), (68, 1.87, 398.15), (67, 4.41, 5507.55), (59, 2.89, 5223.69),
+        (56, 2.17, 155.42), (45, 0.40, 796.30), (36, 0.47, 775.52), (29, 2.65, 7.11),
+        (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.30), (17, 2.99, 6275.96),
+        (16, 0.03, 2544.31), (16, 1.43, 2146.17), (15, 1.21, 10977.08), (12, 2.83, 1748.02),
+        (12, 3.26, 5088.63), (12, 5.27, 1194.45), (12, 2.08, 4694.00), (11, 0.77, 553.57),
+        (10, 1.30, 6286.60), (10, 4.24, 1349.87), (9, 2.70, 242.73), (9, 5.64, 951.72),
+        (8, 5.30, 2352.87), (6, 2.65, 9437.76), (6, 4.67, 4690.48),
+    ),
+    (  # L2
+        (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152), (27, 0.05, 3.52),
+        (16, 5.19, 26.30), (16, 3.68, 155.42), (10, 0.76, 18849.23), (9, 2.06, 77713.77),
+        (7, 0.83, 775.52), (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+        (3, 5.14, 796.30), (3, 6.05, 5507.55), (3, 1.19, 242.73), (3, 6.12, 529.69),
+        (3, 0.31, 398.15), (3, 2.28, 553.57), (2, 4.38, 5223.69), (2, 3.75, 0.98),
+    ),
+    (  # L3
+        (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15), (3, 5.20, 155.42),
+        (1, 4.72, 3.52), (1, 5.30, 18849.23), (1, 5.97, 242.73),
+    ),
+    (  # L4
+        (114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15),
+    ),
+    (  # L5
+        (1, 3.14, 0),
+    ),
+)
+_VSOP87_ARRAYS = [tuple(np.array(col, dtype=np.float64) for col in zip(*series)) for series in _VSOP87_L]
+
+
+def _delta_t_seconds(year):
+    """ΔT(TT-UT) 근사값(초). Espenak & Meeus 다항식."""
+    y = float(year)
+    if y < 1600:
+        u = (y - 1000) / 100
+        return (1574.2 - 556.01 * u + 71.23472 * u**2 + 0.319781 * u**3
+                - 0.8503463 * u**4 - 0.005050998 * u**5 + 0.0083572073 * u**6)
+    if y < 1700:
+        t = y - 1600
+        return 120 - 0.9808 * t - 0.01532 * t**2 + t**3 / 7129
+    if y < 1800:
+        t = y - 1700
+        return 8.83 + 0.1603 * t - 0.0059285 * t**2 + 0.00013336 * t**3 - t**4 / 1174000
+    if y < 1860:
+        t = y - 1800
+        return (13.72 - 0.332447 * t + 0.0068612 * t**2 + 0.0041116 * t**3 - 0.00037436 * t**4
+                + 0.0000121272 * t**5 - 0.0000001699 * t**6 + 0.000000000875 * t**7)
+    if y < 1900:
+        t = y - 1860
+        return 7.62 + 0.5737 * t - 0.251754 * t**2 + 0.01680668 * t**3 - 0.0004473624 * t**4 + t**5 / 233174
+    if y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t**2 / 260 - t**3 / 718
+    if y < 2005:
+        t = y - 2000
+        return 63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3 + 0.000651814 * t**4 + 0.00002373599 * t**5
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t**2
+    u = (y - 1820) / 100
+    return -20 + 32 * u**2 - 0.5628 * (2150 - y)
+
+
+def _apparent_solar_longitude(jde):
+    """율리우스 역표일(배열) → 태양 시황경(도). VSOP87 + FK5 보정 + 장동 + 광행차."""
+    jde = np.asarray(jde, dtype=np.float64)
+    tau = (jde - 2451545.0) / 365250.0
+    t = tau * 10
+
+    helio = np.zeros_like(jde)
+    for power, series in enumerate(_VSOP87_ARRAYS):
+        a, b, c = series
+        helio += (a * np.cos(b + c * tau[..., None])).sum(axis=-1) * tau**power
+    theta = np.degrees(helio / 1e8) + 180.0 - 0.09033 / 3600
+
+    omega = np.radians(125.04452 - 1934.136261 * t)
+    sun_mean = np.radians(280.4665 + 36000.7698 * t)
+    moon_mean = np.radians(218.3165 + 481267.8813 * t)
+    nutation = (-17.20 * np.sin(omega) - 1.32 * np.sin(2 * sun_mean)
+                - 0.23 * np.sin(2 * moon_mean) + 0.21 * np.sin(2 * omega)) / 3600
+    aberration = -20.4898 / 3600
+    return (theta + nutation + aberration) % 360.0
+
+
+def _compute_terms(first_year: int, last_year: int) -> np.ndarray:
+    """연도 × 24절기 시각을 KST 분 키로 계산한다."""
+    years = np.arange(first_year, last_year + 1, dtype=np.float64)[:, None]
+    degrees = np.array([deg for _, deg in SOLAR_TERMS], dtype=np.float64)[None, :]
+    relative = np.where(degrees > 280, degrees - 360, degrees)
+
+    # 춘분(2000년 3월 20일 무렵) 기준 초기 추정 후 뉴턴 반복
+    jde = 2451623.81 + (years - 2000) * 365.2422 + relative / 360.0 * 365.2422
+    for _ in range(10):
+        diff = (degrees - _apparent_solar_longitude(jde) + 180.0) % 360.0 - 180.0
+        step = 58.13 * np.sin(np.radians(diff))
+        jde = jde + step
+        if np.abs(step).max() < 1e-7:
+            break
+
+    delta_t = np.array([_delta_t_seconds(y) for y in years[:, 0]])[:, None]
+    jd_ut = jde - delta_t / 86400.0
+    local_days = jd_ut - _JD_AT_ORDINAL_ZERO + TZ_OFFSET_MINUTES / MINUTES_PER_DAY
+    return np.floor(local_days * MINUTES_PER_DAY + 0.5).astype(np.int64)
+
+
+def _load_or_compute_terms(path: str) -> np.ndarray:
+    """계산 결과를 .npy 로 저장해 두고 다음 프로세스부터는 읽기만 한다."""
+    shape = (LAST_YEAR - FIRST_YEAR + 1, 24)
+    if os.path.exists(path):
+        terms = np.load(path)
+        if terms.shape == shape and terms.dtype == np.int64:
+            return terms
+
+    terms = _compute_terms(FIRST_YEAR, LAST_YEAR)
+    try:
+        # 고유한 임시 파일에 쓴 뒤 바꿔 끼워, 동시에 읽는 프로세스가 반쯤 쓴 파일을 보지 않게 한다
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + ".",
+                                         suffix=".tmp", delete=False) as f:
+            np.save(f, terms)
+        os.chmod(f.name, 0o644)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+    return terms
+
+
+def _ensure_index():
+    global _terms, _jeol_keys, _jeol_list
+    if _terms is not None:
+        return
+    with _lock:
+        if _terms is not None:
+            return
+        terms = _load_or_compute_terms(DEFAULT_CACHE_PATH)
+        jeol = np.ascontiguousarray(terms[:, 0::2]).ravel()
+        _jeol_list = jeol.tolist()
+        _jeol_keys = jeol
+        _terms = terms
+
+
+def term_table() -> np.ndarray:
+    """(연도 수, 24) 절기 시각 분 키 배열. 행 i 는 FIRST_YEAR + i 년."""
+    _ensure_index()
+    return _terms
+
+
+# ---------------------------------------------------------
+# 시각 ↔ 분 키 변환
+# ---------------------------------------------------------
+def minute_key(value, hour: int = 0, minute: int = 0) -> int:
+    """date/datetime → KST 분 키. date 에는 hour/minute 을 따로 줄 수 있다."""
+    if isinstance(value, datetime):
+        return value.toordinal() * MINUTES_PER_DAY + value.hour * 60 + value.minute
+    return value.toordinal() * MINUTES_PER_DAY + hour * 60 + minute
+
+
+def key_to_datetime(key: int) -> datetime:
+    ordinal, minutes = divmod(int(key), MINUTES_PER_DAY)
+    return datetime.combine(date.fromordinal(ordinal), datetime.min.time()) + timedelta(minutes=minutes)
+
+
+def minute_keys(values) -> np.ndarray:
+    """datetime64 배열(분 이하 정밀도 무관) → int64 분 키 배열."""
+    arr = np.asarray(values)
+    if not np.issubdtype(arr.dtype, np.datetime64):
+        arr = arr.astype("datetime64[m]")
+    minutes = arr.astype("datetime64[m]").astype(np.int64)
+    return minutes + date(1970, 1, 1).toordinal() * MINUTES_PER_DAY
+
+
+# ---------------------------------------------------------
+# 절기 기준 월주 / 연주
+# ---------------------------------------------------------
+def _jeol_position(key: int) -> int:
+    _ensure_index()
+    pos = bisect.bisect_right(_jeol_list, key) - 1
+    if pos < 0 or pos >= len(_jeol_list) - 1:
+        raise ValueError("절기 인덱스 범위를 벗어난 시각입니다.")
+    return pos
+
+
+def month_gapja_from_key(key: int) -> int:
+    """KST 분 키 → 절기 기준 월주 60갑자 인덱스."""
+    return (_jeol_position(key) + _MONTH_GAPJA_OFFSET) % 60
+
+
+def month_pillar(value, hour: int = 0, minute: int = 0) -> int:
+    """date/datetime → 절기 기준 월주 60갑자 인덱스(0~59)."""
+    return month_gapja_from_key(minute_key(value, hour, minute))
+
+
+def year_gapja_from_key(key: int) -> int:
+    """KST 분 키 → 입춘 기준 연주 60갑자 인덱스."""
+    pos = _jeol_position(key)
+    saju_year = FIRST_YEAR + (pos - 1) // 12  # 입춘(각 해 두 번째 절) 이전이면 전년도
+    return (saju_year - 4) % 60
+
+
+def month_pillar_batch(keys) -> np.ndarray:
+    """
+    분 키 배열(또는 datetime64 배열) → 절기 기준 월주 60갑자 인덱스 int8 배열.
+    범위 밖 시각은 -1.
+    """
+    _ensure_index()
+    arr = np.asarray(keys)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        arr = minute_keys(arr)
+    pos = np.searchsorted(_jeol_keys, arr, side="right") - 1
+    out = ((pos + _MONTH_GAPJA_OFFSET) % 60).astype(np.int8)
+    out[(pos < 0) | (pos >= len(_jeol_keys) - 1)] = -1
+    return out
+
+
+def year_pillar_batch(keys) -> np.ndarray:
+    """분 키 배열 → 입춘 기준 연주 60갑자 인덱스 int8 배열. 범위 밖은 -1."""
+    _ensure_index()
+    arr = np.asarray(keys)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        arr = minute_keys(arr)
+    pos = np.searchsorted(_jeol_keys, arr, side="right") - 1
+    out = ((FIRST_YEAR + (pos - 1) // 12 - 4) % 60).astype(np.int8)
+    out[(pos < 0) | (pos >= len(_jeol_keys) - 1)] = -1
+    return out
+
+
+def surrounding_jeol(key: int):
+    """분 키 → (직전 절 분 키, 다음 절 분 키). 대운 기산 등에 쓴다."""
+    pos = _jeol_position(key)
+    return _jeol_list[pos], _jeol_list[pos + 1]
+
+
+def surrounding_jeol_batch(keys):
+    """
+    분 키 배열(또는 datetime64 배열) → (직전 절 분 키, 다음 절 분 키, 직전 절 위치) int64 배열.
+    범위 밖 시각은 세 값 모두 -1.
+    """
+    _ensure_index()
+    arr = np.asarray(keys)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        arr = minute_keys(arr)
+    pos = np.searchsorted(_jeol_keys, arr, side="right") - 1
+    bad = (pos < 0) | (pos >= len(_jeol_keys) - 1)
+    safe = np.where(bad, 0, pos)
+    prev = np.where(bad, -1, _jeol_keys[safe])
+    nxt = np.where(bad, -1, _jeol_keys[safe + 1])
+    return prev, nxt, np.where(bad, -1, pos)
+
+
+def terms_for_year(year: int):
+    """해당 연도의 24절기 [(이름, datetime), ...] (KST, 분 단위)."""
+    if not FIRST_YEAR <= year <= LAST_YEAR:
+        raise ValueError("절기 인덱스 범위를 벗어난 연도입니다.")
+    row = term_table()[year - FIRST_YEAR]
+    return [(TERM_NAMES[i], key_to_datetime(row[i])) for i in range(24)]
+
+
+if __name__ == "__main__":
+    import sys
+
+    target = int(sys.argv[1]) if len(sys.argv) > 1 else date.today().year
+    for name, when in terms_for_year(target):
+        print(f"{name}\t{when:%Y-%m-%d %H:%M}")
@@ -1,427 +1,61 @@
 import streamlit as st
 from datetime import date
-from korean_lunar_calendar import KoreanLunarCalendar
+from saju_engine import hours
+from saju_engine.daewoon import daewoon, daewoon_markdown, parse_gender
+from saju_engine.lunar import (
+    LAST_LUNAR_DATE,
+    LAST_LUNAR_YEAR,
+    lunar_in_range,
+    lunar_label,
+    lunar_to_solar,
+    solar_to_lunar,
+)
+from saju_engine.manse_variant import cached_report
 
 # -----------------------------
-# 기본 설정
+# 기본 설정 (배포용 사본은 APP_TITLE / APP_CAPTION 만 바꿔서 실행)
 # -----------------------------
-st.set_page_config(
-    page_title="만세력 기반 사주 프로그램 (2026년 새해운세 포함)",
-    layout="centered"
-)
-
-st.title("🔮 만세력 기반 사주 프로그램 (2026년 새해운세 포함)")
-
-st.caption(
-    "양력 생년월일과 태어난 시간을 기준으로 한국식 만세력으로 "
+APP_TITLE = globals().get("APP_TITLE", "🔮 만세력 기반 사주 프로그램 (2026년 새해운세 포함)")
+APP_CAPTION = globals().get(
+    "APP_CAPTION",
+    "양력 또는 음력(윤달 포함) 생년월일과 태어난 시간을 기준으로 한국식 만세력으로 "
     "연·월·일·시 간지(干支)를 계산하고, 오행(목·화·토·금·수) 경향과 "
     "2026년 한 해의 연애·재물·직업·건강·이사 운을 간단히 살펴보는 연습용 프로그램입니다."
 )
 
-# -----------------------------
-# 기본 데이터 정의
-# -----------------------------
-heavenly_stems = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
-earthly_branches = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
-zodiac_animals = ["쥐", "소", "호랑이", "토끼", "용", "뱀",
-                  "말", "양", "원숭이", "닭", "개", "돼지"]
-
-stem_elements = {
-    "갑": "목", "을": "목",
-    "병": "화", "정": "화",
-    "무": "토", "기": "토",
-    "경": "금", "신": "금",
-    "임": "수", "계": "수",
-}
-
-branch_elements = {
-    "자": "수",
-    "축": "토",
-    "인": "목",
-    "묘": "목",
-    "진": "토",
-    "사": "화",
-    "오": "화",
-    "미": "토",
-    "신": "금",
-    "유": "금",
-    "술": "토",
-    "해": "수",
-}
-
-element_desc = {
-    "목": "🌳 **목(木)** 기운: 성장, 배움, 계획, 이상, 곧은 성격, 발전 욕구가 강한 타입으로 봅니다. 가만히 있는 것보다 조금씩이라도 앞으로 나아가야 마음이 편한 스타일입니다.",
-    "화": "🔥 **화(火)** 기운: 열정, 추진력, 표현력, 카리스마, 승부욕이 강한 타입입니다. 하고 싶은 말·하고 싶은 일이 많고, 한 번 불이 붙으면 끝장을 보는 에너지가 있습니다.",
-    "토": "🪨 **토(土)** 기운: 안정, 책임감, 현실감, 신뢰, 꾸준함이 강한 타입입니다. 한 번 마음먹은 일은 느려도 묵묵히 끝까지 가려는 힘이 있습니다.",
-    "금": "⚔️ **금(金)** 기운: 이성적, 분석적, 결단력, 원칙·규칙을 중시하는 타입입니다. 상황을 냉정하게 보는 눈이 있고, '정리·수정·관리'에 강점이 있습니다.",
-    "수": "💧 **수(水)** 기운: 감수성, 직관, 소통, 유연함, 말·생각이 많은 타입입니다. 분위기·눈치·기류를 읽는 능력이 좋고, 흐름을 잘 타면 큰 장점이 됩니다.",
-}
-
-# 띠 설명 (연지 기준)
-zodiac_brief = {
-    "쥐": "머리가 빠르고 상황 파악이 빠른 타입으로, 눈치와 계산이 빠른 편입니다.",
-    "소": "끈기와 책임감이 강하고, 한 번 시작한 일은 끝을 보는 스타일입니다.",
-    "호랑이": "대담하고 리더 기질이 있으며, 자기 색깔이 분명한 편입니다.",
-    "토끼": "부드럽고 예민하며, 관계와 분위기를 중요하게 여기는 편입니다.",
-    "용": "존재감과 기세가 있고, 한 번쯤 크게 해보려는 기질이 있습니다.",
-    "뱀": "분석적이고 깊이 생각하며, 속마음을 쉽게 드러내지 않는 스타일입니다.",
-    "말": "활동적·외향적이고, 가만히 있는 걸 답답해하는 편입니다.",
-    "양": "정이 많고 배려심이 있으며, 주변 사람들의 분위기에 민감한 편입니다.",
-    "원숭이": "재치와 아이디어가 많고, 변화에 잘 적응합니다.",
-    "닭": "성실하고 꼼꼼하며, 자기관리와 이미지에 신경을 쓰는 스타일입니다.",
-    "개": "의리·정의감이 강하고, 약한 사람을 보면 그냥 못 지나가는 편입니다.",
-    "돼지": "마음이 너그럽고, 먹는 즐거움·편안함을 중요하게 여기는 스타일입니다.",
-}
-
-# 기본 성향 해석 (일간 기준)
-wealth_text = {
-    "목": "아이디어·확장·사람을 통해 재물이 들어오는 타입입니다. 공부, 교육, 기획, 콘텐츠, 사람을 키우는 쪽과 인연이 있을 수 있습니다. 단기 투기보다는 '내 실력·내 몸값 올리기'가 재물운과 연결되기 쉽습니다.",
-    "화": "승부·성과·성과급·영업 쪽으로 재물이 들어오기 쉬운 편입니다. 속도감 있게 움직일수록 기회가 많지만, 감정 소비와 충동지출을 조심해야 합니다. '열정은 뜨겁게, 계산은 차갑게'가 키워드입니다.",
-    "토": "안정적인 자산·부동산·장기적인 저축과 누적으로 재물을 모으는 타입입니다. 느리지만 묵직하게 쌓이는 구조가 잘 맞습니다. 눈앞의 수익보다 '흔들리지 않는 기반'에 신경 쓰는 것이 좋습니다.",
-    "금": "분석·계산·매매·투자 센스가 재물운과 연결되기 쉽습니다. 숫자·데이터·시장 흐름을 보는 눈이 좋다면, 그게 곧 돈 버는 능력입니다. 다만 너무 완벽을 기하다가 타이밍을 놓치지 않도록 주의하면 좋습니다.",
-    "수": "정보·소통·말·네트워크·온라인 기반으로 재물이 들어오기 쉬운 타입입니다. 글쓰기·강의·상담·콘텐츠·IT·온라인 판매 등과 인연이 있을 수 있습니다. 흩어지는 에너지를 1~2개 축으로 모으면 훨씬 안정됩니다.",
-}
-
-relation_text = {
-    "목": "사람을 편하게 대하고 도와주는 스타일이라, 주변에 사람이 모이기 좋은 편입니다. 다만 '내가 조금 손해 보더라도 괜찮다'며 참는 일이 쌓이면 번아웃이 올 수 있으니, 적당한 경계와 선 긋기도 필요합니다.",
-    "화": "표현이 솔직·직설적인 편이라 호불호가 나뉠 수 있지만, 진심이 전달되면 관계가 깊어지는 타입입니다. 말의 톤·표현 방식만 부드럽게 다듬으면, 사람들에게 강한 신뢰와 의지를 주는 리더형입니다.",
-    "토": "한 번 인연을 맺으면 오래 가는 스타일입니다. 약속·책임을 잘 지키기 때문에 신뢰받기 쉽고, 주변에서 '기댈 수 있는 사람'으로 여겨질 수 있습니다. 대신 혼자 짊어지려 하지 말고, 때로는 도움을 요청하는 연습도 필요합니다.",
-    "금": "선이 분명해서 편한 사람·불편한 사람을 명확히 구분하는 편입니다. 기준이 확실한 만큼, 서로 맞는 사람과는 오래가고, 아닌 사람과는 깔끔히 정리되는 타입입니다. 너무 냉정해 보이지 않도록, 감정을 살짝만 더 표현해 주면 인간관계가 더 부드럽게 흘러갑니다.",
-    "수": "상대의 감정과 분위기를 잘 읽어서, 상담·조언을 잘하는 스타일입니다. 주변 이야기를 많이 듣다 보면 정작 내 감정은 뒤로 밀릴 수 있으니, 나 자신을 위한 시간도 꼭 챙겨야 합니다.",
-}
-
-love_text = {
-    "목": "연애에서 함께 성장하는 느낌, 같이 배우고 키워가는 관계에 끌리는 타입입니다. 서로의 꿈·계획을 응원해줄수록 연애운이 좋아집니다. 다만 상대를 바꾸려 하기보다는, 서로의 차이를 인정해주는 태도가 중요합니다.",
-    "화": "설레고 뜨거운 연애, 직설적인 표현, 밀당보다는 솔직한 스타일입니다. 감정 표현이 풍부한 만큼, 싸울 때도 불꽃이 튈 수 있으니, '한 템포 쉬고 말하기'가 연애운을 살리는 키포인트입니다.",
-    "토": "안정·진지함·책임을 중시하는 연애 스타일입니다. '함께 살 수 있는 사람인가?'를 많이 보는 편입니다. 속도가 느려 보여도, 한 번 마음을 열면 쉽게 안 변하는 믿음직한 타입입니다.",
-    "금": "조건·가치관·생활 패턴을 꼼꼼히 보는 편입니다. 감정도 중요하지만, 현실적 기준도 함께 보는 스타일입니다. 그래서 연애를 시작하기까지 시간이 걸릴 수 있지만, 시작하면 오래 가는 편입니다.",
-    "수": "말이 잘 통하고 코드가 맞는 사람에게 끌립니다. 대화·메신저·전화가 많을수록 애정도 함께 자라는 타입입니다. 다만 말뿐인 관계에 에너지 과소비하지 않도록, '행동으로 보여주는 진심'도 함께 체크하면 좋습니다.",
-}
-
-career_text = {
-    "목": "교육, 기획, 콘텐츠, 성장·개발, 사람을 키우는 일, 새로운 것을 만들어가는 일과 인연이 있을 수 있습니다. 조직 안에서는 '생각하는 사람', '아이디어를 내는 사람' 역할을 하게 되기 쉽습니다.",
-    "화": "영업, 마케팅, 방송·미디어, 예술·공연, 리더십을 발휘하는 자리, 승부를 보는 일과 궁합이 좋습니다. 성과 압박이 있을 수 있지만, 그만큼 '이름을 남길 기회'도 함께 오는 타입입니다.",
-    "토": "공무원, 행정, 관리·운영, 회계, 인사, 시스템을 꾸준히 유지·관리하는 직군과 잘 맞는 편입니다. 눈에 잘 띄지 않아도, 없어지면 바로 티 나는 '중심축 역할'을 하게 될 가능성이 큽니다.",
-    "금": "금융, 법률, 기술직, 데이터 처리, 분석·기획, 통제·관리 업무와 인연이 있을 수 있습니다. 복잡한 문제를 구조화하고, 기준·원칙을 세우는 역할에 강점이 있습니다.",
-    "수": "상담, 심리, 교육, 글쓰기, 기획, IT·온라인, 커뮤니케이션, 정보 전달과 관련된 직업과 궁합이 좋습니다. 다양한 분야를 넓게 이해하고 연결해 주는 '브리지 역할'도 잘 할 수 있습니다.",
-}
-
-health_text = {
-    "목": "눈·간, 근육·인대 쪽 컨디션 관리에 신경 쓰면 좋습니다. 규칙적인 스트레칭과 가벼운 운동, 충분한 수면이 중요합니다.",
-    "화": "심장·혈액순환, 체온 조절에 신경을 써야 합니다. 과로와 과도한 스트레스 해소가 중요하며, 격한 운동보다는 꾸준한 운동이 좋습니다.",
-    "토": "위장·소화기, 비장·체력 관리에 신경 써야 합니다. 규칙적인 식사와 과식·야식을 줄이는 것이 좋고, 따뜻한 음식·음료가 몸을 편안하게 해줍니다.",
-    "금": "폐·호흡기·피부 쪽이 민감할 수 있습니다. 미세먼지·공기질, 알레르기 관리에 신경 쓰면 좋고, 적당한 수분 섭취와 보습도 중요합니다.",
-    "수": "신장·비뇨기계, 체액 순환·부종 쪽을 신경 써야 합니다. 수분 섭취, 짠 음식 줄이기, 앉아만 있지 말고 자주 움직이는 습관이 도움이 됩니다.",
-}
-
-# 2026년 새해운세 – 일간 오행별 상세 (연애/재물/직업/건강/이사)
-year2026_overall = {
-    "목": (
-        "🌟 **2026년 전체 흐름 (목 일간 기준)**\n"
-        "- 2026년은 '새로운 씨를 뿌리는 해'로 볼 수 있습니다.\n"
-        "- 배우기·준비하기·기획하기에 좋은 시기이며, 그동안 생각만 하던 것들을 실제로 조금씩 실행해 보기 좋습니다.\n"
-        "- 사람과의 인연 속에서 기회가 들어오기 쉬우니, 가벼운 만남·모임이라도 너무 귀찮아하지 않는 것이 좋습니다.\n"
-    ),
-    "화": (
-        "🌟 **2026년 전체 흐름 (화 일간 기준)**\n"
-        "- 2026년은 '움직이고 부딪히는 해'입니다. 가만히 있으면 답답하고, 직접 몸으로 부딪히면서 배워가는 해가 되기 쉽습니다.\n"
-        "- 승부·성과·경쟁의 에너지가 강해질 수 있으므로, 나에게 맞는 목표를 하나 정해두고 달려가는 것이 좋습니다.\n"
-        "- 다만 너무 모든 것을 다 잘하려 하기보다는, 진짜 중요한 영역 1~2개에 에너지를 집중하면 훨씬 효율적입니다.\n"
-    ),
-    "토": (
-        "🌟 **2026년 전체 흐름 (토 일간 기준)**\n"
-        "- 2026년은 '바닥을 다지는 해'입니다. 크게 튀는 변화보다는, 지금까지 쌓아온 것들을 정리·관리하는 데 좋은 시기입니다.\n"
-        "- 재정·직장·가정·건강 등 삶의 기본 구조를 점검하고 안정시키면, 이후 몇 년 동안이 한결 편안해질 수 있습니다.\n"
-        "- 조급하게 '대박'을 노리기보다는, '내 자리를 튼튼히'라는 마음으로 보내면 좋습니다.\n"
-    ),
-    "금": (
-        "🌟 **2026년 전체 흐름 (금 일간 기준)**\n"
-        "- 2026년은 '정리·리셋의 해'로 볼 수 있습니다. 사람·일·돈의 구조를 다시 정비하기 좋은 시기입니다.\n"
-        "- 불필요한 관계·쓸데없는 지출·시간만 잡아먹는 일을 과감히 정리하면, 머리와 마음이 훨씬 가벼워질 수 있습니다.\n"
-        "- 현실을 냉정하게 보되, 나 자신에 대한 평가는 조금 너그럽게 해주는 것이 균형을 잡는 데 도움이 됩니다.\n"
-    ),
-    "수": (
-        "🌟 **2026년 전체 흐름 (수 일간 기준)**\n"
-        "- 2026년은 '정보·소통·이동의 해'입니다. 머리도 바쁘고, 주변 소식도 많고, 새로운 제안·아이디어도 많이 들어올 수 있습니다.\n"
-        "- 온라인·콘텐츠·교육·상담·기획 등, 말과 글, 정보 흐름과 연결된 분야를 활용하기 좋습니다.\n"
-        "- 생각만 많아지고 행동이 따라가지 않으면 피로만 쌓일 수 있으니, 작은 것부터 실행으로 옮기는 습관이 중요합니다.\n"
-    ),
-}
-
-year2026_love = {
-    "목": (
-        "❤️ **2026년 연애운 (목)**\n"
-        "- 함께 성장하고, 같이 목표를 나눌 수 있는 사람과의 인연이 강조되는 해입니다.\n"
-        "- 스터디·동호회·취미모임·교육 프로그램 등에서 자연스럽게 마음이 통하는 사람을 만날 가능성이 있습니다.\n"
-        "- 연애 중이라면, 서로의 미래 계획을 구체적으로 이야기 나눠보는 것이 관계를 한 단계 성장시켜 줄 수 있습니다.\n"
-    ),
-    "화": (
-        "❤️ **2026년 연애운 (화)**\n"
-        "- 설렘과 갈등이 함께 올 수 있는 해입니다. 연애 감정이 빠르게 불붙을 수 있지만, 식는 것도 빠를 수 있습니다.\n"
-        "- 솔직한 표현이 장점이지만, 화가 났을 때의 말 한마디가 오래 기억될 수 있으니, 감정이 격해질 때는 호흡부터 가다듬는 것이 좋습니다.\n"
-        "- 새로운 인연을 찾는다면, 적극적으로 표현해 보는 것이 도움이 되지만, '과속 연애·급 결혼'은 한 번 더 점검해 보는 것이 좋습니다.\n"
-    ),
-    "토": (
-        "❤️ **2026년 연애운 (토)**\n"
-        "- 진지한 관계, 안정적인 인연을 위한 정리가 일어날 수 있는 해입니다.\n"
-        "- 어정쩡한 관계는 정리가 되고, 서로에게 책임감을 느끼는 관계는 더 굳어질 가능성이 있습니다.\n"
-        "- 결혼·동거·미래 계획을 진지하게 논의하기 좋고, 상대의 현실적인 조건·가치관까지 함께 보게 되는 시기입니다.\n"
-    ),
-    "금": (
-        "❤️ **2026년 연애운 (금)**\n"
-        "- '현실적으로 함께 갈 수 있는가?'라는 질문이 강하게 떠오르는 해입니다.\n"
-        "- 이상형과의 설렘도 중요하지만, 돈·생활패턴·가정환경 등 현실 요소를 따져보게 될 수 있습니다.\n"
-        "- 다만 너무 '채점하듯이' 사람을 보지 않도록, 감정과 따뜻한 부분도 함께 느껴보려는 노력이 필요합니다.\n"
-    ),
-    "수": (
-        "❤️ **2026년 연애운 (수)**\n"
-        "- 대화·메신저·온라인 소통을 통해 인연이 확장되기 쉬운 해입니다.\n"
-        "- 글이나 말로 서로의 생각을 나누는 시간이 많을수록 가까워지는 타입이라, 진솔한 대화가 연애운을 열어줍니다.\n"
-        "- 다만 말뿐인 관계에 너무 많은 시간을 쓰지 않도록, 실제 행동과 책임감이 얼마나 따라오는지도 함께 보는 것이 좋습니다.\n"
-    ),
-}
-
-year2026_wealth = {
-    "목": (
-        "💰 **2026년 재물운 (목)**\n"
-        "- 재물 측면에서는 '준비하는 해'에 가깝습니다. 공부·자격증·부업 준비·커리어 업그레이드 등이 장기적인 재물운과 직접 연결될 수 있습니다.\n"
-        "- 사람을 통해 들어오는 정보·기회를 놓치지 않는 것이 중요합니다. 가벼운 만남이라도, 그 안에서 힌트를 얻을 수 있습니다.\n"
-        "- 단기적으로 큰 수익을 기대하기보다는, 1~2년 뒤를 바라보고 '씨앗을 뿌린다'는 마음으로 움직이면 좋습니다.\n"
-    ),
-    "화": (
-        "💰 **2026년 재물운 (화)**\n"
-        "- 움직이는 만큼 돈의 흐름도 커질 수 있는 해입니다. 영업·성과급·프로젝트 기반 수입에 유리할 수 있습니다.\n"
-        "- 다만 감정 소비·충동구매·'스트레스 풀려고 쓰는 돈'이 많아질 수 있으니, 소비 관리만 잘하면 재물운이 크게 나쁘지 않습니다.\n"
-        "- 목표 금액을 구체적으로 정해두고, 매달 체크해 보는 습관을 들이면 재정 관리에 큰 도움이 됩니다.\n"
-    ),
-    "토": (
-        "💰 **2026년 재물운 (토)**\n"
-        "- 큰 도전보다는 '지키는 재물운'에 가까운 해입니다. 자산 구조·대출·보험·연금 등을 점검하고 정리하기 좋습니다.\n"
-        "- 무리한 투자·빚보증·보증인·공동명의 등은 특히 조심하는 편이 좋습니다.\n"
-        "- 생활비 구조를 살펴보고, 꼭 필요한 것과 불필요한 소비를 구분해 보는 것만으로도 재물운이 한층 안정됩니다.\n"
-    ),
-    "금": (
-        "💰 **2026년 재물운 (금)**\n"
-        "- 재테크·투자·매매 쪽으로 관심이 커질 수 있는 해입니다. 숫자와 구조를 보는 눈을 잘 활용하면 기회를 잡을 수 있습니다.\n"
-        "- 다만 욕심이 커지면 리스크도 함께 커지니, '내가 확실히 이해하는 분야' 위주로만 움직이는 것이 안전합니다.\n"
-        "- 전문가의 말만 믿기보다는, 본인이 직접 공부하고 판단하는 습관을 들이면 손실을 줄일 수 있습니다.\n"
-    ),
-    "수": (
-        "💰 **2026년 재물운 (수)**\n"
-        "- 온라인·정보·지식 기반 수입에 인연이 생기기 좋은 해입니다. 글쓰기·강의·컨설팅·플랫폼 비즈니스 등을 고민해볼 만합니다.\n"
-        "- 여러 기회가 들어올 수 있지만, 모든 걸 다 하려고 하면 체력·정신력만 소모될 수 있습니다.\n"
-        "- 1~2개의 핵심 수입원을 정해 집중하고, 나머지는 '테스트' 수준으로 가볍게 시도해보는 전략이 좋습니다.\n"
-    ),
-}
-
-year2026_career = {
-    "목": (
-        "🧑‍💼 **2026년 직업·커리어 운 (목)**\n"
-        "- 직장에서 새로운 업무를 맡거나, 새로운 분야를 공부하며 커리어 방향을 재정비하기 좋은 해입니다.\n"
-        "- 교육·기획·콘텐츠·조직문화·인재 육성과 관련된 역할이 자연스럽게 늘어날 수 있습니다.\n"
-        "- 이직을 생각 중이라면, 2026년에 준비와 정리를 하고, 2027년 이후를 본격적인 변곡점으로 삼는 것도 좋은 전략입니다.\n"
-    ),
-    "화": (
-        "🧑‍💼 **2026년 직업·커리어 운 (화)**\n"
-        "- 움직임이 많고, 사람을 상대하는 일이 늘어나는 해입니다. 영업·마케팅·행사·서비스·홍보·미디어 등에서 활약이 기대됩니다.\n"
-        "- 성과 압박을 느낄 수 있지만, 그만큼 본인의 이름과 실력을 알릴 수 있는 기회도 들어옵니다.\n"
-        "- 체력 관리와 감정 관리만 잘 해주면, 커리어적으로 한 단계 도약할 수 있는 시기입니다.\n"
-    ),
-    "토": (
-        "🧑‍💼 **2026년 직업·커리어 운 (토)**\n"
-        "- 평판·신뢰·자리 자체를 지키는 데 유리한 해입니다. 큰 변화보다는 '현재 자리에서의 역할 강화'에 포인트가 있습니다.\n"
-        "- 행정·운영·관리·회계·시스템 유지보수 등 눈에 잘 안 보이는 핵심 업무를 맡게 될 수 있습니다.\n"
-        "- 조용히 하지만 확실하게 '없으면 안 되는 사람'이라는 평가를 받을 수 있는 시기입니다.\n"
-    ),
-    "금": (
-        "🧑‍💼 **2026년 직업·커리어 운 (금)**\n"
-        "- 기획·분석·전략·데이터·법률·기술 분야에서 실력을 발휘하기 좋습니다.\n"
-        "- 업무 프로세스·규정·기준을 만들거나 정비하는 역할을 맡게 될 수 있습니다.\n"
-        "- 다만 완벽주의가 너무 강해지면 스스로를 너무 몰아붙일 수 있으니, '80점이면 충분하다'는 마음도 조금은 필요합니다.\n"
-    ),
-    "수": (
-        "🧑‍💼 **2026년 직업·커리어 운 (수)**\n"
-        "- 소통·기획·교육·상담·콘텐츠·IT·온라인 비즈니스와 인연이 강하게 들어오는 해입니다.\n"
-        "- 다양한 프로젝트 제안이 들어올 수 있고, 프리랜서·부업·재택 형태의 일도 고민해볼 수 있습니다.\n"
-        "- 다만 일의 양이 늘어날수록 경계가 흐릿해질 수 있으니, '일 시간·휴식 시간' 구분을 명확히 해두는 것이 중요합니다.\n"
-    ),
-}
-
-year2026_health = {
-    "목": (
-        "🩺 **2026년 건강운 (목)**\n"
-        "- 책상·컴퓨터 앞에 앉아 있는 시간이 길어지기 쉽고, 목·어깨·허리·눈 피로에 신경 써야 하는 해입니다.\n"
-        "- 1시간에 한 번씩은 자리에서 일어나 스트레칭을 해주고, 눈을 쉬게 해주는 습관이 필요합니다.\n"
-        "- 과로를 쌓아두지 말고, 일찍 자는 날·아무것도 안 하는 날도 일부러 만들어주는 것이 좋습니다.\n"
-    ),
-    "화": (
-        "🩺 **2026년 건강운 (화)**\n"
-        "- 활동량이 많아지는 만큼, 심장·혈압·혈액순환 관리가 중요합니다.\n"
-        "- 잠을 줄여가며 일하거나, 흥분된 상태에서 밤늦게까지 깨어 있는 습관은 줄이는 것이 좋습니다.\n"
-        "- 가벼운 유산소 운동과, 마음을 진정시키는 취미(산책·명상·조용한 시간 등)를 함께 가져가면 건강운이 좋아집니다.\n"
-    ),
-    "토": (
-        "🩺 **2026년 건강운 (토)**\n"
-        "- 위장·소화·과식·체중 관리가 핵심 키워드가 되는 해입니다.\n"
-        "- 스트레스를 음식으로 푸는 습관이 있다면, 조금씩 다른 방식의 해소법을 찾는 것이 좋습니다.\n"
-        "- 규칙적인 식사·따뜻한 음식·천천히 먹는 습관이 체력과 컨디션을 크게 올려줄 수 있습니다.\n"
-    ),
-    "금": (
-        "🩺 **2026년 건강운 (금)**\n"
-        "- 폐·기관지·피부 컨디션이 민감해질 수 있는 해입니다. 미세먼지·건조함·알레르기 환경에 신경 써야 합니다.\n"
-        "- 환기·가습·수분 섭취·보습 관리를 잘해주면, 몸이 훨씬 가볍고 편안해질 수 있습니다.\n"
-        "- 스트레스를 안으로만 눌러두지 않고, 적당히 풀 수 있는 루틴도 만들어두면 좋습니다.\n"
-    ),
-    "수": (
-        "🩺 **2026년 건강운 (수)**\n"
-        "- 신장·비뇨기·부종·순환 관리에 신경을 써야 하는 해입니다.\n"
-        "- 물을 너무 적게 마시거나, 반대로 카페인·탄산 위주의 음료를 많이 마시는 습관은 줄이는 것이 좋습니다.\n"
-        "- 가벼운 유산소 운동·산책·스트레칭을 통해 '몸이 고여 있지 않게' 만들어주는 것이 관건입니다.\n"
-    ),
-}
-
-year2026_move = {
-    "목": (
-        "🚚 **2026년 이사·집·환경 운 (목)**\n"
-        "- 새 출발·새 환경과 인연이 있는 해라, 이사·공간 재배치·인테리어 변경에 관심이 생길 수 있습니다.\n"
-        "- 공부·일·자기계발에 더 집중할 수 있는 환경으로 옮기거나, 집 안의 책상·작업 공간을 새롭게 꾸미면 운이 트이는 느낌을 받을 수 있습니다.\n"
-        "- 다만 너무 급하게 계약하거나, '분위기만 보고' 결정하기보다는, 통학·출퇴근 동선·주변 소음·생활 편의 등을 꼼꼼히 체크한 뒤 결정하는 것이 좋습니다.\n"
-    ),
-    "화": (
-        "🚚 **2026년 이사·집·환경 운 (화)**\n"
-        "- 활동 반경이 넓어지면서, 직장·사업장·거주지의 이동이 함께 고민될 수 있는 해입니다.\n"
-        "- 더 바쁘게 움직일 수 있는 위치, 사람을 많이 만날 수 있는 환경과 인연이 생길 수 있습니다.\n"
-        "- 다만 '충동적인 이사'는 피하는 것이 좋고, 최소 2~3번은 직접 발품을 팔아본 뒤 결정하는 것이 안전합니다.\n"
-    ),
-    "토": (
-        "🚚 **2026년 이사·집·환경 운 (토)**\n"
-        "- 안정과 정착을 중시하는 기운이 강해서, 이미 살고 있는 집을 정리·보수·리모델링하는 쪽으로 운이 열릴 수 있습니다.\n"
-        "- 꼭 이사를 하지 않더라도, 가구 배치·수납·청소·정리를 통해 '집의 기운'을 바꾸면 운이 한결 가벼워질 수 있습니다.\n"
-        "- 이사를 한다면, 조용하고 안정적인 환경, 생활 인프라가 잘 갖춰진 곳을 기준으로 고민해 보는 편이 좋습니다.\n"
-    ),
-    "금": (
-        "🚚 **2026년 이사·집·환경 운 (금)**\n"
-        "- 주거·부동산·전월세 계약 조건을 꼼꼼히 따져보게 되는 해입니다.\n"
-        "- 이사를 진행한다면, 계약서·관리비·주차·향후 개발 계획 등 '숫자와 조건'을 꼼꼼히 확인하는 것이 큰 도움이 됩니다.\n"
-        "- 집을 단순한 '잠자는 공간'이 아니라, 나의 자산·미래 계획과 연결된 공간으로 보는 시각이 생길 수 있습니다.\n"
-    ),
-    "수": (
-        "🚚 **2026년 이사·집·환경 운 (수)**\n"
-        "- 이동·이사·출장·단기 거주 등 '움직임'이 잦아질 수 있는 해입니다. 그래서 한 곳에 오래 정착하기보다는, 유연한 환경을 선호하게 될 수도 있습니다.\n"
-        "- 집에서 일하거나, 온라인 기반으로 일하는 경우라면, 인터넷 환경·소음·채광·작업 동선 등을 특히 신경 쓰는 것이 좋습니다.\n"
-        "- 완전한 이사가 아니더라도, 방 하나를 작업실·휴식 공간으로 꾸미는 것만으로도 운의 흐름이 훨씬 부드러워질 수 있습니다.\n"
-    ),
-}
-
-# -----------------------------
-# 만세력 계산 함수
-# -----------------------------
-def get_ganji_from_solar(year: int, month: int, day: int):
-    """korean_lunar_calendar로 양력 → 연/월/일 간지 문자열 얻기."""
-    cal = KoreanLunarCalendar()
-    ok = cal.setSolarDate(year, month, day)
-    if not ok:
-        return None
-
-    gapja = cal.getGapJaString()  # 예: "정유년 병오월 임오일"
-    parts = gapja.split()
-
-    year_ganji = parts[0][:-1]   # '정유'
-    month_ganji = parts[1][:-1]  # '병오'
-    day_ganji = parts[2][:-1]    # '임오'
-
-    return year_ganji, month_ganji, day_ganji, gapja
-
-def get_zodiac_from_branch(branch: str):
-    """연지(지지)로 띠 계산."""
-    if branch in earthly_branches:
-        idx = earthly_branches.index(branch)
-        return zodiac_animals[idx]
-    return None
-
-def get_hour_branch_from_label(label: str):
-    """'23:00~01:00 (자시)' → '자' 추출."""
-    if "(" in label and "시" in label:
-        inner = label.split("(")[1].split(")")[0]  # '자시'
-        return inner.replace("시", "")
-    return None
-
-def get_hour_stem(day_stem: str, hour_branch: str):
-    """시주의 천간 계산."""
-    if day_stem not in heavenly_stems or hour_branch not in earthly_branches:
-        return None
-
-    branch_idx = earthly_branches.index(hour_branch)
-
-    if day_stem in ["갑", "기"]:
-        start_idx = heavenly_stems.index("갑")
-    elif day_stem in ["을", "경"]:
-        start_idx = heavenly_stems.index("병")
-    elif day_stem in ["병", "신"]:
-        start_idx = heavenly_stems.index("무")
-    elif day_stem in ["정", "임"]:
-        start_idx = heavenly_stems.index("경")
-    elif day_stem in ["무", "계"]:
-        start_idx = heavenly_stems.index("임")
-    else:
-        start_idx = 0
-
-    hour_stem_idx = (start_idx + branch_idx) % 10
-    return heavenly_stems[hour_stem_idx]
-
-def get_element_distribution(pillars):
-    """
-    pillars: ['정유', '병오', '임오', '경자'] 형식의 간지 리스트
-    - 천간: 2점
-    - 지지: 1점
-    """
-    counts = {"목": 0, "화": 0, "토": 0, "금": 0, "수": 0}
-
-    for ganji in pillars:
-        if ganji and len(ganji) >= 2:
-            stem = ganji[0]
-            branch = ganji[1]
-
-            stem_el = stem_elements.get(stem)
-            branch_el = branch_elements.get(branch)
-
-            if stem_el:
-                counts[stem_el] += 2
-            if branch_el:
-                counts[branch_el] += 1
+st.set_page_config(
+    page_title="만세력 기반 사주 프로그램 (2026년 새해운세 포함)",
+    layout="centered"
+)
 
-    main_el = max(counts, key=counts.get)
-    weak_el = min(counts, key=counts.get)
+st.title(APP_TITLE)
 
-    return main_el, weak_el, counts
+st.caption(APP_CAPTION)
 
 # -----------------------------
 # 입력 폼
 # -----------------------------
 st.subheader("1. 기본 정보 입력")
 
+# 달력 종류에 따라 입력 위젯이 바뀌어야 하므로 폼 밖에 둔다
+calendar_type = st.radio("달력", ["양력", "음력"], horizontal=True)
+
 with st.form("manse_form"):
-    birth_date = st.date_input(
-        "🎂 생년월일 (양력 기준)",
-        value=date(1990, 1, 1)
-    )
+    if calendar_type == "양력":
+        birth_date = st.date_input(
+            "🎂 생년월일 (양력 기준)",
+            value=date(1990, 1, 1)
+        )
+    else:
+        # 음력은 2월 30일 같은 날짜가 있어 date_input 대신 숫자로 받는다
+        c_y, c_m, c_d, c_l = st.columns([1.4, 1, 1, 0.8])
+        lunar_year = c_y.number_input("🎂 음력 연", 1000, LAST_LUNAR_YEAR, 1990)
+        lunar_month = c_m.number_input("월", 1, 12, 1)
+        lunar_day = c_d.number_input("일", 1, 30, 1)
+        lunar_leap = c_l.checkbox("윤달")
     birth_hour_label = st.selectbox(
         "⏰ 태어난 시간 (대략, 모르면 '모름')",
-        [
-            "모름",
-            "23:00~01:00 (자시)",
-            "01:00~03:00 (축시)",
-            "03:00~05:00 (인시)",
-            "05:00~07:00 (묘시)",
-            "07:00~09:00 (진시)",
-            "09:00~11:00 (사시)",
-            "11:00~13:00 (오시)",
-            "13:00~15:00 (미시)",
-            "15:00~17:00 (신시)",
-            "17:00~19:00 (유시)",
-            "19:00~21:00 (술시)",
-            "21:00~23:00 (해시)",
-        ]
+        ["모름"] + hours.HOUR_LABELS
     )
     gender = st.selectbox(
         "성별 (선택사항)",
@@ -432,36 +66,44 @@ with st.form("manse_form"):
 # -----------------------------
 # 결과 출력
 # -----------------------------
+if submitted and calendar_type == "음력":
+    birth_date = lunar_to_solar(lunar_year, lunar_month, lunar_day, lunar_leap)
+    if birth_date is None:
+        leap_text = "윤" if lunar_leap else ""
+        if not lunar_in_range(lunar_year, lunar_month, lunar_day, lunar_leap):
+            st.error(f"음력 {lunar_year}년 {leap_text}{lunar_month}월 {lunar_day}일은 지원 범위 밖입니다. "
+                     f"(음력 {lunar_label(LAST_LUNAR_DATE)}까지 지원)")
+        else:
+            st.error(f"음력 {lunar_year}년 {leap_text}{lunar_month}월 {lunar_day}일은 없는 날짜입니다. "
+                     "(작은달의 30일이나 윤달이 없는 달인지 확인해 주세요)")
+        submitted = False
+
 if submitted:
     year = birth_date.year
     month = birth_date.month
     day = birth_date.day
 
-    result = get_ganji_from_solar(year, month, day)
-    if result is None:
+    hour_branch = hours.label_to_branch(birth_hour_label)
+    report = cached_report(birth_date, hour_branch)
+    if report is None:
         st.error("해당 날짜는 만세력 라이브러리 범위를 벗어났습니다. (지원: 1000~2050년)")
     else:
-        year_ganji, month_ganji, day_ganji, gapja_str = result
-
-        y_stem, y_branch = year_ganji[0], year_ganji[1]
-        m_stem, m_branch = month_ganji[0], month_ganji[1]
-        d_stem, d_branch = day_ganji[0], day_ganji[1]
-
-        # 시주 계산
-        hour_branch = None
-        hour_stem = None
-        hour_ganji = None
-        if birth_hour_label != "모름":
-            hour_branch = get_hour_branch_from_label(birth_hour_label)
-            if hour_branch:
-                hour_stem = get_hour_stem(d_stem, hour_branch)
-                if hour_stem:
-                    hour_ganji = hour_stem + hour_branch
+        pillars = report.pillars
+        gapja_str = pillars.gapja_string()
+        year_ganji = pillars.ganji("year")
+        month_ganji = pillars.ganji("month")
+        day_ganji = pillars.ganji("day")
+        d_stem = pillars.stem_name("day")
+
+        hour_ganji = pillars.ganji("hour")
 
         st.markdown("---")
         st.subheader("2. 만세력 기준 네 기둥 (연·월·일·시)")
 
         st.write(f"- **양력 생일:** {year}년 {month}월 {day}일")
+        lunar_birth = solar_to_lunar(birth_date)
+        if lunar_birth is not None:
+            st.write(f"- **음력 생일:** {lunar_label(lunar_birth)}")
         st.write(f"- **만세력 간지:** {gapja_str}")
 
         col_y, col_m, col_d, col_h = st.columns(4)
@@ -482,17 +124,15 @@ if submitted:
                 st.write("입력 안 함 / 모름")
 
         # 띠
-        zodiac = get_zodiac_from_branch(y_branch)
+        zodiac = pillars.animal
         if zodiac:
             st.markdown("### 🐼 띠 정보")
-            st.write(f"- **{zodiac}띠** – {zodiac_brief.get(zodiac, '')}")
+            st.write(f"- **{zodiac}띠** – {report.text('zodiac')}")
 
         # 오행 분포
-        pillars = [year_ganji, month_ganji, day_ganji]
-        if hour_ganji:
-            pillars.append(hour_ganji)
-
-        main_el, weak_el, counts = get_element_distribution(pillars)
+        counts = report.counts
+        main_el = report.main_element
+        weak_el = report.weak_element
 
         st.markdown("### 🔍 오행(五行) 분포 (연·월·일·시 기준 간단 분석)")
 
@@ -512,31 +152,31 @@ if submitted:
             f"➡️ 이 만세력 기준으로 **가장 강한 기운은 `{main_el}`**, "
             f"상대적으로 약한 기운은 `{weak_el}` 쪽으로 봅니다."
         )
-        st.write(element_desc.get(main_el, ""))
+        st.write(report.text("main"))
 
         # 일간 오행
-        day_element = stem_elements.get(d_stem, main_el)
+        day_element = report.day_element
 
         st.markdown("---")
         st.subheader("3. 일간(日干) 기준 기본 성향·운세 (연습용)")
 
         st.markdown(f"**일간(타고난 중심 기운):** {d_stem} → `{day_element}` 기운으로 봅니다.")
-        st.write(element_desc.get(day_element, ""))
+        st.write(report.text("day"))
 
         st.markdown("#### 💰 기본 재물 성향")
-        st.write(wealth_text.get(day_element, ""))
+        st.write(report.text("wealth"))
 
         st.markdown("#### 🤝 기본 인간관계 성향")
-        st.write(relation_text.get(day_element, ""))
+        st.write(report.text("relation"))
 
         st.markdown("#### ❤️ 기본 연애·감정 성향")
-        st.write(love_text.get(day_element, ""))
+        st.write(report.text("love"))
 
         st.markdown("#### 🧑‍💼 기본 직업·커리어 성향")
-        st.write(career_text.get(day_element, ""))
+        st.write(report.text("career"))
 
         st.markdown("#### 🩺 기본 건강 유의 포인트")
-        st.write(health_text.get(weak_el, ""))
+        st.write(report.text("health"))
 
         # 2026년 새해 운세
         st.markdown("---")
@@ -551,27 +191,40 @@ if submitted:
 
         with tabs[0]:
             st.markdown("### 🌟 2026년 전체 흐름")
-            st.write(year2026_overall.get(day_element, "2026년에 대한 기본 정보가 아직 준비되지 않았습니다."))
+            st.write(report.text("2026_overall"))
 
         with tabs[1]:
             st.markdown("### ❤️ 2026년 연애운")
-            st.write(year2026_love.get(day_element, ""))
+            st.write(report.text("2026_love"))
 
         with tabs[2]:
             st.markdown("### 💰 2026년 재물운")
-            st.write(year2026_wealth.get(day_element, ""))
+            st.write(report.text("2026_wealth"))
 
         with tabs[3]:
             st.markdown("### 🧑‍💼 2026년 직업·커리어 운")
-            st.write(year2026_career.get(day_element, ""))
+            st.write(report.text("2026_career"))
 
         with tabs[4]:
             st.markdown("### 🩺 2026년 건강운")
-            st.write(year2026_health.get(day_element, ""))
+            st.write(report.text("2026_health"))
 
         with tabs[5]:
             st.markdown("### 🚚 2026년 이사·집·환경 운")
-            st.write(year2026_move.get(day_element, ""))
+            st.write(report.text("2026_move"))
+
+        # 대운
+        st.markdown("---")
+        st.subheader("5. 🧭 대운 (10년 단위 큰 흐름)")
+        if parse_gender(gender) is None:
+            st.write("성별을 '여자' 또는 '남자'로 선택하면 대운(10년 단위 흐름)을 함께 볼 수 있습니다.")
+        else:
+            birth_hour = None if hour_branch is None else hours.branch_hour(hour_branch)
+            chart = daewoon(birth_date, birth_hour, gender)
+            if chart is None:
+                st.write("해당 날짜는 절기 범위를 벗어나 대운을 계산할 수 없습니다.")
+            else:
+                st.markdown(daewoon_markdown(chart, report.pillars))
 
         st.markdown("---")
         st.info(
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트에서 pytest 를 어떻게 실행하든 saju_engine 을 import 할 수 있게 한다
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,38 @@
+"""만세력 테이블·역색인·SQLite 저장이 고유한 임시 파일을 쓰는지 (동시 저장 경쟁)."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from saju_engine import manse_db, manse_table, signature_index
+
+
+def _save_concurrently(save, count=6):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        for future in [pool.submit(save) for _ in range(count)]:
+            future.result()
+
+
+def test_concurrent_table_saves(tmp_path):
+    path = str(tmp_path / "manse_table.bin")
+    table = manse_table.load_table()
+    _save_concurrently(lambda: manse_table.save_table(table, path))
+    assert manse_table.read_table_file(path) == bytes(table)
+    assert os.listdir(tmp_path) == ["manse_table.bin"]
+
+
+def test_concurrent_index_saves(tmp_path):
+    path = str(tmp_path / "signature_index.bin")
+    index = signature_index.build_index()
+    _save_concurrently(lambda: signature_index.save_index(index, path))
+    assert np.array_equal(signature_index.read_index_file(path), index)
+    assert os.listdir(tmp_path) == ["signature_index.bin"]
+
+
+def test_concurrent_database_builds(tmp_path):
+    path = str(tmp_path / "manse.sqlite")
+    _save_concurrently(lambda: manse_db.build_database(path), count=2)
+    assert os.listdir(tmp_path) == ["manse.sqlite"]
+    with manse_db.ManseDB(path) as db:
+        assert db.meta()["day_count"] == str(len(manse_db._rows()))
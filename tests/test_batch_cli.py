@@ -0,0 +1,60 @@
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from saju_engine import batch_cli, daily
+
+pytest.importorskip("pyarrow")
+
+
+def _write_parquet(path, frame):
+    frame.to_parquet(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize("values", [
+    [date(1990, 5, 17), date(2001, 2, 3)],                         # date32
+    [datetime(1990, 5, 17), datetime(2001, 2, 3)],                 # timestamp
+    pd.to_datetime(["1990-05-17", "2001-02-03"]).tz_localize("Asia/Seoul"),
+])
+def test_parquet_date_columns_are_not_rejected(tmp_path, values):
+    source = _write_parquet(tmp_path / "in.parquet",
+                            pd.DataFrame({"birth_date": values, "birth_hour": ["14", ""]}))
+    out = str(tmp_path / "out.csv")
+    done, rejected, _ = batch_cli.run(source, out, progress=False)
+    assert (done, rejected) == (2, 0)
+    assert pd.read_csv(out)["day_ganji"].tolist() == ["임오", "정유"]
+
+
+def test_parquet_dates_match_text_dates():
+    frame = pd.DataFrame({"birth_date": ["1990-05-17", "1582-10-15", "bad"]})
+    text = batch_cli.to_datetimes(frame["birth_date"])
+    typed = batch_cli.to_datetimes(pd.Series([date(1990, 5, 17), date(1582, 10, 15), None], dtype=object))
+    assert text.iloc[:2].tolist() == typed.iloc[:2].tolist()
+    assert text.isna().tolist() == typed.isna().tolist() == [False, False, True]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_all_rejected_still_writes_header(tmp_path, suffix):
+    source = tmp_path / "in.csv"
+    source.write_text("user_id,birth_date,birth_hour\n1,not-a-date,3\n2,1990-13-01,\n", encoding="utf-8")
+    out = str(tmp_path / f"out{suffix}")
+    rejects = str(tmp_path / f"rejects{suffix}")
+    done, rejected, _ = batch_cli.run(str(source), out, rejects, progress=False)
+    assert (done, rejected) == (0, 2)
+
+    read = pd.read_parquet if suffix == ".parquet" else pd.read_csv
+    result = read(out)
+    assert len(result) == 0
+    assert {"user_id", "birth_date", "day_ganji", "reading_key"} <= set(result.columns)
+    assert len(read(rejects)) == 2
+
+
+def test_daily_all_rejected_still_writes_header(tmp_path):
+    source = tmp_path / "in.csv"
+    source.write_text("user_id,birth_date\n1,??\n", encoding="utf-8")
+    out = str(tmp_path / "out.csv")
+    done, rejected, _ = daily.run(str(source), out, date(2026, 1, 1), 3, progress=False)
+    assert (done, rejected) == (0, 1)
+    assert list(pd.read_csv(out).columns) == ["user_id", "2026-01-01", "2026-01-02", "2026-01-03"]
@@ -0,0 +1,29 @@
+from saju_engine import export
+from saju_engine.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert len(cache) == 2
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 1, "misses": 0}
+
+
+def test_report_png_uses_shared_cache():
+    export.clear_cache()
+    calls = []
+
+    def make_text():
+        calls.append(1)
+        return "제목\n[섹션]\n본문"
+
+    first = export.report_png(("test", 1), make_text)
+    second = export.report_png(("test", 1), make_text)
+    assert first == second and first.startswith(b"\x89PNG")
+    assert len(calls) == 1
+    assert isinstance(export._png_cache, LRUCache)
+    export.clear_cache()
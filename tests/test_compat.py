@@ -0,0 +1,148 @@
+"""
+궁합 점수(saju_engine.compat) 테스트.
+
+배열 연산 결과(score_matrix, top_k)를 오행·지지 이름으로 한 쌍씩 계산하는 스칼라 기준
+점수와 대조하고, 범위 밖 날짜 행이 점수에 섞이지 않는지 확인한다.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from saju_engine import report_variant
+from saju_engine.batch import four_pillars_batch
+from saju_engine.compat import (
+    BRANCH_WEIGHT,
+    ELEMENT_WEIGHT,
+    STEM_WEIGHT,
+    ChartVectors,
+    score_matrix,
+    score_tiles,
+    top_k,
+)
+from saju_engine.fortune_year import control_map, generate_map
+from saju_engine.manse_table import earthly_branches
+from saju_engine.pillars import ELEMENTS, STEM_ELEMENT
+
+CLASH_PAIRS = {("자", "오"), ("축", "미"), ("인", "신"), ("묘", "유"), ("진", "술"), ("사", "해")}
+HARMONY_PAIRS = {("자", "축"), ("인", "해"), ("묘", "술"), ("진", "유"), ("사", "신"), ("오", "미")}
+
+
+def element_affinity(x: str, y: str) -> int:
+    """두 오행 이름 → 상생이면 +1, 상극이면 −1 (방향 무관)."""
+    if generate_map[x] == y or generate_map[y] == x:
+        return 1
+    if control_map[x] == y or control_map[y] == x:
+        return -1
+    return 0
+
+
+def scalar_score(counts_a, stem_a, branch_a, counts_b, stem_b, branch_b) -> float:
+    pa = [c / max(sum(counts_a), 1) for c in counts_a]
+    pb = [c / max(sum(counts_b), 1) for c in counts_b]
+    element = sum(pa[i] * pb[j] * element_affinity(ELEMENTS[i], ELEMENTS[j])
+                  for i in range(5) for j in range(5))
+
+    if (stem_a - stem_b) % 10 == 5:
+        stem = 2
+    else:
+        stem = element_affinity(ELEMENTS[STEM_ELEMENT[stem_a]], ELEMENTS[STEM_ELEMENT[stem_b]])
+
+    pair = {(earthly_branches[branch_a], earthly_branches[branch_b]),
+            (earthly_branches[branch_b], earthly_branches[branch_a])}
+    branch = 2 if pair & HARMONY_PAIRS else -2 if pair & CLASH_PAIRS else 0
+
+    score = 50 + ELEMENT_WEIGHT * element + STEM_WEIGHT * stem + BRANCH_WEIGHT * branch
+    return min(100.0, max(0.0, score))
+
+
+def scalar_matrix(a: ChartVectors, b: ChartVectors) -> np.ndarray:
+    out = np.full((len(a), len(b)), np.nan)
+    for i in range(len(a)):
+        for j in range(len(b)):
+            if a.valid[i] and b.valid[j]:
+                out[i, j] = scalar_score(a.counts[i].tolist(), int(a.day_stem[i]), int(a.day_branch[i]),
+                                         b.counts[j].tolist(), int(b.day_stem[j]), int(b.day_branch[j]))
+    return out
+
+
+def _pool(count: int, seed: int, invalid=()):
+    """무작위 생년월일·시 + 범위 밖·1582년 공백 날짜(invalid)를 섞은 배치 결과."""
+    rng = np.random.default_rng(seed)
+    dates = [date(1940, 1, 1) + timedelta(days=int(d)) for d in rng.integers(0, 30_000, count)]
+    hours = rng.integers(-1, 24, count).tolist()
+    for position, bad in invalid:
+        dates.insert(position, bad)
+        hours.insert(position, 12)
+    return dates, hours, four_pillars_batch(np.array(dates, dtype="datetime64[D]"), np.array(hours))
+
+
+BAD_DATES = ((3, date(1582, 10, 10)), (11, date(999, 12, 31)), (20, date(2051, 1, 1)))
+
+
+def test_score_matrix_matches_scalar():
+    _d, _h, left = _pool(24, 1, BAD_DATES)
+    _d, _h, right = _pool(31, 2, BAD_DATES[:2])
+    a, b = ChartVectors.from_batch(left), ChartVectors.from_batch(right)
+    assert a.valid.sum() == 24 and b.valid.sum() == 31
+
+    expected = scalar_matrix(a, b)
+    np.testing.assert_allclose(score_matrix(a, b), expected, rtol=0, atol=1e-3)
+
+    tiled = np.full((len(a), len(b)), -1.0, dtype=np.float32)
+    for i0, j0, block in score_tiles(a, b, tile=8):
+        tiled[i0:i0 + block.shape[0], j0:j0 + block.shape[1]] = block
+    np.testing.assert_allclose(tiled, expected, rtol=0, atol=1e-3)
+
+
+@pytest.mark.parametrize("exclude_self", [False, True])
+def test_top_k_matches_scalar(exclude_self):
+    _d, _h, result = _pool(40, 3, BAD_DATES)
+    a = ChartVectors.from_batch(result)
+    expected = scalar_matrix(a, a)
+    if exclude_self:
+        np.fill_diagonal(expected, np.nan)
+
+    k = 5
+    idx, scores = top_k(a, a, k=k, tile=7, exclude_self=exclude_self)
+    assert idx.shape == scores.shape == (len(a), k)
+    for row in range(len(a)):
+        if not a.valid[row]:
+            assert (idx[row] == -1).all() and np.isnan(scores[row]).all()
+            continue
+        assert a.valid[idx[row]].all()
+        if exclude_self:
+            assert row not in idx[row]
+        # 동점 후보는 어느 쪽이 남아도 되므로 점수 목록과 고른 후보의 실제 점수를 비교
+        best = np.sort(expected[row][~np.isnan(expected[row])])[::-1][:k]
+        np.testing.assert_allclose(scores[row], best, rtol=0, atol=1e-3)
+        np.testing.assert_allclose(expected[row, idx[row]], scores[row], rtol=0, atol=1e-3)
+
+
+def test_top_k_caps_k_at_valid_candidates():
+    _d, _h, result = _pool(2, 4, BAD_DATES[:1])
+    a = ChartVectors.from_batch(result)
+    idx, scores = top_k(a, a, k=10)
+    assert idx.shape == (3, 2)
+    assert not np.isnan(scores[a.valid]).any()
+
+
+def test_from_reports_and_from_batch_agree():
+    dates, hours, result = _pool(30, 5)
+    from_batch = ChartVectors.from_batch(result)
+    reports = [report_variant.cached_report(d, None if h < 0 else h) for d, h in zip(dates, hours)]
+    from_reports = ChartVectors.from_reports(reports)
+
+    for field in ChartVectors._fields:
+        np.testing.assert_array_equal(getattr(from_reports, field), getattr(from_batch, field))
+    np.testing.assert_array_equal(score_matrix(from_reports, from_batch), score_matrix(from_batch, from_batch))
+
+
+@pytest.mark.parametrize("stem, branch", [(-1, 0), (10, 0), (0, 12), (0, -1), (0, 1)])
+def test_from_arrays_rejects_out_of_range_day_pillar(stem, branch):
+    with pytest.raises(ValueError):
+        ChartVectors.from_arrays([[1, 1, 1, 1, 1]], [stem], [branch])
+    # 무효로 표시한 행은 값과 상관없이 받아 준다
+    vectors = ChartVectors.from_arrays([[1, 1, 1, 1, 1]], [stem], [branch], valid=[False])
+    assert np.isnan(score_matrix(vectors, vectors)).all()
@@ -0,0 +1,56 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from saju_engine import pillars as saju_pillars
+from saju_engine.daewoon import birth_times, daewoon, daewoon_batch, daewoon_markdown
+from saju_engine.manse_table import GAPJA_NAMES
+
+# 1950~2030 년에서 고른 날짜 (절입일 부근이 섞이도록 17일 간격)
+DATES = [date(1950, 1, 1) + timedelta(days=17 * i) for i in range(1700)]
+
+
+def _step(chart):
+    return 1 if chart.forward else -1
+
+
+@pytest.mark.parametrize("gender", ["남성", "여성"])
+def test_first_pillar_is_one_step_from_shown_month(gender):
+    mismatched = 0
+    for day in DATES:
+        chart = daewoon(day, 14, gender)
+        shown = saju_pillars.from_date(day)
+        text = daewoon_markdown(chart, shown)
+
+        # 대운 표 위에 표시한 기준 월주에서 한 칸
+        assert f"월주 {chart.month_ganji}" in text
+        assert chart.pillars[0].gapja == (chart.month_gapja + _step(chart)) % 60
+
+        if (shown.year, shown.month) == (chart.year_gapja, chart.month_gapja):
+            # 화면의 월주와 기준이 같으면 첫 대운은 화면 월주에서 한 칸
+            assert chart.pillars[0].gapja == (shown.month + _step(chart)) % 60
+            assert "만세력의 음력 월 기준" not in text
+        else:
+            mismatched += 1
+            assert "만세력의 음력 월 기준" in text
+    # 음력 월 기준 월주와 절기 기준 월주가 다른 날짜가 실제로 섞여 있어야 의미가 있다
+    assert 0 < mismatched < len(DATES)
+
+
+def test_batch_matches_single():
+    days = np.array(DATES[:300], dtype="datetime64[D]")
+    hours = np.arange(len(days)) % 24
+    male = np.arange(len(days)) % 2 == 0
+    out = daewoon_batch(birth_times(days, hours), male)
+    for i, day in enumerate(DATES[:300]):
+        chart = daewoon(day, int(hours[i]), "남성" if male[i] else "여성")
+        assert (out["year"][i], out["month"][i]) == (chart.year_gapja, chart.month_gapja)
+        assert out["pillars"][i].tolist() == [p.gapja for p in chart.pillars]
+        assert out["start_age"][i] == chart.start_age
+
+
+def test_basis_names():
+    chart = daewoon(date(1990, 5, 17), 14, "여성")
+    assert chart.month_ganji == GAPJA_NAMES[chart.month_gapja]
+    assert chart.year_ganji == "경오"
@@ -0,0 +1,87 @@
+"""
+일진 관계표(saju_engine.daily) 테스트.
+
+DAY_LUT 는 배열 연산으로 만들기 때문에, 오행 이름과 지지 이름으로 한 쌍씩 판정하는
+스칼라 기준 함수와 60 × 60 조합 전부를 대조한다.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from saju_engine.daily import (
+    BRANCH_CLASH,
+    BRANCH_HARMONY,
+    BRANCH_NONE,
+    BRANCH_STATES,
+    DAY_LUT,
+    UNKNOWN_CODE,
+    daily_codes,
+    daily_reading,
+)
+from saju_engine.fortune_year import (
+    RELATION_OFFICER,
+    RELATION_OUTPUT,
+    RELATION_RESOURCE,
+    RELATION_SAME,
+    RELATION_WEALTH,
+    control_map,
+    generate_map,
+)
+from saju_engine.manse_table import earthly_branches, heavenly_stems
+
+STEM_ELEMENT_NAMES = {
+    "갑": "목", "을": "목", "병": "화", "정": "화", "무": "토",
+    "기": "토", "경": "금", "신": "금", "임": "수", "계": "수",
+}
+CLASH_PAIRS = {("자", "오"), ("축", "미"), ("인", "신"), ("묘", "유"), ("진", "술"), ("사", "해")}
+HARMONY_PAIRS = {("자", "축"), ("인", "해"), ("묘", "술"), ("진", "유"), ("사", "신"), ("오", "미")}
+
+
+def scalar_relation(mine: str, theirs: str) -> int:
+    """일간 오행 이름 × 그날 천간 오행 이름 → 관계 코드."""
+    if mine == theirs:
+        return RELATION_SAME
+    if generate_map[mine] == theirs:
+        return RELATION_OUTPUT
+    if generate_map[theirs] == mine:
+        return RELATION_RESOURCE
+    if control_map[theirs] == mine:
+        return RELATION_OFFICER
+    assert control_map[mine] == theirs
+    return RELATION_WEALTH
+
+
+def scalar_branch(mine: str, theirs: str) -> int:
+    pair = {(mine, theirs), (theirs, mine)}
+    if pair & CLASH_PAIRS:
+        return BRANCH_CLASH
+    if pair & HARMONY_PAIRS:
+        return BRANCH_HARMONY
+    return BRANCH_NONE
+
+
+def scalar_code(user: int, day: int) -> int:
+    relation = scalar_relation(STEM_ELEMENT_NAMES[heavenly_stems[user % 10]],
+                               STEM_ELEMENT_NAMES[heavenly_stems[day % 10]])
+    branch = scalar_branch(earthly_branches[user % 12], earthly_branches[day % 12])
+    return relation * BRANCH_STATES + branch
+
+
+def test_day_lut_matches_scalar_relation_for_all_pairs():
+    expected = np.array([[scalar_code(u, d) for d in range(60)] for u in range(60)], dtype=np.uint8)
+    assert DAY_LUT.shape == (60, 60)
+    np.testing.assert_array_equal(DAY_LUT, expected)
+
+
+def test_daily_codes_and_reading_agree():
+    start = date(2026, 1, 1)
+    users = np.array([0, 17, 59, -1, 60])
+    codes = daily_codes(users, start, 70)
+    assert codes.shape == (5, 70)
+    assert (codes[3:] == UNKNOWN_CODE).all()
+    for row, user in enumerate(users[:3].tolist()):
+        for offset in range(70):
+            reading = daily_reading(user, start + timedelta(days=offset))
+            assert codes[row, offset] == reading.code
+            assert reading.code == scalar_code(user, (start.toordinal() + offset + 14) % 60)
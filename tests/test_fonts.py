@@ -0,0 +1,27 @@
+import glob
+
+import pytest
+
+from saju_engine import export, fonts
+
+LATIN_FONTS = glob.glob("/usr/share/fonts/**/DejaVuSans.ttf", recursive=True)
+
+
+@pytest.mark.skipif(not LATIN_FONTS, reason="DejaVuSans 폰트 없음")
+def test_latin_font_has_no_hangul():
+    # 한글 글리프가 없는 폰트는 '가' 를 .notdef 로 그리므로 한글 폰트로 고르면 안 된다
+    assert not fonts._has_hangul(LATIN_FONTS[0])
+
+
+def test_missing_font_file_has_no_hangul(tmp_path):
+    assert not fonts._has_hangul(str(tmp_path / "없는폰트.ttf"))
+
+
+def test_pillow_falls_back_without_korean_font(monkeypatch):
+    monkeypatch.setattr(fonts, "korean_font_path", lambda: None)
+    assert export.resolve_backend("pillow") == "matplotlib"
+
+
+def test_pillow_kept_with_korean_font(monkeypatch):
+    monkeypatch.setattr(fonts, "korean_font_path", lambda: "/fonts/NanumGothic.ttf")
+    assert export.resolve_backend("pillow") == "pillow"
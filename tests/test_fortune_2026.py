@@ -0,0 +1,37 @@
+"""
+2026년 해석 문구 회귀 테스트.
+
+fixtures/fortune_2026.json 은 기준 커밋(87acc22) saju_app.py 의 element_relation_2026 ·
+love/money/job/health/moving_2026 원본을 reachable_states() 의 모든 상태(2,280개)에 실행한
+결과에서 출발했고, 이후 의도한 변경(재성·관성 관계 문구 교정)을 반영해 다시 만들었다.
+의도한 문구 변경은 `python -m saju_engine.fortune_2026 dump` 로 다시 만들고
+커밋에 변경 내용을 적는다.
+"""
+
+import os
+
+from saju_engine.fortune_2026 import (
+    check_fixture,
+    fragment_table,
+    reachable_states,
+    reading_2026,
+    render_reading,
+)
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "fortune_2026.json")
+
+
+def test_fixture_matches_every_state():
+    assert check_fixture(FIXTURE) == []
+
+
+def test_table_covers_reachable_states():
+    states = list(reachable_states())
+    assert len(states) == len(fragment_table()) == 2280
+
+
+def test_lookup_falls_back_to_rendering():
+    # count_elements 로는 나올 수 없는 개수(합계 7)도 같은 결과를 돌려준다
+    counts = (1, 2, 1, 2, 1)
+    assert reading_2026("목", counts) == render_reading("목", counts)
+    assert reading_2026("목", dict(zip("목화토금수", counts))) == render_reading("목", counts)
@@ -0,0 +1,162 @@
+"""
+시주 테이블(saju_engine.hours) 차등 테스트.
+
+아래 baseline_* 함수는 기준 커밋(87acc22)의 두 앱에서 그대로 옮겨 온 원본이다.
+모든 (일간 10 × 시 24 × 분 60) 입력과 선택 상자 문구에 대해 새 테이블과 대조한다.
+"""
+
+import pytest
+
+from saju_engine.hours import (
+    HOUR_LABELS,
+    hour_branch,
+    hour_pillar_batch,
+    hour_stem,
+    label_to_branch,
+    minute_branch_table,
+)
+from saju_engine.manse_table import earthly_branches, heavenly_stems
+
+
+# ---------------------------------------------------------
+# 기준 커밋 원본 – saju_app.py (사주 리포트 앱)
+# ---------------------------------------------------------
+def get_hour_branch(hour):
+    if hour is None:
+        return None
+    if hour == 23 or hour < 1:
+        return "자"
+    elif hour < 3:
+        return "축"
+    elif hour < 5:
+        return "인"
+    elif hour < 7:
+        return "묘"
+    elif hour < 9:
+        return "진"
+    elif hour < 11:
+        return "사"
+    elif hour < 13:
+        return "오"
+    elif hour < 15:
+        return "미"
+    elif hour < 17:
+        return "신"
+    elif hour < 19:
+        return "유"
+    elif hour < 21:
+        return "술"
+    else:
+        return "해"
+
+
+# 출생 시의 천간 계산
+def report_get_hour_stem(day_stem, hour_branch):
+    if day_stem is None or hour_branch is None:
+        return None
+    try:
+        d_idx = heavenly_stems.index(day_stem) + 1
+        h_idx = earthly_branches.index(hour_branch) + 1
+    except ValueError:
+        return None
+    stem_idx = ((2 * d_idx - 1) + (h_idx - 1)) % 10
+    return heavenly_stems[stem_idx]
+
+
+# ---------------------------------------------------------
+# 기준 커밋 원본 – saju_manse_app.py (만세력 앱)
+# ---------------------------------------------------------
+def get_hour_branch_from_label(label: str):
+    """'23:00~01:00 (자시)' → '자' 추출."""
+    if "(" in label and "시" in label:
+        inner = label.split("(")[1].split(")")[0]  # '자시'
+        return inner.replace("시", "")
+    return None
+
+
+def manse_get_hour_stem(day_stem: str, hour_branch: str):
+    """시주의 천간 계산."""
+    if day_stem not in heavenly_stems or hour_branch not in earthly_branches:
+        return None
+
+    branch_idx = earthly_branches.index(hour_branch)
+
+    if day_stem in ["갑", "기"]:
+        start_idx = heavenly_stems.index("갑")
+    elif day_stem in ["을", "경"]:
+        start_idx = heavenly_stems.index("병")
+    elif day_stem in ["병", "신"]:
+        start_idx = heavenly_stems.index("무")
+    elif day_stem in ["정", "임"]:
+        start_idx = heavenly_stems.index("경")
+    elif day_stem in ["무", "계"]:
+        start_idx = heavenly_stems.index("임")
+    else:
+        start_idx = 0
+
+    hour_stem_idx = (start_idx + branch_idx) % 10
+    return heavenly_stems[hour_stem_idx]
+
+
+BASELINE_LABELS = [
+    "23:00~01:00 (자시)",
+    "01:00~03:00 (축시)",
+    "03:00~05:00 (인시)",
+    "05:00~07:00 (묘시)",
+    "07:00~09:00 (진시)",
+    "09:00~11:00 (사시)",
+    "11:00~13:00 (오시)",
+    "13:00~15:00 (미시)",
+    "15:00~17:00 (신시)",
+    "17:00~19:00 (유시)",
+    "19:00~21:00 (술시)",
+    "21:00~23:00 (해시)",
+]
+
+ALL_INPUTS = [(d, hour, minute) for d in range(10) for hour in range(24) for minute in range(60)]
+
+
+# ---------------------------------------------------------
+# 대조
+# ---------------------------------------------------------
+def test_branch_matches_report_app_for_every_minute():
+    for d, hour, minute in ALL_INPUTS:
+        expected = get_hour_branch(hour)
+        assert earthly_branches[hour_branch(hour)] == expected
+        assert earthly_branches[hour_branch(hour, minute)] == expected
+        assert earthly_branches[minute_branch_table(0)[hour * 60 + minute]] == expected
+
+
+def test_stem_matches_manse_app_for_every_input():
+    for d, hour, minute in ALL_INPUTS:
+        branch = get_hour_branch(hour)
+        expected = manse_get_hour_stem(heavenly_stems[d], branch)
+        assert heavenly_stems[hour_stem(d, earthly_branches.index(branch))] == expected
+
+
+def test_report_app_stem_was_one_off():
+    # 리포트 앱 공식은 표준 규칙(갑기일 갑자시)보다 항상 한 칸 뒤였다 (user-005 에서 표준으로 통일).
+    # 차이가 정확히 +1 인지 고정해 두어, 두 원본의 관계가 바뀌면 테스트가 알려 준다.
+    for d, hour, minute in ALL_INPUTS:
+        branch = get_hour_branch(hour)
+        legacy = heavenly_stems.index(report_get_hour_stem(heavenly_stems[d], branch))
+        assert legacy == (hour_stem(d, earthly_branches.index(branch)) + 1) % 10
+
+
+def test_labels_match_manse_app():
+    assert HOUR_LABELS == BASELINE_LABELS
+    for label in BASELINE_LABELS:
+        assert earthly_branches[label_to_branch(label)] == get_hour_branch_from_label(label)
+    assert label_to_branch("모름") is None
+
+
+@pytest.mark.parametrize("d", range(10))
+def test_batch_matches_single(d):
+    hours = list(range(24)) + [-1]
+    stems, branches = hour_pillar_batch([d] * len(hours), hours)
+    for hour, stem, branch in zip(hours, stems, branches):
+        if hour < 0:
+            assert (stem, branch) == (-1, -1)
+        else:
+            assert branch == hour_branch(hour)
+            assert stem == hour_stem(d, hour_branch(hour))
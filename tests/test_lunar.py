@@ -0,0 +1,97 @@
+"""
+음력 ↔ 양력 변환(saju_engine.lunar) 테스트.
+
+무작위 음력 날짜 20,000개를 KoreanLunarCalendar.setLunarDate 와 대조한다. 두 쪽이 다른 날짜는
+라이브러리가 1582년 그레고리력 공백(양력 1582-10-05 ~ 10-14)으로 바꾸는 음력 1582-09-09 ~ 09-18
+뿐이고(음력 1000 ~ 2050년 전체를 한 번 대조해 확인), 이 날짜들은 아래에 따로 고정해 둔다.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from saju_engine import lunar, manse_table
+from saju_engine.lunar import LunarDate
+
+KoreanLunarCalendar = pytest.importorskip("korean_lunar_calendar").KoreanLunarCalendar
+
+SAMPLES = 20_000
+# 라이브러리는 양력 1582-10-05 + n 일을 돌려주지만 그 양력 날짜는 존재하지 않는다
+GREGORIAN_GAP_LUNAR = [(1582, 9, day) for day in range(9, 19)]
+
+
+def _library_solar(calendar, year, month, day, leap):
+    if not calendar.setLunarDate(year, month, day, leap):
+        return None
+    return date.fromisoformat(calendar.SolarIsoFormat())
+
+
+def test_matches_library_on_random_dates():
+    rng = np.random.default_rng(20_000)
+    years = rng.integers(lunar.FIRST_LUNAR_YEAR, lunar.LAST_LUNAR_YEAR + 1, SAMPLES)
+    months = rng.integers(1, 13, SAMPLES)
+    days = rng.integers(1, 31, SAMPLES)
+    leaps = rng.random(SAMPLES) < 0.25
+
+    calendar = KoreanLunarCalendar()
+    expected, checked = [], 0
+    for y, m, d, leap in zip(years.tolist(), months.tolist(), days.tolist(), leaps.tolist()):
+        solar = _library_solar(calendar, y, m, d, leap)
+        if (y, m, d) in GREGORIAN_GAP_LUNAR and not leap:
+            solar = None
+        checked += solar is not None
+        assert lunar.lunar_to_solar(y, m, d, leap) == solar, (y, m, d, leap)
+        expected.append(np.datetime64(solar) if solar is not None else np.datetime64("NaT"))
+    assert checked > SAMPLES // 2
+
+    batch = lunar.lunar_to_solar_batch(years, months, days, leaps)
+    np.testing.assert_array_equal(batch, np.array(expected, dtype="datetime64[D]"))
+
+
+def test_gregorian_gap_lunar_dates_are_missing():
+    calendar = KoreanLunarCalendar()
+    for offset, (y, m, d) in enumerate(GREGORIAN_GAP_LUNAR):
+        # 라이브러리는 없는 양력 날짜로 바꿔 준다
+        assert _library_solar(calendar, y, m, d, False) == date(1582, 10, 5) + timedelta(days=offset)
+        assert lunar.lunar_to_solar(y, m, d) is None
+    assert lunar.lunar_to_solar(1582, 9, 8) == date(1582, 10, 4)
+    assert lunar.lunar_to_solar(1582, 9, 19) == date(1582, 10, 15)
+
+
+def test_solar_to_lunar_round_trip():
+    rng = np.random.default_rng(7)
+    span = manse_table.MAX_DATE.toordinal() - manse_table.MIN_DATE.toordinal()
+    ordinals = manse_table.MIN_DATE.toordinal() + rng.integers(0, span + 1, 2_000)
+    for ordinal in ordinals.tolist():
+        solar = date.fromordinal(ordinal)
+        found = lunar.solar_to_lunar(solar)
+        if manse_table.GREGORIAN_GAP[0] <= ordinal <= manse_table.GREGORIAN_GAP[1]:
+            assert found is None
+            continue
+        assert lunar.lunar_to_solar(*found) == solar
+
+
+def test_missing_day_30_and_leap_flag():
+    calendar = KoreanLunarCalendar()
+    # 1990년 음력 4월은 작은달(29일), 윤달은 5월뿐
+    assert not calendar.setLunarDate(1990, 4, 30, False)
+    assert lunar.lunar_to_solar(1990, 4, 29) == date(1990, 5, 23)
+    assert lunar.lunar_to_solar(1990, 4, 30) is None
+    assert lunar.lunar_to_solar(1990, 5, 1, leap=True) == date(1990, 6, 23)
+    assert lunar.lunar_to_solar(1990, 5, 30, leap=True) is None
+    assert lunar.lunar_to_solar(1990, 4, 1, leap=True) is None
+    assert lunar.lunar_in_range(1990, 4, 30) and lunar.lunar_in_range(1990, 4, 1, True)
+
+
+def test_range_ends_follow_solar_table():
+    assert lunar.solar_to_lunar(manse_table.MIN_DATE) == lunar.FIRST_LUNAR_DATE
+    assert lunar.solar_to_lunar(manse_table.MAX_DATE) == lunar.LAST_LUNAR_DATE
+    assert lunar.lunar_to_solar(*lunar.LAST_LUNAR_DATE) == manse_table.MAX_DATE
+
+
+@pytest.mark.parametrize("lunar_date", [LunarDate(2050, 11, 19, False), LunarDate(2050, 12, 1, False),
+                                        LunarDate(2051, 1, 1, False), LunarDate(999, 12, 30, False)])
+def test_past_the_table_is_out_of_range(lunar_date):
+    assert lunar.lunar_to_solar(*lunar_date) is None
+    assert not lunar.lunar_in_range(*lunar_date)
@@ -0,0 +1,80 @@
+import os
+import sqlite3
+from datetime import date
+
+import pytest
+
+from saju_engine import manse_db, manse_table
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("db") / "manse.sqlite")
+    manse_db.build_database(path)
+    with manse_db.ManseDB(path) as opened:
+        yield opened
+
+
+def _plan(db, **query):
+    """days(**query) 가 실제로 실행한 SQL 의 질의 계획."""
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        rows = db.days(**query)
+    finally:
+        db.conn.set_trace_callback(None)
+    return rows, " | ".join(db.explain(statements[-1]))
+
+
+@pytest.mark.parametrize("query, index", [
+    (dict(day="갑자", start=date(2026, 1, 1), end=date(2026, 12, 31)), "manse_day"),
+    (dict(year="병오"), "manse_year"),
+    (dict(month="경인", start="1990-01-01"), "manse_month"),
+    (dict(year="병오", day="갑자"), None),
+])
+def test_gapja_queries_read_only_covering_index(db, query, index):
+    rows, plan = _plan(db, **query)
+    assert rows
+    assert "USING COVERING INDEX" in plan, plan
+    if index is not None:
+        assert f"COVERING INDEX {index} " in plan, plan
+    # 테이블(manse m)을 rowid 로 다시 읽는 단계가 없어야 한다
+    assert "SEARCH m USING INDEX" not in plan, plan
+
+
+def test_date_range_reads_rowid_range(db):
+    rows, plan = _plan(db, start=date(2026, 1, 1), end="2026-01-31")
+    assert "SEARCH m USING INTEGER PRIMARY KEY" in plan, plan
+    assert [row.solar_date for row in rows] == [f"2026-01-{d:02d}" for d in range(1, 32)]
+
+
+def test_days_rows(db):
+    rows = db.days(day="갑자", start=date(2026, 1, 1), end=date(2026, 12, 31))
+    assert rows[0] == manse_db.DayRow("2026-02-19", 2026, 1, 3, False, "병오", "경인", "갑자")
+    assert all(row.day_ganji == "갑자" for row in rows)
+
+
+def test_old_schema_is_rebuilt(tmp_path, monkeypatch):
+    path = str(tmp_path / "manse.sqlite")
+    monkeypatch.setattr(manse_db, "SCHEMA_VERSION", manse_db.SCHEMA_VERSION - 1)
+    manse_db.build_database(path)
+    monkeypatch.undo()
+    assert manse_db._schema_version(path) == manse_db.SCHEMA_VERSION - 1
+    with manse_db.ManseDB(path) as db:
+        assert db.meta()["schema_version"] == str(manse_db.SCHEMA_VERSION)
+
+
+def test_other_table_checksum_is_rebuilt(tmp_path):
+    path = str(tmp_path / "manse.sqlite")
+    manse_db.build_database(path)
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE manse_meta SET value = '0' WHERE key = 'table_crc32'")
+    conn.close()
+
+    with manse_db.ManseDB(path) as db:
+        assert db.meta()["table_crc32"] == str(manse_table.table_checksum())
+    # 맞는 파일은 다시 만들지 않는다
+    inode = os.stat(path).st_ino
+    manse_db.ManseDB(path).close()
+    assert os.stat(path).st_ino == inode
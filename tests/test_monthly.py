@@ -0,0 +1,59 @@
+"""
+월운 타임라인(saju_engine.monthly) 테스트.
+
+offset/limit 로 꺼낸 달이 12개월 전체 렌더링의 같은 구간과 똑같은지,
+(연도, 일간 오행) 월 표 LRU 가 다시 만들지 않고 재사용·교체되는지 확인한다.
+"""
+
+import pytest
+
+from saju_engine import monthly
+from saju_engine.cache import LRUCache
+from saju_engine.pillars import ELEMENTS
+
+COUNTS = {"목": 1, "화": 3, "토": 0, "금": 2, "수": 2}
+
+
+@pytest.mark.parametrize("year", [1900, 2026, 2050])
+@pytest.mark.parametrize("day_element", ELEMENTS)
+def test_timeline_slices_match_full_render(year, day_element):
+    full = [m.to_dict() for m in monthly.timeline(year, day_element, COUNTS)]
+    assert len(full) == monthly.MONTHS
+    assert [m["index"] for m in full] == list(range(monthly.MONTHS))
+    for offset in range(monthly.MONTHS):
+        for limit in (1, 3, monthly.MONTHS):
+            part = [m.to_dict() for m in monthly.timeline(year, day_element, COUNTS, offset, limit)]
+            assert part == full[offset:offset + limit]
+
+
+def test_months_are_contiguous():
+    months = list(monthly.timeline(2026, "수", COUNTS))
+    assert months[0].base.ganji.endswith("인")
+    for prev, cur in zip(months, months[1:]):
+        assert prev.base.end == cur.base.start
+
+
+def test_timeline_accepts_count_sequence():
+    as_dict = [m.text for m in monthly.timeline(2026, "목", COUNTS)]
+    as_list = [m.text for m in monthly.timeline(2026, "목", [COUNTS[e] for e in ELEMENTS])]
+    assert as_dict == as_list
+
+
+def test_out_of_range_year_raises():
+    with pytest.raises(ValueError):
+        monthly.month_table(2051, "목")
+
+
+def test_month_table_lru(monkeypatch):
+    monkeypatch.setattr(monthly, "_month_cache", LRUCache(2))
+
+    first = monthly.month_table(2026, "목")
+    assert monthly.month_table(2026, "목") is first
+    assert monthly.cache_stats()["hits"] == 1
+
+    monthly.month_table(2026, "화")
+    monthly.month_table(2027, "목")          # 가장 오래 안 쓴 (2026, 목) 이 밀려남
+    assert monthly.cache_stats()["size"] == 2
+    rebuilt = monthly.month_table(2026, "목")
+    assert rebuilt is not first
+    assert rebuilt == first
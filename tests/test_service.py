@@ -0,0 +1,104 @@
+import asyncio
+import json
+from datetime import date
+
+import pytest
+
+from saju_engine import manse_variant, report_variant
+from saju_engine.cache import report_cache
+from saju_engine.service import ChartBatcher, ChartService, RequestError, handle_connection
+
+
+async def _exchange(raw: bytes):
+    """서버를 임시 포트에 띄워 raw 요청 하나를 보내고 (상태 코드, JSON) 을 돌려준다."""
+    service = ChartService(ChartBatcher())
+    server = await asyncio.start_server(lambda r, w: handle_connection(service, r, w), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5", b"1.5"])
+def test_bad_content_length_is_400(length):
+    raw = b"POST /v1/chart HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n{}"
+    status, payload = asyncio.run(_exchange(raw))
+    assert status == 400
+    assert "Content-Length" in payload["error"]
+
+
+def test_chart_round_trip():
+    report_cache.clear()
+    body = json.dumps({"date": "1990-05-17", "hour": 14}).encode()
+    raw = (b"POST /v1/chart HTTP/1.1\r\nConnection: close\r\nContent-Length: "
+           + str(len(body)).encode() + b"\r\n\r\n" + body)
+    status, payload = asyncio.run(_exchange(raw))
+    assert status == 200
+    assert payload["solar_date"] == "1990-05-17"
+
+
+def test_concurrent_same_key_shares_one_batch():
+    report_cache.clear()
+    batcher = ChartBatcher(window=0.01)
+    service = ChartService(batcher)
+
+    async def run():
+        data = {"date": "2001-02-03", "hour": 5, "variant": "manse"}
+        return await asyncio.gather(*(service.chart(dict(data)) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert all(r == results[0] for r in results)
+    assert batcher.stats() == {"batches": 1, "batched_items": 1, "pending": 0, "running": 0}
+
+
+@pytest.mark.parametrize("variant", ["report", "manse"])
+def test_year_is_part_of_the_report_key(variant):
+    report_cache.clear()
+    service = ChartService(ChartBatcher(window=0.001))
+
+    async def run():
+        data = {"date": "1990-05-17", "hour": 14, "variant": variant}
+        return (await service.chart(dict(data)),
+                await service.chart(dict(data, year=2027)),
+                await service.chart(dict(data, year=2026)))
+
+    default, other, explicit = asyncio.run(run())
+    assert default == explicit
+    assert (default["year"], other["year"]) == (2026, 2027)
+    # 타고난 성향 섹션은 그대로, 마지막(연도 운세) 섹션만 연도를 따른다
+    assert default["sections"][0] == other["sections"][0]
+    assert default["sections"][-1]["text"] != other["sections"][-1]["text"]
+    assert "2027년" in other["sections"][-1]["title"]
+
+    # 앱 경로(cached_report)와 서비스가 같은 키로 캐시를 나눠 쓴다
+    module = report_variant if variant == "report" else manse_variant
+    hour = 14 if variant == "report" else 7
+    report = module.cached_report(date(1990, 5, 17), hour, 2027)
+    assert report.key[-1] == 2027
+    assert report.to_dict() == other
+
+
+@pytest.mark.parametrize("year", ["abc", 999, 2051])
+def test_bad_year_is_rejected(year):
+    service = ChartService(ChartBatcher())
+    with pytest.raises(RequestError):
+        asyncio.run(service.chart({"date": "1990-05-17", "year": year}))
+
+
+def test_oversized_request_line_is_414():
+    raw = b"GET /v1/chart?date=" + b"1" * 70_000 + b" HTTP/1.1\r\n\r\n"
+    status, payload = asyncio.run(_exchange(raw))
+    assert status == 414
+    assert "error" in payload
+
+
+def test_oversized_header_is_431():
+    raw = b"GET /health HTTP/1.1\r\nX-Long: " + b"a" * 70_000 + b"\r\n\r\n"
+    status, payload = asyncio.run(_exchange(raw))
+    assert status == 431
+    assert "error" in payload
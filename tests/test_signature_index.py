@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from saju_engine import manse_table, signature_index
+
+
+@pytest.fixture(scope="module")
+def index():
+    return signature_index.build_index()
+
+
+def test_round_trip(tmp_path, index):
+    path = str(tmp_path / "index.bin")
+    signature_index.save_index(index, path)
+    loaded = signature_index.read_index_file(path)
+    assert loaded is not None
+    assert np.array_equal(loaded, index)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("table_version", manse_table.FORMAT_VERSION + 1),
+    ("table_crc", 0),
+    ("version", signature_index.INDEX_VERSION + 1),
+])
+def test_stale_header_is_rejected(tmp_path, index, field, value):
+    path = tmp_path / "index.bin"
+    signature_index.save_index(index, str(path))
+    data = bytearray(path.read_bytes())
+    header = dict(zip(("magic", "version", "table_version", "table_crc", "rows", "cols"),
+                      signature_index.FILE_HEADER.unpack_from(data)))
+    header[field] = value
+    signature_index.FILE_HEADER.pack_into(data, 0, *header.values())
+    path.write_bytes(bytes(data))
+    assert signature_index.read_index_file(str(path)) is None
+
+
+def test_load_rebuilds_index_from_other_table(tmp_path, index, monkeypatch):
+    path = tmp_path / "index.bin"
+    signature_index.save_index(index, str(path))
+    # 다른 만세력 테이블에서 만든 색인처럼 보이게 한다
+    monkeypatch.setattr(manse_table, "table_checksum", lambda: 12345)
+    monkeypatch.setattr(signature_index, "_index", None)
+    loaded = signature_index.load_index(str(path))
+    assert np.array_equal(loaded, index)
+    head = signature_index.FILE_HEADER.unpack_from(path.read_bytes())
+    assert head[3] == 12345
+    monkeypatch.setattr(signature_index, "_index", None)